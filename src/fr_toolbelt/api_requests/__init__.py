@@ -2,26 +2,73 @@
 Making requests from the Federal Register API.
 """
 
+from .async_client import AsyncFederalRegisterClient
+from .cache import ResponseCache
+from .client import FederalRegisterClient, get_default_client
+from .decoders import DECODERS, benchmark_decoders, get_decoder
 from .get_documents import (
     BASE_URL,
     BASE_PARAMS,
     DEFAULT_FIELDS, 
     QueryError,
+    BatchQueryError,
+    IncompleteResultsError,
     InputFileError, 
+    count_documents_by_period, 
     get_documents_by_date, 
     get_documents_by_number, 
+    iter_documents_by_date, 
+    iter_documents_by_number, 
     parse_document_numbers, 
     _retrieve_results_by_next_page,
     _get_documents_by_batch,
 )
+from .retry import CircuitBreaker, CircuitOpenError, RateLimiter, RetryError, sleep_retry
+from .shards import ShardError, load_manifest, merge_shards, plan_shards, run_shard, save_manifest
+from .sync import SyncResult, SyncState, SyncStateError, sync_documents
+from .get_documents_async import (
+    count_documents_by_period_async, 
+    get_documents_by_date_async, 
+    get_documents_by_number_async, 
+)
 
 __all__ = [
     "BASE_URL",
     "BASE_PARAMS",
     "DEFAULT_FIELDS",
+    "FederalRegisterClient",
+    "get_default_client",
+    "AsyncFederalRegisterClient",
+    "ResponseCache",
+    "DECODERS",
+    "benchmark_decoders",
+    "get_decoder",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RateLimiter",
+    "RetryError",
+    "sleep_retry",
     "QueryError",
+    "BatchQueryError",
+    "IncompleteResultsError",
     "InputFileError",
+    "count_documents_by_period", 
     "get_documents_by_date", 
     "get_documents_by_number", 
+    "iter_documents_by_date", 
+    "iter_documents_by_number", 
     "parse_document_numbers", 
+    "ShardError",
+    "load_manifest",
+    "merge_shards",
+    "plan_shards",
+    "run_shard",
+    "save_manifest",
+    "SyncResult",
+    "SyncState",
+    "SyncStateError",
+    "sync_documents", 
+    "count_documents_by_period_async", 
+    "get_documents_by_date_async", 
+    "get_documents_by_number_async", 
     ]
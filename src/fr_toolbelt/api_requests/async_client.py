@@ -0,0 +1,128 @@
+"""
+Asynchronous HTTP client for making requests to the Federal Register API.
+
+Requires the optional `httpx` dependency (install with `pip install fr-toolbelt[async]`).
+"""
+
+import asyncio
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+from .client import DEFAULT_HEADERS
+from .decoders import Decoder, get_decoder
+from .retry import TRANSPORT_EXCEPTIONS, CircuitBreaker, RateLimiter
+
+
+class AsyncFederalRegisterClient:
+    """Asynchronous client for the Federal Register API that owns a pooled `httpx.AsyncClient`.
+
+    A semaphore bounds how many requests are in flight at once, so many windows and pages can be scheduled
+    from a single event loop without overwhelming the API or the connection pool.
+
+    Args:
+        max_concurrency (int, optional): Maximum number of requests in flight at the same time. Defaults to 10.
+        max_connections (int | None, optional): Maximum number of open connections. Defaults to None (same as `max_concurrency`).
+        max_keepalive_connections (int | None, optional): Maximum number of idle keep-alive connections. Defaults to None (same as `max_concurrency`).
+        headers (dict, optional): Default headers sent with every request. Defaults to constant DEFAULT_HEADERS.
+        timeout (float | None, optional): Timeout (seconds) for each request. Defaults to None (no timeout).
+        rate_limiter (RateLimiter | None, optional): Limits requests per second; can be shared with synchronous clients. Defaults to None (no limit).
+        decoder (str | Callable[[bytes], Any] | None, optional): JSON decoder for response bodies ("orjson", "msgspec", "json", or a function). Defaults to None (fastest decoder installed).
+        circuit_breaker (CircuitBreaker | None, optional): Rejects requests with `CircuitOpenError` while the API is failing; can be shared with synchronous clients. Defaults to None (no breaker).
+
+    Raises:
+        ImportError: Optional dependency `httpx` is not installed.
+    """
+    def __init__(
+            self,
+            max_concurrency: int = 10,
+            max_connections: int | None = None,
+            max_keepalive_connections: int | None = None,
+            headers: dict | None = None,
+            timeout: float | None = None,
+            rate_limiter: RateLimiter | None = None,
+            decoder: str | Decoder | None = None,
+            circuit_breaker: CircuitBreaker | None = None,
+        ) -> None:
+        if httpx is None:
+            raise ImportError("AsyncFederalRegisterClient requires `httpx`; install with `pip install fr-toolbelt[async]`.")
+        self.headers = DEFAULT_HEADERS.copy()
+        if headers is not None:
+            self.headers.update(headers)
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.decode = get_decoder(decoder)
+        self.circuit_breaker = circuit_breaker
+        limits = httpx.Limits(
+            max_connections=max_connections or max_concurrency,
+            max_keepalive_connections=max_keepalive_connections or max_concurrency,
+            )
+        self._client = httpx.AsyncClient(headers=self.headers, limits=limits, timeout=timeout, follow_redirects=True)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def get(self, url: str, params: dict | None = None, **kwargs) -> "httpx.Response":
+        """Send a GET request once a concurrency slot is available.
+
+        Args:
+            url (str): URL for the request.
+            params (dict, optional): Parameters to pass in GET request. Defaults to None.
+
+        Raises:
+            CircuitOpenError: Circuit breaker is open.
+
+        Returns:
+            httpx.Response: Response object from the `httpx` package.
+        """
+        async with self._semaphore:
+            probe = self.circuit_breaker.before_request() if self.circuit_breaker is not None else False
+            recorded = False
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                try:
+                    response = await self._client.get(url, params=params, **kwargs)
+                except TRANSPORT_EXCEPTIONS:
+                    if self.circuit_breaker is not None:
+                        self.circuit_breaker.record_failure()
+                        recorded = True
+                    raise
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_status(response.status_code)
+                    recorded = True
+            finally:
+                # cancelled (e.g., by `gather_or_cancel`) or invalid requests say nothing about the API, but must not hold on to the probe
+                if probe and not recorded:
+                    self.circuit_breaker.release_probe()
+            return response
+
+    def json(self, response: "httpx.Response"):
+        """Decode the JSON body of a response with the client's decoder.
+        """
+        return self.decode(response.content)
+
+    async def aclose(self) -> None:
+        """Close the underlying `httpx.AsyncClient` and release pooled connections.
+        """
+        await self._client.aclose()
+
+
+async def gather_or_cancel(*aws) -> list:
+    """Run awaitables concurrently and return their results in order.
+    If any awaitable fails (or the caller is cancelled), the others are cancelled before the exception propagates.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
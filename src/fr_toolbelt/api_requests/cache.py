@@ -0,0 +1,306 @@
+"""
+Persistent on-disk cache for Federal Register API responses.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import zlib
+from zoneinfo import ZoneInfo
+
+import requests
+
+
+ET = ZoneInfo("America/New_York")
+
+# headers stored alongside each cached response body
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified", )
+
+# validators that let an expired response be revalidated with a conditional request
+VALIDATOR_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+
+def normalize_url(url: str, params: dict | None = None) -> str:
+    """Normalize a URL and its query parameters so equivalent requests produce the same string.
+    Query parameters are merged into the URL and sorted by key; a trailing "?" is dropped.
+
+    Args:
+        url (str): URL for the request.
+        params (dict, optional): Parameters to pass in GET request. Defaults to None.
+
+    Returns:
+        str: Normalized URL.
+    """
+    prepared_url = requests.Request("GET", url, params=params).prepare().url
+    scheme, netloc, path, query, _ = urlsplit(prepared_url)
+    query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    return urlunsplit((scheme.lower(), netloc.lower(), path, query, ""))
+
+
+def cache_key(url: str, params: dict | None = None) -> str:
+    """Create a cache key from the normalized endpoint URL and parameters.
+    """
+    return hashlib.sha256(normalize_url(url, params).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Persistent cache of API responses stored in a SQLite database, keyed by the normalized URL and parameters.
+
+    Response bodies are compressed with zlib. Entries expire after a per-entry time-to-live (TTL), and the least recently used
+    entries are evicted once the total size of stored bodies exceeds `max_size`. SQLite's write-ahead log and locking make
+    the cache safe to share between threads and processes.
+
+    By default, queries whose publication date range ended more than `settled_after_days` ago are treated as immutable
+    and never expire, while all other responses expire after `ttl` seconds.
+
+    Args:
+        path (Path | str): Directory for storing the cache database.
+        max_size (int, optional): Maximum total size (bytes) of compressed response bodies. Defaults to 512 MiB.
+        ttl (float | None, optional): Seconds until responses for recent or open-ended queries expire. Defaults to 3600 (1 hour).
+        settled_after_days (int | None, optional): Days after which a date range is treated as immutable. Defaults to 30. Pass None to always use `ttl`.
+        ttl_func (Callable[[str], float | None], optional): Custom function returning the TTL for a normalized URL (None means no expiration). Defaults to None.
+        file_name (str, optional): File name of the cache database. Defaults to "fr_toolbelt_cache.sqlite".
+        max_stale (float | None, optional): Seconds to keep expired responses so they can be served while the API is unavailable 
+        (see `CircuitBreaker`). Pass None to keep them until evicted for size. Defaults to 0 (removed once expired).
+
+    Expired responses with an "ETag" or "Last-Modified" header are kept until evicted for size, so they can be revalidated
+    with a conditional request instead of downloaded again (see `conditional_headers` and `refresh`).
+    """
+    def __init__(
+            self,
+            path: Path | str,
+            max_size: int = 512 * 1024 ** 2,
+            ttl: float | None = 3600,
+            settled_after_days: int | None = 30,
+            ttl_func: Callable[[str], float | None] | None = None,
+            file_name: str = "fr_toolbelt_cache.sqlite",
+            max_stale: float | None = 0,
+        ) -> None:
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.path / file_name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.settled_after_days = settled_after_days
+        self.ttl_func = ttl_func
+        self.max_stale = max_stale
+        with self.__connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    headers TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    expires REAL,
+                    accessed REAL NOT NULL
+                )"""
+                )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed)")
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in autocommit mode and close it when finished.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def __len__(self) -> int:
+        with self.__connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Total size (bytes) of compressed response bodies in the cache.
+        """
+        with self.__connect() as conn:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def ttl_for(self, url: str) -> float | None:
+        """Return the time-to-live (seconds) for a normalized URL, or None if the response never expires.
+        """
+        if self.ttl_func is not None:
+            return self.ttl_func(url)
+        if self.settled_after_days is not None:
+            query = dict(parse_qsl(urlsplit(url).query))
+            end_date = query.get("conditions[publication_date][lte]")
+            today = datetime.now(tz=ET).date()
+            try:
+                if (end_date is not None) and (date.fromisoformat(end_date) < today - timedelta(days=self.settled_after_days)):
+                    return None
+            except ValueError:
+                pass
+        return self.ttl
+
+    def get(self, url: str, params: dict | None = None, stale: bool = False) -> tuple[bytes, dict] | None:
+        """Retrieve a cached response body and headers, or None if missing or expired.
+
+        Args:
+            url (str): URL for the request.
+            params (dict, optional): Parameters to pass in GET request. Defaults to None.
+            stale (bool, optional): Also return expired entries (e.g., while the API is unavailable). Defaults to False.
+
+        Returns:
+            tuple[bytes, dict] | None: Response body and headers.
+        """
+        key = cache_key(url, params)
+        now = time.time()
+        with self.__connect() as conn:
+            row = conn.execute("SELECT body, headers, expires FROM responses WHERE key = ?", (key, )).fetchone()
+            if row is None:
+                return None
+            body, headers, expires = row
+            if (expires is not None) and (expires <= now):
+                if (not stale) or ((self.max_stale is not None) and (expires + self.max_stale <= now)):
+                    return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return _decompress(body), json.loads(headers)
+
+    def set(
+            self,
+            url: str,
+            body: bytes,
+            params: dict | None = None,
+            headers: dict | None = None,
+            ttl: float | None = None
+        ) -> None:
+        """Store a response body and its headers, then evict least recently used entries if over the size limit.
+
+        Args:
+            url (str): URL for the request.
+            body (bytes): Response body.
+            params (dict, optional): Parameters to pass in GET request. Defaults to None.
+            headers (dict, optional): Response headers to store with the body. Defaults to None.
+            ttl (float | None, optional): Seconds until the entry expires. Defaults to None (uses `ttl_for`).
+        """
+        normalized = normalize_url(url, params)
+        key = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        if ttl is None:
+            ttl = self.ttl_for(normalized)
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        compressed = _compress(body)
+        with self.__connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, url, body, headers, size, created, expires, accessed) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, normalized, compressed, json.dumps(headers or {}), len(compressed), now, expires, now)
+                )
+        self.evict()
+
+    def get_expired(self, url: str, params: dict | None = None) -> tuple[bytes, dict] | None:
+        """Retrieve an expired response body and headers that can be revalidated, or None if missing, still fresh, or without validators.
+        """
+        key = cache_key(url, params)
+        with self.__connect() as conn:
+            row = conn.execute("SELECT body, headers, expires FROM responses WHERE key = ?", (key, )).fetchone()
+        if row is None:
+            return None
+        body, headers, expires = row
+        headers = json.loads(headers)
+        if (expires is None) or (expires > time.time()) or (len(conditional_headers(headers)) == 0):
+            return None
+        return _decompress(body), headers
+
+    def refresh(self, url: str, params: dict | None = None, headers: dict | None = None, ttl: float | None = None) -> None:
+        """Extend the expiration of a response that was revalidated (e.g., by a 304 Not Modified response), updating any new validators.
+
+        Args:
+            url (str): URL for the request.
+            params (dict, optional): Parameters to pass in GET request. Defaults to None.
+            headers (dict, optional): Headers of the revalidation response to store with the body. Defaults to None.
+            ttl (float | None, optional): Seconds until the entry expires. Defaults to None (uses `ttl_for`).
+        """
+        normalized = normalize_url(url, params)
+        key = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        if ttl is None:
+            ttl = self.ttl_for(normalized)
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        with self.__connect() as conn:
+            row = conn.execute("SELECT headers FROM responses WHERE key = ?", (key, )).fetchone()
+            if row is None:
+                return
+            stored = json.loads(row[0])
+            stored.update(headers or {})
+            conn.execute("UPDATE responses SET headers = ?, expires = ?, accessed = ? WHERE key = ?", (json.dumps(stored), expires, now, key))
+
+    def delete(self, url: str, params: dict | None = None) -> None:
+        """Remove a cached response.
+        """
+        with self.__connect() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (cache_key(url, params), ))
+
+    def evict(self) -> int:
+        """Remove expired entries (after `max_stale`, unless they can be revalidated), then the least recently used entries until the cache is under `max_size`.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        removed = 0
+        with self.__connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self.max_stale is not None:
+                    removed += conn.execute(
+                        """DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ? 
+                        AND headers NOT LIKE '%"ETag"%' AND headers NOT LIKE '%"Last-Modified"%'""", 
+                        (time.time() - self.max_stale, )
+                        ).rowcount
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+                if total > self.max_size:
+                    for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed ASC").fetchall():
+                        if total <= self.max_size:
+                            break
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key, ))
+                        total -= size
+                        removed += 1
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry from the cache.
+        """
+        with self.__connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+def _compress(body: bytes) -> bytes:
+    return zlib.compress(body, 6)
+
+
+def _decompress(body: bytes) -> bytes:
+    return zlib.decompress(body)
+
+
+def conditional_headers(headers: dict) -> dict:
+    """Request headers for revalidating a cached response from its stored validators (e.g., "If-None-Match" from "ETag").
+    """
+    return {request_header: headers[header] for header, request_header in VALIDATOR_HEADERS.items() if header in headers}
+
+
+def cached_response(url: str, body: bytes, headers: dict) -> requests.Response:
+    """Create a `requests.Response` from a cached body and headers.
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.url = url
+    response._content = body
+    response.headers.update(headers)
+    response.encoding = "utf-8"
+    response.from_cache = True
+    return response
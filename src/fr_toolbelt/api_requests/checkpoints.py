@@ -0,0 +1,74 @@
+"""
+Checkpointing completed date windows so interrupted harvests can resume.
+"""
+
+from datetime import date
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+def _query_id(dict_params: dict) -> str:
+    """Identify a query by its parameters, ignoring pagination.
+    """
+    params = {k: (list(v) if isinstance(v, (list, tuple)) else v) for k, v in dict_params.items() if k not in ("page", )}
+    return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def _write_json_atomic(obj, path: Path) -> None:
+    """Write an object to JSON so the file is either complete or absent, even if the process dies mid-write.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(obj, f)
+    os.replace(tmp_path, path)
+
+
+class WindowCheckpoint:
+    """Records the planned date windows of a query and the documents of each completed window in a checkpoint directory.
+
+    Each query (identified by its parameters) gets its own subdirectory, so one checkpoint directory can hold several harvests.
+    A restarted harvest reuses the saved plan and only fetches windows without a saved result.
+
+    Args:
+        path (Path | str): Checkpoint directory.
+        dict_params (dict): Parameters of the query being checkpointed.
+    """
+    def __init__(self, path: Path | str, dict_params: dict) -> None:
+        self.path = Path(path).expanduser() / _query_id(dict_params)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def __window_path(self, window: tuple) -> Path:
+        return self.path / f"window_{window[0]}_{window[1]}.json"
+
+    def load_plan(self) -> list[tuple[date, date, int]] | None:
+        """Load the saved date windows, or None if no plan has been saved.
+        """
+        plan_path = self.path / "plan.json"
+        if not plan_path.exists():
+            return None
+        with open(plan_path, "r", encoding="utf-8") as f:
+            plan = json.load(f)
+        return [(date.fromisoformat(gte), date.fromisoformat(lte), count) for gte, lte, count in plan]
+
+    def save_plan(self, windows: list[tuple[date, date, int]]) -> None:
+        """Save the planned date windows.
+        """
+        _write_json_atomic([(f"{gte}", f"{lte}", count) for gte, lte, count in windows], self.path / "plan.json")
+
+    def completed(self, window: tuple) -> bool:
+        """Whether documents for the window have been saved.
+        """
+        return self.__window_path(window).exists()
+
+    def load(self, window: tuple) -> list[dict]:
+        """Load the saved documents for a completed window.
+        """
+        with open(self.__window_path(window), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, window: tuple, results: list[dict]) -> None:
+        """Save the documents of a completed window.
+        """
+        _write_json_atomic(results, self.__window_path(window))
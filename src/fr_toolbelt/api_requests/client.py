@@ -0,0 +1,202 @@
+"""
+Pooled HTTP client for making requests to the Federal Register API.
+"""
+
+import threading
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import CACHED_HEADERS, ResponseCache, cached_response, conditional_headers, normalize_url
+from .coalesce import SingleFlight
+from .decoders import Decoder, get_decoder
+from .retry import TRANSPORT_EXCEPTIONS, CircuitBreaker, CircuitOpenError, RateLimiter
+
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "fr-toolbelt (https://github.com/mfebrizio/fr-toolbelt)",
+    }
+
+
+class FederalRegisterClient:
+    """Reusable client for the Federal Register API that owns a pooled, keep-alive `requests.Session`.
+
+    Connections are pooled by a single `HTTPAdapter` shared by every thread,
+    so the client can be passed to concurrent callers without reopening TCP/TLS connections for each request.
+    Each thread receives its own `requests.Session` (sessions are not guaranteed to be thread-safe) mounted on the shared adapter.
+
+    Args:
+        pool_connections (int, optional): Number of connection pools (i.e., hosts) to cache. Defaults to 10.
+        pool_maxsize (int, optional): Maximum number of connections to keep alive in each pool; 
+        set it to at least the number of concurrent requests (e.g., `max_workers` × `page_workers`). Defaults to 10.
+        pool_block (bool, optional): Block when no free connections are available instead of opening a new one. Defaults to False.
+        headers (dict, optional): Default headers sent with every request. Defaults to constant DEFAULT_HEADERS.
+        timeout (float | tuple[float, float] | None, optional): Connect and read timeout (seconds) for each request. Defaults to None (no timeout).
+        cache (ResponseCache | None, optional): Persistent cache for successful responses. Defaults to None (no caching).
+        rate_limiter (RateLimiter | None, optional): Limits requests per second; share one limiter to pace several clients together. Defaults to None (no limit).
+        decoder (str | Callable[[bytes], Any] | None, optional): JSON decoder for response bodies ("orjson", "msgspec", "json", or a function). Defaults to None (fastest decoder installed).
+        circuit_breaker (CircuitBreaker | None, optional): Rejects requests while the API is failing; while it is open, 
+        requests are served from `cache` when possible (even if expired), otherwise `CircuitOpenError` is raised. Defaults to None (no breaker).
+        coalesce (bool, optional): Share one request among threads requesting the same URL at the same time, and one query among identical concurrent calls 
+        to `get_documents_by_date` or `get_documents_by_number`. Defaults to False.
+    """
+    def __init__(
+            self,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            headers: dict | None = None,
+            timeout: float | tuple[float, float] | None = None,
+            cache: ResponseCache | None = None,
+            rate_limiter: RateLimiter | None = None,
+            decoder: str | Decoder | None = None,
+            circuit_breaker: CircuitBreaker | None = None,
+            coalesce: bool = False,
+        ) -> None:
+        self.headers = DEFAULT_HEADERS.copy()
+        if headers is not None:
+            self.headers.update(headers)
+        self.timeout = timeout
+        self.decode = get_decoder(decoder)
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.coalesce = coalesce
+        self._in_flight = SingleFlight()
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            )
+        self._local = threading.local()
+        # sessions of finished threads are released with their thread-local storage, so long-running services do not accumulate them
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __create_session(self) -> requests.Session:
+        """Create a session for the current thread that uses the shared connection pool.
+        """
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        with self._lock:
+            self._sessions.add(session)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """`requests.Session` bound to the calling thread.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self.__create_session()
+            self._local.session = session
+        return session
+
+    def get(self, url: str, params: dict | None = None, **kwargs) -> requests.Response:
+        """Send a GET request through the pooled session, serving it from the cache when possible.
+        Expired cached responses with an "ETag" or "Last-Modified" header are revalidated with a conditional request,
+        and a 304 Not Modified response is served from the cache.
+        When `coalesce` is True, threads requesting the same URL at the same time share one request and receive the same response.
+
+        Args:
+            url (str): URL for the request.
+            params (dict, optional): Parameters to pass in GET request. Defaults to None.
+
+        Raises:
+            CircuitOpenError: Circuit breaker is open and no cached response is available.
+
+        Returns:
+            requests.Response: Response object from the `requests` package.
+        """
+        if self.coalesce and not kwargs.get("stream", False):
+            return self._in_flight.do(normalize_url(url, params), lambda: self.__get(url, params, **kwargs))
+        return self.__get(url, params, **kwargs)
+
+    def __get(self, url: str, params: dict | None = None, **kwargs) -> requests.Response:
+        use_cache = (self.cache is not None) and not kwargs.get("stream", False)
+        expired = None
+        if use_cache:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                return cached_response(normalize_url(url, params), *cached)
+            expired = self.cache.get_expired(url, params)
+        
+        probe = False
+        if self.circuit_breaker is not None:
+            try:
+                probe = self.circuit_breaker.before_request()
+            except CircuitOpenError:
+                stale = self.cache.get(url, params, stale=True) if use_cache else None
+                if stale is not None:
+                    return cached_response(normalize_url(url, params), *stale)
+                raise
+        
+        recorded = False
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            kwargs.setdefault("timeout", self.timeout)
+            if expired is not None:
+                kwargs["headers"] = {**conditional_headers(expired[1]), **(kwargs.get("headers") or {})}
+            try:
+                response = self.session.get(url, params=params, **kwargs)
+            except TRANSPORT_EXCEPTIONS:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+                    recorded = True
+                raise
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_status(response.status_code)
+                recorded = True
+        finally:
+            # interrupted requests and invalid requests say nothing about the API, but must not hold on to the probe
+            if probe and not recorded:
+                self.circuit_breaker.release_probe()
+        if use_cache and (response.status_code == 200):
+            headers = {k: response.headers[k] for k in CACHED_HEADERS if k in response.headers}
+            self.cache.set(url, response.content, params=params, headers=headers)
+        elif (expired is not None) and (response.status_code == 304):
+            headers = {k: response.headers[k] for k in CACHED_HEADERS if k in response.headers}
+            self.cache.refresh(url, params, headers=headers)
+            body, stored = expired
+            return cached_response(normalize_url(url, params), body, {**stored, **headers})
+        return response
+
+    def json(self, response: requests.Response):
+        """Decode the JSON body of a response with the client's decoder.
+        """
+        return self.decode(response.content)
+
+    def close(self) -> None:
+        """Close every session created by the client and release pooled connections.
+        """
+        with self._lock:
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+        for session in sessions:
+            session.close()
+        self._adapter.close()
+        self._local = threading.local()
+
+
+_DEFAULT_CLIENT: FederalRegisterClient | None = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def get_default_client() -> FederalRegisterClient:
+    """Return the module-level client shared by calls that do not pass their own client.
+    """
+    global _DEFAULT_CLIENT
+    with _DEFAULT_CLIENT_LOCK:
+        if _DEFAULT_CLIENT is None:
+            _DEFAULT_CLIENT = FederalRegisterClient()
+        return _DEFAULT_CLIENT
@@ -0,0 +1,83 @@
+"""
+Coalescing identical requests that are in flight at the same time.
+"""
+
+from collections.abc import Callable, Hashable
+import threading
+from typing import Any
+
+
+class _Call:
+    """A call in flight and the callers waiting for its result.
+    """
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.exception: BaseException | None = None
+
+
+class SingleFlight:
+    """Share one execution of a function among concurrent callers with the same key.
+
+    The first caller for a key runs the function; callers arriving with the same key before it finishes wait and receive its result
+    (or its exception) instead of running the function again. Once the call finishes, the next caller with that key starts a new call.
+
+    Args:
+        copy (Callable[[Any], Any], optional): Applied to the result for each waiting caller, so callers can modify their results independently.
+        The caller that ran the function receives the original. Defaults to None (every caller receives the same object).
+    """
+    def __init__(self, copy: Callable[[Any], Any] | None = None) -> None:
+        self.copy = copy
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Run `function`, or wait for the call already running with the same key and return its result.
+
+        Args:
+            key (Hashable): Identifies equivalent calls (e.g., a normalized URL).
+            function (Callable[[], Any]): Function to run when no equivalent call is in flight.
+
+        Returns:
+            Any: Result of the function.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                call.waiters += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.exception is not None:
+                raise call.exception
+            return self.copy(call.result) if self.copy is not None else call.result
+
+        try:
+            result = function()
+        except BaseException as err:
+            with self._lock:
+                del self._calls[key]
+            call.exception = err
+            call.done.set()
+            raise
+
+        # no caller can join once the key is removed, so the number of waiters is final
+        with self._lock:
+            del self._calls[key]
+            waiters = call.waiters
+        if waiters > 0:
+            # copy before returning, so the waiters' results are unaffected by changes the leader makes
+            call.result = self.copy(result) if self.copy is not None else result
+        call.done.set()
+        return result
+
+    def in_flight(self) -> int:
+        """Number of calls currently running.
+        """
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,89 @@
+"""
+Pluggable JSON decoders for Federal Register API responses.
+
+Uses the optional `orjson` or `msgspec` packages when installed (install with `pip install fr-toolbelt[fast]`),
+falling back to the standard library `json` module.
+"""
+
+from collections.abc import Callable
+import json
+import time
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional dependency
+    msgspec = None
+
+
+Decoder = Callable[[bytes], Any]
+
+
+def _json_loads(body: bytes) -> Any:
+    return json.loads(body)
+
+
+_MSGSPEC_DECODER = msgspec.json.Decoder() if msgspec is not None else None
+
+
+def _msgspec_loads(body: bytes) -> Any:
+    # raise the same error as the other decoders so malformed responses are retried
+    try:
+        return _MSGSPEC_DECODER.decode(body)
+    except msgspec.DecodeError as err:
+        raise json.JSONDecodeError(f"{err}", "", 0) from err
+
+
+# available decoders in order of preference (`orjson.JSONDecodeError` subclasses `json.JSONDecodeError`)
+DECODERS: dict[str, Decoder] = {}
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+if msgspec is not None:
+    DECODERS["msgspec"] = _msgspec_loads
+DECODERS["json"] = _json_loads
+
+
+def get_decoder(decoder: str | Decoder | None = None) -> Decoder:
+    """Return a function that decodes a JSON response body.
+
+    Args:
+        decoder (str | Callable[[bytes], Any] | None, optional): Name of a decoder in DECODERS ("orjson", "msgspec", or "json"),
+            or a custom function accepting the response body. Defaults to None (fastest decoder installed).
+
+    Raises:
+        ValueError: Decoder is not installed or not recognized.
+
+    Returns:
+        Callable[[bytes], Any]: Function decoding bytes to Python objects.
+    """
+    if decoder is None:
+        return next(iter(DECODERS.values()))
+    elif callable(decoder):
+        return decoder
+    elif decoder in DECODERS:
+        return DECODERS[decoder]
+    raise ValueError(f"Decoder '{decoder}' is not installed or not recognized. Available decoders: {tuple(DECODERS)}.")
+
+
+def benchmark_decoders(body: bytes, number: int = 20) -> dict[str, float]:
+    """Measure how many pages per second each installed decoder can decode.
+
+    Args:
+        body (bytes): Response body of a representative page (e.g., 1,000 documents).
+        number (int, optional): Number of times to decode the page with each decoder. Defaults to 20.
+
+    Returns:
+        dict[str, float]: Pages decoded per second, keyed by decoder name.
+    """
+    rates = {}
+    for name, decode in DECODERS.items():
+        start = time.perf_counter()
+        for _ in range(number):
+            decode(body)
+        rates[name] = number / (time.perf_counter() - start)
+    return rates
@@ -1,33 +1,22 @@
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
 import csv
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from pathlib import Path
 import re
-import time
+from urllib.parse import quote
 from zoneinfo import ZoneInfo
 
-from platform import python_version_tuple
-if int(python_version_tuple()[1]) >= 12:
-    from itertools import batched
-else:
-    from itertools import islice
-
-
-    def batched(iterable, n, *, strict=False):
-        """From itertools [batched recipe](https://docs.python.org/3.13/library/itertools.html#itertools.batched).
-        Usage: batched('ABCDEFG', 3) → ABC DEF G
-        """
-        if n < 1:
-            raise ValueError('n must be at least one')
-        iterator = iter(iterable)
-        while batch := tuple(islice(iterator, n)):
-            if strict and len(batch) != n:
-                raise ValueError('batched(): incomplete batch')
-            yield batch
-
-
 import requests
 
+from .checkpoints import WindowCheckpoint, _query_id
+from .client import FederalRegisterClient, get_default_client
+from .coalesce import SingleFlight
+from .retry import RETRY_STATUS_CODES, HTTP414Error, RetryError, sleep_retry
+from .streaming import STREAM_CHUNK_SIZE, iter_page_results
+from .windows import merge_windows, plan_date_windows, plan_windows_from_counts, split_likely
 from ..utils.duplicates import process_duplicates
 from ..utils.format_dates import DateFormatter
 
@@ -42,6 +31,8 @@ BASE_PARAMS = {
     "order": "oldest"
     }
 BASE_URL = r"https://www.federalregister.gov/api/v1/documents.json?"
+FACETS_URL = r"https://www.federalregister.gov/api/v1/documents/facets/{}"
+FACET_PERIODS = ("daily", "weekly", "monthly")
 DEFAULT_FIELDS = (
     "document_number", 
     "citation", 
@@ -61,6 +52,15 @@ DEFAULT_FIELDS = (
     "json_url",
     "html_url", 
     )
+# thin fields for enumerating a date range before retrieving only unknown documents
+ENUMERATION_FIELDS = (
+    "document_number", 
+    "publication_date", 
+    "json_url", 
+    )
+
+DOCUMENT_NUMBERS_URL = r"https://www.federalregister.gov/api/v1/documents/{}.json?"
+MAX_URL_BYTES = 4000  # stay under common request URL limits (HTTP 414 URI Too Long)
 
 ET = ZoneInfo("America/New_York")  #tz.gettz("EST")
 TODAY_ET = datetime.now(tz=ET).date()
@@ -69,6 +69,18 @@ TODAY_ET = datetime.now(tz=ET).date()
 # -- functions for handling API requests -- #
 
 
+# identical queries in flight at the same time share one retrieval; each waiting caller receives its own copy of the results
+_QUERIES_IN_FLIGHT = SingleFlight(copy=deepcopy)
+
+
+def _coalesce_query(key: tuple, function, client: FederalRegisterClient | None = None):
+    """Run a query, sharing it with identical concurrent queries when the client has `coalesce` enabled.
+    """
+    if (client or get_default_client()).coalesce:
+        return _QUERIES_IN_FLIGHT.do(key, function)
+    return function()
+
+
 class QueryError(Exception):
     pass
 
@@ -77,79 +89,158 @@ class InputFileError(Exception):
     pass
 
 
-class HTTP414Error(requests.HTTPError):
-    """Request produced a HTTP error for 414 URI Too Long."""
+class BatchQueryError(QueryError):
+    """One or more batches of document numbers failed after every batch was attempted.
 
+    Args:
+        results (list): Documents retrieved by the batches that succeeded, in the requested order.
+        count (int): Count of documents retrieved by the batches that succeeded.
+        failures (dict[tuple, Exception]): Exception raised by each failed batch of document numbers.
+    """
+    def __init__(self, message: str, results: list, count: int, failures: dict[tuple, Exception]) -> None:
+        super().__init__(message)
+        self.results = results
+        self.count = count
+        self.failures = failures
 
-def sleep_retry(timeout: int, retry: int = 3):
-    """Decorator to sleep and retry request when receiving an error 
-    (source: [RealPython](https://realpython.com/python-sleep/#adding-a-python-sleep-call-with-decorators)).
+
+class IncompleteResultsError(QueryError):
+    """Some days or windows of a query are still missing documents after they were fetched again.
 
     Args:
-        timeout (int): Number of seconds to sleep after error.
-        retry (int, optional): Number of times to retry. Defaults to 3.
-    """    
-    def retry_decorator(function):
-        def wrapper(*args, **kwargs):
-            retries = 0
-            while retries < retry:
-                try:
-                    value = function(*args, **kwargs)
-                    if value is not None:
-                        return value
-                    else:
-                        raise QueryError
-                except (requests.HTTPError, requests.JSONDecodeError, ):
-                    #print(f'Sleeping for {timeout} seconds')
-                    time.sleep(timeout)
-                    retries += 1
-        return wrapper
-    return retry_decorator
-
-
-def _ensure_json_response(response: requests.Response):
+        results (list): Documents retrieved, including those from the incomplete windows.
+        count (int): Count of documents retrieved.
+        windows (list[tuple[date, date, int, int]]): Start date, end date (inclusive), expected count, and retrieved count of each incomplete window. 
+        The dates are None when the query has no date range.
+    """
+    def __init__(self, message: str, results: list, count: int, windows: list[tuple[date, date, int, int]]) -> None:
+        super().__init__(message)
+        self.results = results
+        self.count = count
+        self.windows = windows
+
+
+def _ensure_json_response(response: requests.Response, client: FederalRegisterClient | None = None):
     """Ensure request response is valid JSON by checking for 200 status code. 
-    Returns JSON response or empty dictionary.
+    Returns JSON response (decoded with the client's decoder) or empty dictionary; raises `HTTPError` for temporary failures that are worth retrying.
     """
     if response.status_code == 200:
-        res_json = response.json()
+        res_json = (client or get_default_client()).json(response)
+    elif response.status_code in RETRY_STATUS_CODES:
+        response.raise_for_status()
     else:
         res_json = {}
     return res_json
 
 
-@sleep_retry(60)
-def _retrieve_results_by_page_range(num_pages: int, endpoint_url: str, dict_params: dict) -> list:
-    """Retrieve documents by looping over a given number of pages.
+@sleep_retry()
+def _request_json(
+        endpoint_url: str, 
+        dict_params: dict | None = None, 
+        client: FederalRegisterClient | None = None
+    ) -> dict:
+    """Send a single GET request and return its JSON, retrying temporary failures with backoff.
+
+    Raises:
+        HTTP414Error: Request URL is too long.
+        HTTPError: Request failed with a status code that is not retried.
+
+    Returns:
+        dict: JSON response.
+    """
+    if client is None:
+        client = get_default_client()
+    response = client.get(endpoint_url, params=dict_params)
+    if response.status_code == 414:
+        raise HTTP414Error(response=response)
+    elif response.status_code in RETRY_STATUS_CODES:
+        response.raise_for_status()
+    return client.json(response)
+
+
+@sleep_retry()
+def _request_page(
+        endpoint_url: str, 
+        dict_params: dict | None = None, 
+        client: FederalRegisterClient | None = None
+    ) -> dict:
+    """Request a single page of results, retrying only this request when it fails temporarily.
+    Returns JSON response or empty dictionary (see `_ensure_json_response`).
+    """
+    if client is None:
+        client = get_default_client()
+    return _ensure_json_response(client.get(endpoint_url, params=dict_params), client)
+
+
+def _retrieve_results_by_page_range(
+        num_pages: int | None, 
+        endpoint_url: str, 
+        dict_params: dict, 
+        client: FederalRegisterClient | None = None, 
+        max_workers: int = 1, 
+        first_response: dict | None = None
+    ) -> list:
+    """Retrieve documents by requesting pages by number, optionally fetching pages concurrently on a thread pool.
+    The first page is used to learn "total_pages" (or reused when passed as `first_response`), 
+    then pages 2 through N are requested by page number and reassembled in page order.
 
     Args:
-        num_pages (int): Number of pages to retrieve documents from.
+        num_pages (int | None): Number of pages to retrieve documents from. Pass None to use "total_pages" from the first page.
         endpoint_url (str): URL for API endpoint.
         dict_params (dict): Paramters to pass in GET request.
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+        max_workers (int, optional): Number of pages to fetch at the same time. Defaults to 1 (sequential).
+        first_response (dict, optional): Parsed JSON of page 1 when it has already been requested. Defaults to None.
+
+    Raises:
+        QueryError: Failed to retrieve documents from all pages.
 
     Returns:
         list: Documents retrieved from the API.
     """
-    results, tally = [], 0
-    for page in range(1, num_pages + 1):  # grab results from each page
-        dict_params.update({"page": page})
-        response = requests.get(endpoint_url, params=dict_params)
-        response = _ensure_json_response(response)
-        results_this_page = response.get("results", [])
-        results.extend(results_this_page)
-        tally += len(results_this_page)
-    count = response.json()["count"]
-    print(count, tally)
-    return results, count
+    if client is None:
+        client = get_default_client()
+    
+    def retrieve_page(page: int) -> dict:
+        dict_params_page = dict_params.copy()
+        dict_params_page.update({"page": page})
+        return _request_page(endpoint_url, dict_params_page, client=client)
+    
+    if first_response is None:
+        first_response = retrieve_page(1)
+    if num_pages is None:
+        num_pages = first_response.get("total_pages", 1)
+    
+    remaining_pages = range(2, num_pages + 1)
+    if max_workers > 1 and len(remaining_pages) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = [first_response] + list(executor.map(retrieve_page, remaining_pages))
+    else:
+        responses = [first_response] + [retrieve_page(page) for page in remaining_pages]
+    
+    # raise exception if failed to access all pages
+    if not all("results" in response for response in responses if response.get("count", 1) > 0):
+        raise QueryError(f"Failed to retrieve documents from {num_pages} pages.")
+    
+    results = []
+    for response in responses:  # grab results from each page
+        results.extend(response.get("results", []))
+    return results
 
 
-@sleep_retry(60)
-def _retrieve_results_by_next_page(endpoint_url: str, dict_params: dict) -> list:
+def _retrieve_results_by_next_page(
+        endpoint_url: str, 
+        dict_params: dict, 
+        client: FederalRegisterClient | None = None, 
+        first_response: dict | None = None
+    ) -> list:
     """Retrieve documents by accessing "next_page_url" returned by each request.
 
     Args:
         endpoint_url (str): url for documents.{format} endpoint.
         dict_params (dict): Paramters to pass in GET request.
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+        first_response (dict, optional): Parsed JSON of page 1 when it has already been requested. Defaults to None.
 
     Raises:
         QueryError: Failed to retrieve documents from all pages.
@@ -157,9 +248,10 @@ def _retrieve_results_by_next_page(endpoint_url: str, dict_params: dict) -> list
     Returns:
         list: Documents retrieved from the API.
     """
+    if client is None:
+        client = get_default_client()
     results = []
-    response = requests.get(endpoint_url, params=dict_params)
-    response = _ensure_json_response(response)
+    response = first_response if first_response is not None else _request_page(endpoint_url, dict_params, client=client)
     pages = response.get("total_pages", 1)
     next_page_url = response.get("next_page_url")
     counter = 0
@@ -167,7 +259,7 @@ def _retrieve_results_by_next_page(endpoint_url: str, dict_params: dict) -> list
         counter += 1
         results_this_page = response.get("results", [])
         results.extend(results_this_page)
-        response = requests.get(next_page_url).json()
+        response = _request_page(next_page_url, client=client)
         next_page_url = response.get("next_page_url")
     else:
         counter += 1
@@ -181,10 +273,254 @@ def _retrieve_results_by_next_page(endpoint_url: str, dict_params: dict) -> list
     return results
 
 
+def _retrieve_results_by_pages(
+        endpoint_url: str, 
+        dict_params: dict, 
+        client: FederalRegisterClient | None = None, 
+        page_workers: int = 1, 
+        first_response: dict | None = None
+    ) -> list:
+    """Retrieve all pages of a query, either by following "next_page_url" or, when `page_workers` > 1, by requesting page numbers concurrently.
+    Pass `first_response` to reuse an already requested page 1 instead of requesting it again.
+    """
+    if page_workers > 1:
+        return _retrieve_results_by_page_range(None, endpoint_url, dict_params, client=client, max_workers=page_workers, first_response=first_response)
+    else:
+        return _retrieve_results_by_next_page(endpoint_url, dict_params, client=client, first_response=first_response)
+
+
+@sleep_retry()
+def _count_documents(
+        endpoint_url: str, 
+        dict_params: dict, 
+        start_date: date, 
+        end_date: date, 
+        client: FederalRegisterClient | None = None
+    ) -> int:
+    """Probe the number of documents published in a date window by requesting a single result.
+
+    Args:
+        endpoint_url (str): URL for API endpoint.
+        dict_params (dict): Paramters to pass in GET request.
+        start_date (date): Start of window (inclusive).
+        end_date (date): End of window (inclusive).
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+
+    Returns:
+        int: Number of documents matching the query in the window.
+    """
+    if client is None:
+        client = get_default_client()
+    dict_params_probe = dict_params.copy()
+    dict_params_probe.update({
+        "per_page": 1, 
+        "page": 1, 
+        "fields[]": ["document_number"], 
+        "conditions[publication_date][gte]": f"{start_date}", 
+        "conditions[publication_date][lte]": f"{end_date}", 
+        })
+    response = client.get(endpoint_url, params=dict_params_probe)
+    response.raise_for_status()
+    return client.json(response)["count"]
+
+
+def _split_likely(dict_params: dict) -> bool:
+    """Whether the date range of a query is long enough that it will probably be split into windows.
+    Only unfiltered queries are guessed from their date range; a filter (e.g., document types or agencies) usually keeps a long range
+    under 10,000 documents, so its first request is kept as page 1 instead of being a count-only probe.
+    """
+    start_date = dict_params.get("conditions[publication_date][gte]")
+    if start_date is None:
+        return False
+    if any(k.startswith("conditions[") and not k.startswith("conditions[publication_date]") for k in dict_params):
+        return False
+    return split_likely(start_date, dict_params.get("conditions[publication_date][lte]", f"{TODAY_ET}"))
+
+
+def _plan_windows(
+        endpoint_url: str, 
+        dict_params: dict, 
+        start_date: date, 
+        end_date: date, 
+        client: FederalRegisterClient | None = None, 
+        count: int | None = None, 
+        max_documents_threshold: int = 10000
+    ) -> list[tuple[date, date, int]]:
+    """Plan date windows under 10,000 documents (or `max_documents_threshold`) from daily counts in a single facets request.
+    Falls back to bisecting the date range with count probes when the facets are unavailable or do not add up to `count`.
+    """
+    try:
+        daily_counts = count_documents_by_period(start_date, end_date, dict_params=dict_params, endpoint_url=endpoint_url, client=client)
+    except (QueryError, RetryError, requests.RequestException):
+        daily_counts = None
+    
+    if (daily_counts is not None) and ((count is None) or (sum(daily_counts.values()) == count)):
+        return plan_windows_from_counts(daily_counts, start_date, end_date, max_documents=max_documents_threshold)
+    return plan_date_windows(
+        start_date, 
+        end_date, 
+        lambda gte, lte: _count_documents(endpoint_url, dict_params, gte, lte, client=client), 
+        max_documents=max_documents_threshold, 
+        count=count, 
+        )
+
+
+def _retrieve_results_by_window(
+        endpoint_url: str, 
+        dict_params: dict, 
+        windows: list[tuple[date, date, int]], 
+        max_workers: int = 1, 
+        client: FederalRegisterClient | None = None, 
+        message: str = "Documents retrieved", 
+        page_workers: int = 1, 
+        checkpoint: WindowCheckpoint | None = None
+    ) -> list:
+    """Retrieve documents for each date window, optionally fetching windows concurrently on a thread pool.
+    Results are returned in the order of the input windows regardless of when each window finishes.
+
+    Args:
+        endpoint_url (str): URL for API endpoint.
+        dict_params (dict): Paramters to pass in GET request.
+        windows (list[tuple[date, date, int]]): Start date, end date (inclusive), and expected count of each window.
+        max_workers (int, optional): Number of windows to fetch at the same time. 
+        Up to `max_workers` × `page_workers` requests share the client's connection pool. Defaults to 1 (sequential).
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+        message (str, optional): Message for the progress bar, which counts documents against the expected total of the windows. Defaults to "Documents retrieved".
+        page_workers (int, optional): Number of pages to fetch concurrently within each window. Defaults to 1 (follow "next_page_url").
+        checkpoint (WindowCheckpoint, optional): Saves documents of each window that returned its expected count and loads windows completed by a previous run. Defaults to None.
+
+    Returns:
+        list: Documents retrieved from the API.
+    """
+    def retrieve_window(window: tuple[date, date, int]) -> list:
+        if (checkpoint is not None) and checkpoint.completed(window):
+            return checkpoint.load(window)
+        
+        # update parameters by window
+        dict_params_window = deepcopy(dict_params)
+        dict_params_window.update({
+            "conditions[publication_date][gte]": f"{window[0]}", 
+            "conditions[publication_date][lte]": f"{window[1]}"
+            })
+        results_window = _retrieve_results_by_pages(endpoint_url, dict_params_window, client=client, page_workers=page_workers)
+        # a short window is left for the next run (and the backfill) rather than recorded as completed
+        if (checkpoint is not None) and (len(results_window) == window[2]):
+            checkpoint.save(window, results_window)
+        return results_window
+    
+    results = []
+    with Bar(message, max=sum(window[2] for window in windows)) as bar:
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(retrieve_window, window) for window in windows]
+                try:
+                    for future in as_completed(futures):
+                        bar.next(len(future.result()))  # surface exceptions as soon as any window fails
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+            for future in futures:
+                results.extend(future.result())
+        else:
+            for window in windows:
+                results_window = retrieve_window(window)
+                results.extend(results_window)
+                bar.next(len(results_window))
+    return results
+
+
+def _incomplete_days(by_day: dict[date, list], daily_counts: dict[date, int]) -> list[tuple[date, date, int]]:
+    """Windows of consecutive days whose retrieved documents do not match the expected daily counts.
+    """
+    days = sorted(day for day in (set(by_day) | set(daily_counts)) if len(by_day.get(day, [])) != daily_counts.get(day, 0))
+    return merge_windows([(day, day, daily_counts.get(day, 0)) for day in days])
+
+
+def _backfill_gaps(
+        endpoint_url: str, 
+        dict_params: dict, 
+        results: list, 
+        response_count: int, 
+        client: FederalRegisterClient | None = None, 
+        page_workers: int = 1
+    ) -> list:
+    """Compare retrieved documents against the expected count of each day and fetch again only the days that came back short (or long).
+
+    Args:
+        endpoint_url (str): URL for API endpoint.
+        dict_params (dict): Paramters to pass in GET request.
+        results (list): Documents retrieved by the query.
+        response_count (int): Number of documents the query should return.
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+        page_workers (int, optional): Number of pages to fetch concurrently within each window. Defaults to 1 (follow "next_page_url").
+
+    Raises:
+        IncompleteResultsError: Some windows are still incomplete after fetching them again, or the daily counts are unavailable. 
+        A query without a date range (e.g., a batch of document numbers) is reported as a single window without dates.
+
+    Returns:
+        list: Complete documents in order of publication.
+    """
+    if dict_params.get("conditions[publication_date][gte]") is None:
+        raise IncompleteResultsError(
+            f"Failed to retrieve all {response_count} documents.", 
+            results, 
+            len(results), 
+            [(None, None, response_count, len(results))], 
+            )
+    start_date = DateFormatter(dict_params.get("conditions[publication_date][gte]")).formatted_date
+    end_date = DateFormatter(dict_params.get("conditions[publication_date][lte]", f"{TODAY_ET}")).formatted_date
+    
+    # without daily counts or publication dates, only the query as a whole can be reported
+    try:
+        daily_counts = count_documents_by_period(start_date, end_date, dict_params=dict_params, endpoint_url=endpoint_url, client=client)
+    except (QueryError, RetryError, requests.RequestException):
+        daily_counts = None
+    if (daily_counts is None) or any(doc.get("publication_date") is None for doc in results):
+        raise IncompleteResultsError(
+            f"Failed to retrieve all {response_count} documents.", 
+            results, 
+            len(results), 
+            [(start_date, end_date, response_count, len(results))], 
+            )
+
+    by_day = {}
+    for doc in results:
+        by_day.setdefault(date.fromisoformat(doc["publication_date"]), []).append(doc)
+    
+    # fetch the incomplete days again, replacing what was retrieved for them
+    for gte, lte, _ in _incomplete_days(by_day, daily_counts):
+        dict_params_window = deepcopy(dict_params)
+        dict_params_window.update({
+            "conditions[publication_date][gte]": f"{gte}", 
+            "conditions[publication_date][lte]": f"{lte}"
+            })
+        for n in range((lte - gte).days + 1):
+            by_day.pop(gte + timedelta(days=n), None)
+        for doc in _retrieve_results_by_pages(endpoint_url, dict_params_window, client=client, page_workers=page_workers):
+            by_day.setdefault(date.fromisoformat(doc["publication_date"]), []).append(doc)
+    
+    results = [doc for day in sorted(by_day) for doc in by_day[day]]
+    incomplete = _incomplete_days(by_day, daily_counts)
+    if len(incomplete) > 0:
+        windows = [
+            (gte, lte, expected, sum(len(by_day.get(gte + timedelta(days=n), [])) for n in range((lte - gte).days + 1))) 
+            for gte, lte, expected in incomplete
+            ]
+        report = "; ".join(f"{gte} to {lte} ({retrieved} of {expected})" for gte, lte, expected, retrieved in windows)
+        raise IncompleteResultsError(f"Failed to retrieve all documents for {len(windows)} windows: {report}.", results, len(results), windows)
+    return results
+
+
 def _query_documents_endpoint(
         endpoint_url: str, 
         dict_params: dict, 
         handle_duplicates: bool | str = False, 
+        client: FederalRegisterClient | None = None, 
+        max_workers: int = 1, 
+        page_workers: int = 1, 
+        checkpoint_dir: Path | str | None = None, 
         **kwargs
     ) -> tuple[list, int]:
     """GET request for documents endpoint.
@@ -192,20 +528,36 @@ def _query_documents_endpoint(
     Args:
         endpoint_url (str): URL for API endpoint.
         dict_params (dict): Paramters to pass in GET request.
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+        max_workers (int, optional): Number of date windows to fetch concurrently when a query exceeds 10,000 documents. 
+        Size the client's `pool_maxsize` to at least `max_workers` × `page_workers`. Defaults to 1 (sequential).
+        page_workers (int, optional): Number of pages to fetch concurrently by page number. Defaults to 1 (follow "next_page_url").
+        checkpoint_dir (Path | str, optional): Directory for recording completed date windows so an interrupted query can resume. Defaults to None.
+
+    Raises:
+        IncompleteResultsError: Some days are still missing documents after the days that came back incomplete were fetched again.
 
     Returns:
         tuple[list, int]: Tuple of API results, count of documents retrieved.
     """    
+    if client is None:
+        client = get_default_client()
     results, running_count = [], 0
-    response = requests.get(endpoint_url, params=dict_params)
-    if response.status_code != 200:
-        #print(response.status_code)
-        if response.status_code == 414:
-            raise HTTP414Error
-    #print(response.url)
-    res_json = response.json()
     max_documents_threshold = 10000
-    response_count = res_json["count"]
+    
+    # probe only the count when the query will probably be split; otherwise keep the response as page 1
+    if _split_likely(dict_params):
+        first_response = None
+        response_count = _count_documents(
+            endpoint_url, 
+            dict_params, 
+            dict_params.get("conditions[publication_date][gte]"), 
+            dict_params.get("conditions[publication_date][lte]", f"{TODAY_ET}"), 
+            client=client, 
+            )
+    else:
+        first_response = _request_json(endpoint_url, dict_params, client=client)
+        response_count = first_response["count"]
     
     # handles queries returning no documents
     if response_count == 0:
@@ -221,56 +573,49 @@ def _query_documents_endpoint(
         if start_date is None:
             raise QueryError("Missing `start_date` parameter from query.")
         
-        # set range of years
-        start_year = start_date.year
-        end_year = end_date.year
-        years = range(start_year, end_year + 1)
+        # reuse windows planned by an interrupted run of the same query
+        checkpoint = WindowCheckpoint(checkpoint_dir, dict_params) if checkpoint_dir is not None else None
+        windows = checkpoint.load_plan() if checkpoint is not None else None
         
-        # format: YYYY-MM-DD
-        quarters = ("Q1", "Q2", "Q3", "Q4")
+        # split date range into windows under the maximum using daily counts
+        if windows is None:
+            windows = _plan_windows(
+                endpoint_url, 
+                dict_params, 
+                start_date.formatted_date, 
+                end_date.formatted_date, 
+                client=client, 
+                count=response_count, 
+                )
+            if checkpoint is not None:
+                checkpoint.save_plan(windows)
         
         # retrieve documents
-        dict_params_qrt = deepcopy(dict_params)
-
-        with Bar(kwargs.get("message", "Years retrieved"), max=len(years)) as bar:
-            for year in years:
-                for quarter in quarters:
-                    
-                    # set start and end dates based on input date
-                    gte = start_date.date_in_quarter(year, quarter, return_quarter_end=False)
-                    lte = end_date.date_in_quarter(year, quarter)
-                    if start_date.greater_than_date(lte):
-                        # skip quarters where start_date is later than last day of quarter
-                        continue
-                    elif end_date.less_than_date(gte):
-                        # skip quarters where end_date is ealier than first day of quarter
-                        break
-                    
-                    # update parameters by quarter
-                    dict_params_qrt.update({
-                        "conditions[publication_date][gte]": f"{gte}", 
-                        "conditions[publication_date][lte]": f"{lte}"
-                                            })
-                    
-                    # get documents
-                    results_qrt = _retrieve_results_by_next_page(endpoint_url, dict_params_qrt)
-                    results.extend(results_qrt)
-                    running_count += len(results_qrt)
-                bar.next()
+        results = _retrieve_results_by_window(
+            endpoint_url, 
+            dict_params, 
+            windows, 
+            max_workers=max_workers, 
+            client=client, 
+            message=kwargs.get("message", "Documents retrieved"), 
+            page_workers=page_workers, 
+            checkpoint=checkpoint, 
+            )
+        running_count += len(results)
                 
     # handles normal queries
     elif response_count in range(max_documents_threshold + 1):
-        running_count += response_count
-        results.extend(_retrieve_results_by_next_page(endpoint_url, dict_params))
+        results.extend(_retrieve_results_by_pages(endpoint_url, dict_params, client=client, page_workers=page_workers, first_response=first_response))
+        running_count += len(results)
     
     # otherwise something went wrong
     else:
         raise QueryError(f"Query returned document count of {response_count}.")
     
+    # fetch again only the days that came back incomplete
     if running_count != response_count:
-        #print(running_count)
-        #print(results[-1])
-        raise QueryError(f"Failed to retrieve all {response_count} documents.")
+        results = _backfill_gaps(endpoint_url, dict_params, results, response_count, client=client, page_workers=page_workers)
+        running_count = len(results)
     
     if not handle_duplicates:
         pass
@@ -279,9 +624,109 @@ def _query_documents_endpoint(
     return results, running_count
 
 
+# -- count documents using facets -- #
+
+
+def facets_url(endpoint_url: str = BASE_URL, period: str = "daily") -> str:
+    """Return the facets URL matching a documents endpoint URL (e.g., ".../documents.json?" -> ".../documents/facets/daily").
+    """
+    if period not in FACET_PERIODS:
+        raise ValueError(f"Inappropriate argument value {period} for parameter 'period'. Must be one of {FACET_PERIODS}.")
+    base_url, sep, _ = endpoint_url.partition("documents.json")
+    if not sep:
+        return FACETS_URL.format(period)
+    return f"{base_url}documents/facets/{period}"
+
+
+def _facet_params(
+        start_date: str | date, 
+        end_date: str | date | None, 
+        document_types: tuple | list | None, 
+        dict_params: dict | None
+    ) -> dict:
+    """Create parameters for a facets request, keeping only the query conditions of `dict_params`.
+    """
+    if end_date is None:
+        end_date = TODAY_ET
+    params = {k: v for k, v in (dict_params or {}).items() if k.startswith("conditions[")}
+    params.update({
+        "conditions[publication_date][gte]": f"{start_date}", 
+        "conditions[publication_date][lte]": f"{end_date}", 
+        })
+    if document_types is not None:
+        params.update({"conditions[type][]": list(document_types)})
+    return params
+
+
+def _parse_facets(res_json: dict) -> dict[date, int]:
+    """Convert a facets response into document counts keyed by date, in chronological order.
+    """
+    try:
+        counts = {date.fromisoformat(k): v["count"] for k, v in res_json.items()}
+    except (AttributeError, KeyError, TypeError, ValueError) as err:
+        raise QueryError(f"Unexpected response from facets endpoint: {err!r}") from err
+    return dict(sorted(counts.items()))
+
+
+def count_documents_by_period(
+        start_date: str | date, 
+        end_date: str | date | None = None, 
+        period: str = "daily", 
+        document_types: tuple | list | None = None, 
+        dict_params: dict | None = None, 
+        endpoint_url: str = BASE_URL, 
+        client: FederalRegisterClient | None = None
+    ) -> dict[date, int]:
+    """Count documents published in each day, week, or month of a date range with a single request to the facets endpoint.
+
+    Args:
+        start_date (str | date): Start of date range (inclusive).
+        end_date (str | date, optional): End of date range (inclusive). Defaults to None (today).
+        period (str, optional): Length of each period ("daily", "weekly", or "monthly"). Defaults to "daily".
+        document_types (tuple | list, optional): Count only these document types (e.g., "RULE"). Defaults to None (all types).
+        dict_params (dict, optional): Other query parameters; only "conditions[...]" parameters are used. Defaults to None.
+        endpoint_url (str, optional): URL of the documents endpoint the facets belong to. Defaults to constant BASE_URL.
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+
+    Raises:
+        QueryError: Facets endpoint returned an unexpected response.
+
+    Returns:
+        dict[date, int]: Count of documents keyed by the first day of each period, in chronological order. Periods without documents may be missing.
+    """
+    params = _facet_params(start_date, end_date, document_types, dict_params)
+    return _parse_facets(_request_json(facets_url(endpoint_url, period), params, client=client))
+
+
 # -- retrieve documents using date range -- #
 
 
+def _date_range_params(
+        start_date: str | date, 
+        end_date: str | date | None, 
+        document_types: tuple | list | None, 
+        fields: tuple[str] | list[str], 
+        dict_params: dict
+    ) -> dict:
+    """Create parameters for querying documents published in a date range.
+    """
+    # Not passing end_date implies end date of today EST
+    if end_date is None:
+        end_date = TODAY_ET
+
+    # update dictionary of parameters
+    params = dict_params.copy()
+    params.update({
+        "conditions[publication_date][gte]": f"{start_date}", 
+        "conditions[publication_date][lte]": f"{end_date}", 
+        "fields[]": fields, 
+        })
+    
+    if document_types is not None:
+        params.update({"conditions[type][]": list(document_types)})
+    return params
+
+
 def get_documents_by_date(start_date: str | date, 
                           end_date: str | date | None = None, 
                           document_types: tuple | list = None,
@@ -289,6 +734,11 @@ def get_documents_by_date(start_date: str | date,
                           endpoint_url: str = BASE_URL, 
                           dict_params: dict = BASE_PARAMS, 
                           handle_duplicates: bool | str = False, 
+                          client: FederalRegisterClient | None = None, 
+                          max_workers: int = 1, 
+                          page_workers: int = 1, 
+                          checkpoint_dir: Path | str | None = None, 
+                          known_document_numbers: set | list | tuple | None = None, 
                           **kwargs
                           ):
     """Retrieve Federal Register documents using a date range.
@@ -300,99 +750,441 @@ def get_documents_by_date(start_date: str | date,
         Valid types are "RULE" (final rules), "PRORULE" (proposed rules), "NOTICE" (notices), and "PRESDOCU" (presidential documents). Defaults to None.
         fields (tuple | list, optional): Fields/columns to retrieve. Defaults to constant DEFAULT_FIELDS.
         endpoint_url (str, optional): Endpoint url. Defaults to r"https://www.federalregister.gov/api/v1/documents.json?".
+        client (FederalRegisterClient, optional): Client for sending requests; pass one client to share pooled connections across calls. Defaults to None (uses shared default client).
+        max_workers (int, optional): Number of date windows to fetch concurrently when the range exceeds 10,000 documents. 
+        Up to `max_workers` × `page_workers` requests are in flight at once, so pass a `client` whose `pool_maxsize` is at least that many 
+        (the default client keeps 10 connections; extra connections are discarded after each request). Defaults to 1 (sequential).
+        page_workers (int, optional): Number of pages to fetch concurrently within each query or window, using page numbers instead of "next_page_url". 
+        Counts toward the connections needed with `max_workers`. Defaults to 1 (sequential).
+        checkpoint_dir (Path | str, optional): Directory for recording each completed date window and its documents. 
+        Rerunning the same query with the same directory only fetches windows that were not completed. Defaults to None.
+        known_document_numbers (set | list | tuple, optional): Document numbers already stored by the caller. If passed, the range is first enumerated 
+        with only ENUMERATION_FIELDS, and only documents not in `known_document_numbers` are retrieved with `fields` through `get_documents_by_number`. 
+        `endpoint_url` applies only to the enumeration; the unknown documents are always requested from the documents-by-number endpoint (DOCUMENT_NUMBERS_URL). 
+        Defaults to None.
+
+    Raises:
+        IncompleteResultsError: Some days are still missing documents after fetching them again; 
+        the documents retrieved and the incomplete windows are available on the exception.
+        BatchQueryError: One or more batches of unknown documents failed (only when `known_document_numbers` is passed).
 
     Returns:
-        tuple[list, int]: Tuple of API results, count of documents retrieved.
+        tuple[list, int]: Tuple of API results, count of documents retrieved (when `known_document_numbers` is passed, only the unknown documents).
     """
-    # Not passing end_date implies end date of today EST
-    if end_date is None:
-        end_date = TODAY_ET
+    if known_document_numbers is not None:
+        enumerated, _ = get_documents_by_date(
+            start_date, 
+            end_date, 
+            document_types=document_types, 
+            fields=ENUMERATION_FIELDS, 
+            endpoint_url=endpoint_url, 
+            dict_params=dict_params, 
+            handle_duplicates=handle_duplicates, 
+            client=client, 
+            max_workers=max_workers, 
+            page_workers=page_workers, 
+            checkpoint_dir=checkpoint_dir, 
+            **kwargs
+            )
+        known = set(known_document_numbers)
+        unknown = [doc["document_number"] for doc in enumerated if doc["document_number"] not in known]
+        if len(unknown) == 0:
+            return [], 0
+        # keep the date order of the enumeration
+        results, count = get_documents_by_number(unknown, fields=fields, sort_data=False, client=client, max_workers=max_workers)
+        if handle_duplicates:
+            results = process_duplicates(results, how=handle_duplicates, keys=("document_number", "citation"))
+        return results, count
 
-    # update dictionary of parameters
-    params = dict_params.copy()
-    params.update({
-        "conditions[publication_date][gte]": f"{start_date}", 
-        "conditions[publication_date][lte]": f"{end_date}", 
-        "fields[]": fields, 
-        })
-    
-    if document_types is not None:
-        params.update({"conditions[type][]": list(document_types)})
-    
-    results, count = _query_documents_endpoint(
-        endpoint_url, 
-        params, 
-        handle_duplicates=handle_duplicates, 
-        **kwargs
+    params = _date_range_params(start_date, end_date, document_types, fields, dict_params)
+    results, count = _coalesce_query(
+        ("date", endpoint_url, _query_id(params), f"{handle_duplicates}"), 
+        lambda: _query_documents_endpoint(
+            endpoint_url, 
+            params, 
+            handle_duplicates=handle_duplicates, 
+            client=client, 
+            max_workers=max_workers, 
+            page_workers=page_workers, 
+            checkpoint_dir=checkpoint_dir, 
+            **kwargs
+            ), 
+        client=client, 
         )
     return results, count
 
 
+def _page_results(response: dict, page: int) -> list[dict]:
+    """Results of a page, raising instead of treating a failed page (an empty response from `_ensure_json_response`) as a page without documents.
+    """
+    if ("results" not in response) and (response.get("count", 1) > 0):
+        raise QueryError(f"Failed to retrieve documents from page {page}.")
+    return response.get("results", [])
+
+
+def _iter_pages_by_next_page(
+        endpoint_url: str, 
+        dict_params: dict, 
+        client: FederalRegisterClient | None = None, 
+        first_response: dict | None = None
+    ) -> Iterator[list[dict]]:
+    """Yield the results from each page as it arrives by following "next_page_url".
+    Pass `first_response` to reuse an already requested page 1 instead of requesting it again.
+
+    Raises:
+        QueryError: Failed to retrieve documents from all pages, or a page failed with a status code that is not retried.
+    """
+    if client is None:
+        client = get_default_client()
+    response = first_response if first_response is not None else _request_page(endpoint_url, dict_params, client=client)
+    pages = response.get("total_pages", 1)
+    counter = 1
+    yield _page_results(response, counter)
+    while (next_page_url := response.get("next_page_url")) is not None:
+        counter += 1
+        response = _request_page(next_page_url, client=client)
+        yield _page_results(response, counter)
+    
+    # raise exception if failed to access all pages
+    if counter != pages:
+        raise QueryError(f"Failed to retrieve documents from {pages} pages.")
+
+
+@sleep_retry()
+def _request_stream(
+        endpoint_url: str, 
+        dict_params: dict | None = None, 
+        client: FederalRegisterClient | None = None
+    ) -> requests.Response:
+    """Open a streamed response without reading its body, retrying temporary failures before any documents are parsed.
+    """
+    if client is None:
+        client = get_default_client()
+    response = client.get(endpoint_url, params=dict_params, stream=True)
+    if response.status_code in RETRY_STATUS_CODES:
+        response.close()
+        response.raise_for_status()
+    return response
+
+
+def _iter_documents_by_next_page_stream(
+        endpoint_url: str, 
+        dict_params: dict, 
+        client: FederalRegisterClient | None = None
+    ) -> Iterator[dict]:
+    """Yield documents one at a time by parsing each page incrementally from the response stream and following "next_page_url".
+    Memory use per request is bounded by the size of a single document rather than a whole page.
+
+    Raises:
+        QueryError: Failed to retrieve documents from all pages, or a page failed with a status code that is not retried.
+    """
+    if client is None:
+        client = get_default_client()
+    next_page_url, params = endpoint_url, dict_params
+    pages, counter = 1, 0
+    while next_page_url is not None:
+        page = {}
+        with _request_stream(next_page_url, params, client=client) as response:
+            if response.status_code != 200:
+                raise QueryError(f"Failed to retrieve documents from page {counter + 1} (status code {response.status_code}).")
+            yield from iter_page_results(response.iter_content(chunk_size=STREAM_CHUNK_SIZE), page)
+        counter += 1
+        if counter == 1:
+            pages = page.get("total_pages", 1)
+        next_page_url, params = page.get("next_page_url"), None
+    
+    # raise exception if failed to access all pages
+    if counter != pages:
+        raise QueryError(f"Failed to retrieve documents from {pages} pages.")
+
+
+def _iter_documents_endpoint(
+        endpoint_url: str, 
+        dict_params: dict, 
+        client: FederalRegisterClient | None = None, 
+        stream: bool = False
+    ) -> Iterator[dict]:
+    """Yield documents from the documents endpoint one page at a time, splitting the query into date windows when it exceeds 10,000 documents.
+    With `stream`, each page is parsed incrementally and documents are yielded one at a time as they are received.
+
+    Raises:
+        QueryError: Failed to retrieve all documents.
+    """
+    if client is None:
+        client = get_default_client()
+    max_documents_threshold = 10000
+    
+    # probe only the count when the query will probably be split or pages are streamed; otherwise keep the response as page 1
+    if stream or _split_likely(dict_params):
+        first_response = None
+        response_count = _count_documents(
+            endpoint_url, 
+            dict_params, 
+            dict_params.get("conditions[publication_date][gte]"), 
+            dict_params.get("conditions[publication_date][lte]", f"{TODAY_ET}"), 
+            client=client, 
+            )
+    else:
+        first_response = _request_json(endpoint_url, dict_params, client=client)
+        response_count = first_response["count"]
+    
+    if response_count > max_documents_threshold:
+        windows = _plan_windows(
+            endpoint_url, 
+            dict_params, 
+            DateFormatter(dict_params.get("conditions[publication_date][gte]")).formatted_date, 
+            DateFormatter(dict_params.get("conditions[publication_date][lte]", f"{TODAY_ET}")).formatted_date, 
+            client=client, 
+            count=response_count, 
+            )
+    else:
+        windows = [(dict_params.get("conditions[publication_date][gte]"), dict_params.get("conditions[publication_date][lte]"), response_count)]
+    
+    running_count = 0
+    for window in windows:
+        dict_params_window = deepcopy(dict_params)
+        dict_params_window.update({
+            "conditions[publication_date][gte]": f"{window[0]}", 
+            "conditions[publication_date][lte]": f"{window[1]}"
+            })
+        if stream:
+            for document in _iter_documents_by_next_page_stream(endpoint_url, dict_params_window, client=client):
+                running_count += 1
+                yield document
+            continue
+        if len(windows) > 1:
+            first_response = None
+        for results_this_page in _iter_pages_by_next_page(endpoint_url, dict_params_window, client=client, first_response=first_response):
+            running_count += len(results_this_page)
+            yield from results_this_page
+    
+    if running_count != response_count:
+        raise QueryError(f"Failed to retrieve all {response_count} documents.")
+
+
+def iter_documents_by_date(start_date: str | date, 
+                           end_date: str | date | None = None, 
+                           document_types: tuple | list = None,
+                           fields: tuple[str] | list[str] = DEFAULT_FIELDS,
+                           endpoint_url: str = BASE_URL, 
+                           dict_params: dict = BASE_PARAMS, 
+                           client: FederalRegisterClient | None = None, 
+                           stream: bool = False
+                           ) -> Iterator[dict]:
+    """Iterate over Federal Register documents published in a date range, yielding each page of documents as it arrives.
+    Only one page of results is held in memory at a time, or only one document when `stream` is True.
+
+    Args:
+        start_date (str): Start date when documents were published (inclusive; format must be "yyyy-mm-dd").
+        end_date (str, optional): End date (inclusive; format must be "yyyy-mm-dd"). Defaults to None (implies end date is today for EST timezone).
+        document_types (tuple[str] | list[str], optional): If passed, only return specific document types. 
+        Valid types are "RULE" (final rules), "PRORULE" (proposed rules), "NOTICE" (notices), and "PRESDOCU" (presidential documents). Defaults to None.
+        fields (tuple | list, optional): Fields/columns to retrieve. Defaults to constant DEFAULT_FIELDS.
+        endpoint_url (str, optional): Endpoint url. Defaults to r"https://www.federalregister.gov/api/v1/documents.json?".
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+        stream (bool, optional): Parse each page incrementally from the response stream and yield documents as they are received. Defaults to False.
+
+    Raises:
+        QueryError: Failed to retrieve all documents (raised after the retrieved documents are yielded).
+
+    Yields:
+        dict: Documents retrieved from the API in order of publication.
+    """
+    params = _date_range_params(start_date, end_date, document_types, fields, dict_params)
+    yield from _iter_documents_endpoint(endpoint_url, params, client=client, stream=stream)
+
+
 # -- retrieve documents using input file -- #
 
 
-def _get_documents_by_batch(batch_size: int, document_numbers: list, fields: tuple | list = DEFAULT_FIELDS):
-    num_batches = (len(document_numbers) // batch_size) + 1
-    # print(num_batches)
-    batches = batched(document_numbers, n=batch_size)
-    results, count = [], 0
-    # counter = 0
-    for batch in batches:
-        # counter += 1
-        # print(f'{counter=}')
-        # print(f'batch_len: {len(batch)}')
-        batch_str = ",".join(batch)
-        endpoint_url = fr"https://www.federalregister.gov/api/v1/documents/{batch_str}.json?"
-        dict_params = {"fields[]": fields}
-        batch_results, batch_count = _query_documents_endpoint(endpoint_url, dict_params)
-        # print(len(batch_results))
-        results.extend(batch_results)
-        # print(len(results))
-        count += batch_count
+def _document_numbers_url(document_numbers: tuple | list) -> str:
+    """URL for requesting a batch of documents by their comma-separated document numbers.
+    """
+    return DOCUMENT_NUMBERS_URL.format(",".join(document_numbers))
+
+
+def pack_document_numbers(
+        document_numbers: list, 
+        fields: tuple | list = DEFAULT_FIELDS, 
+        max_url_bytes: int = MAX_URL_BYTES, 
+        max_batch_size: int | None = None
+    ) -> list[tuple[str, ...]]:
+    """Pack document numbers into batches whose request URLs (including the "fields[]" parameters) fit within a byte budget.
+    A document number that does not fit within the budget on its own is placed in a batch by itself.
+
+    Args:
+        document_numbers (list): Document numbers to pack, in the order they should be requested.
+        fields (tuple, optional): Fields/columns to retrieve. Defaults to constant DEFAULT_FIELDS.
+        max_url_bytes (int, optional): Maximum length (bytes) of each encoded request URL. Defaults to constant MAX_URL_BYTES.
+        max_batch_size (int | None, optional): Maximum number of document numbers in each batch. Defaults to None (no limit).
+
+    Returns:
+        list[tuple[str, ...]]: Batches of document numbers.
+    """
+    base_bytes = len(requests.Request("GET", _document_numbers_url(()), params={"fields[]": fields}).prepare().url)
+    batches, batch, batch_bytes = [], [], base_bytes
+    for number in document_numbers:
+        number_bytes = len(quote(number)) + (1 if batch else 0)  # comma separator
+        if batch and ((batch_bytes + number_bytes > max_url_bytes) or (len(batch) == max_batch_size)):
+            batches.append(tuple(batch))
+            batch, batch_bytes, number_bytes = [], base_bytes, len(quote(number))
+        batch.append(number)
+        batch_bytes += number_bytes
+    if batch:
+        batches.append(tuple(batch))
+    return batches
+
+
+def _sort_by_requested_order(results: list[dict], document_numbers: list) -> list[dict]:
+    """Sort documents to match the order of the requested document numbers (unmatched documents go last).
+    """
+    order = {number: idx for idx, number in enumerate(document_numbers)}
+    return sorted(results, key=lambda doc: order.get(doc.get("document_number"), len(order)))
+
+
+def _get_documents_by_batch(
+        batch_size: int, 
+        document_numbers: list, 
+        fields: tuple | list = DEFAULT_FIELDS, 
+        client: FederalRegisterClient | None = None, 
+        max_url_bytes: int = MAX_URL_BYTES, 
+        max_workers: int = 1
+    ):
+    """Retrieve documents in batches of document numbers packed to fit within the URL byte budget, optionally fetching batches concurrently on a thread pool.
+    A batch rejected with HTTP 414 (URI Too Long) is split in half and requested again without repeating the other batches.
+    Results are returned in the order of the requested document numbers.
+
+    Raises:
+        BatchQueryError: One or more batches failed; raised once every batch has been attempted.
+    """
+    dict_params = {"fields[]": fields}
+    
+    def retrieve_batch(batch: tuple) -> tuple[list, int]:
+        pending = deque([batch])
+        results_batch, count_batch = [], 0
+        while pending:
+            batch = pending.popleft()
+            try:
+                batch_results, batch_count = _query_documents_endpoint(_document_numbers_url(batch), dict_params, client=client)
+            except HTTP414Error:
+                if len(batch) == 1:
+                    raise
+                middle = len(batch) // 2
+                pending.extendleft((batch[middle:], batch[:middle]))
+                continue
+            results_batch.extend(batch_results)
+            count_batch += batch_count
+        return results_batch, count_batch
+    
+    batches = pack_document_numbers(document_numbers, fields=fields, max_url_bytes=max_url_bytes, max_batch_size=batch_size)
+    results, count, failures = [], 0, {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(retrieve_batch, batch) for batch in batches]
+        for batch, future in zip(batches, futures):
+            try:
+                batch_results, batch_count = future.result()
+            except Exception as err:
+                failures[batch] = err
+                continue
+            results.extend(batch_results)
+            count += batch_count
+    
+    if "document_number" in fields:
+        results = _sort_by_requested_order(results, document_numbers)
+    if failures:
+        raise BatchQueryError(
+            f"Failed to retrieve {len(failures)} of {len(batches)} batches of document numbers.", 
+            results, 
+            count, 
+            failures
+            )
     return results, count
 
 
 def get_documents_by_number(document_numbers: list, 
                             fields: tuple | list = DEFAULT_FIELDS, 
-                            sort_data: bool = True
+                            sort_data: bool = True, 
+                            client: FederalRegisterClient | None = None, 
+                            max_url_bytes: int = MAX_URL_BYTES, 
+                            max_workers: int = 1
                             ):
     """Retrieve Federal Register documents using a list of document numbers.
+    Duplicate document numbers are dropped, and the rest are requested in batches packed to fit within a URL byte budget.
+    Documents are returned in the order of the requested document numbers (sorted when `sort_data` is True).
 
     Args:
         document_numbers (list): Documents to retrieve based on "document_number" field.
         fields (tuple, optional): Fields/columns to retrieve. Defaults to constant DEFAULT_FIELDS.
         sort_data (bool, optional): Sort documents by "document_number". Defaults to True.
+        client (FederalRegisterClient, optional): Client for sending requests; pass one client to share pooled connections across calls. Defaults to None (uses shared default client).
+        max_url_bytes (int, optional): Maximum length (bytes) of each request URL. Defaults to constant MAX_URL_BYTES.
+        max_workers (int, optional): Number of batches to fetch concurrently; keep it within the client's `pool_maxsize` (10 for the default client). Defaults to 1 (sequential).
+
+    Raises:
+        BatchQueryError: One or more batches failed. The documents from successful batches are available on the exception.
 
     Returns:
         tuple[list, int]: Tuple of API results, count of documents retrieved.
     """
+    document_numbers = list(dict.fromkeys(document_numbers))
     if sort_data:
         document_numbers = sorted(document_numbers)
 
-    max_documents_threshold = 10000
-    if len(document_numbers) > max_documents_threshold:
-        batch_size = 250  # bug with API if higher batch size is used
-        while True:
-            try:
-                #print(f"Trying {batch_size=}")
-                results, count = _get_documents_by_batch(
-                    batch_size=batch_size, 
-                    document_numbers=document_numbers, 
-                    fields=fields,
-                    )
-                break
-            except HTTP414Error as err:
-                batch_size -= 1
-                continue
-    else:
-        document_numbers_str = ",".join(document_numbers)
-        endpoint_url = fr"https://www.federalregister.gov/api/v1/documents/{document_numbers_str}.json?"
-        dict_params = {"fields[]": fields}
-        results, count = _query_documents_endpoint(endpoint_url, dict_params)
-
+    batch_size = 250  # bug with API if higher batch size is used
+    results, count = _coalesce_query(
+        ("number", DOCUMENT_NUMBERS_URL, tuple(document_numbers), tuple(fields)), 
+        lambda: _get_documents_by_batch(
+            batch_size=batch_size, 
+            document_numbers=document_numbers, 
+            fields=fields,
+            client=client, 
+            max_url_bytes=max_url_bytes, 
+            max_workers=max_workers, 
+            ), 
+        client=client, 
+        )
     return results, count
 
 
+def iter_documents_by_number(document_numbers: list, 
+                             fields: tuple | list = DEFAULT_FIELDS, 
+                             sort_data: bool = True, 
+                             batch_size: int = 250, 
+                             client: FederalRegisterClient | None = None, 
+                             max_url_bytes: int = MAX_URL_BYTES, 
+                             stream: bool = False
+                             ) -> Iterator[dict]:
+    """Iterate over Federal Register documents using a list of document numbers, yielding each batch of documents as it arrives.
+    Duplicate document numbers are dropped.
+
+    Args:
+        document_numbers (list): Documents to retrieve based on "document_number" field.
+        fields (tuple, optional): Fields/columns to retrieve. Defaults to constant DEFAULT_FIELDS.
+        sort_data (bool, optional): Sort documents by "document_number". Defaults to True.
+        batch_size (int, optional): Maximum number of documents requested at a time. Defaults to 250.
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+        max_url_bytes (int, optional): Maximum length (bytes) of each request URL. Defaults to constant MAX_URL_BYTES.
+        stream (bool, optional): Parse each page incrementally from the response stream and yield documents as they are received. Defaults to False.
+
+    Raises:
+        QueryError: A batch failed to retrieve all of its pages (raised after the documents of earlier batches are yielded).
+
+    Yields:
+        dict: Documents retrieved from the API.
+    """
+    document_numbers = list(dict.fromkeys(document_numbers))
+    if sort_data:
+        document_numbers = sorted(document_numbers)
+    
+    dict_params = {"fields[]": fields}
+    for batch in pack_document_numbers(document_numbers, fields=fields, max_url_bytes=max_url_bytes, max_batch_size=batch_size):
+        if stream:
+            yield from _iter_documents_by_next_page_stream(_document_numbers_url(batch), dict_params, client=client)
+            continue
+        for results_this_page in _iter_pages_by_next_page(_document_numbers_url(batch), dict_params, client=client):
+            yield from results_this_page
+
+
 def _read_csv(path_to_file, pattern: str = r"(?:[a-z]\d-)?[\w|\d]{2,4}-[\d]{5,}", alt_column: str = "html_url", **kwargs):
     """Read document numbers from a CSV file, based on document_numbers column or alternative column with a regex pattern.
     """
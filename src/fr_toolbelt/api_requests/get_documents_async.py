@@ -0,0 +1,441 @@
+"""
+Asynchronous counterparts of the functions in `get_documents` for use from an asyncio event loop.
+"""
+
+import asyncio
+from copy import deepcopy
+from datetime import date
+
+from .async_client import AsyncFederalRegisterClient, gather_or_cancel
+from .get_documents import (
+    BASE_PARAMS,
+    BASE_URL,
+    DEFAULT_FIELDS,
+    MAX_URL_BYTES,
+    TODAY_ET,
+    BatchQueryError,
+    HTTP414Error,
+    QueryError,
+    _document_numbers_url,
+    _facet_params,
+    _parse_facets,
+    _sort_by_requested_order,
+    _split_likely,
+    facets_url,
+    pack_document_numbers,
+    )
+from .retry import RETRY_EXCEPTIONS, RETRY_STATUS_CODES, RetryError, sleep_retry
+from .windows import plan_date_windows_async, plan_windows_from_counts
+from ..utils.duplicates import process_duplicates
+from ..utils.format_dates import DateFormatter
+
+
+def _ensure_json_response(response, client: AsyncFederalRegisterClient) -> dict:
+    """Ensure request response is valid JSON by checking for 200 status code.
+    Returns JSON response or empty dictionary; raises `HTTPStatusError` for temporary failures that are worth retrying.
+    """
+    if response.status_code == 200:
+        res_json = client.json(response)
+    elif response.status_code in RETRY_STATUS_CODES:
+        response.raise_for_status()
+    else:
+        res_json = {}
+    return res_json
+
+
+@sleep_retry()
+async def _request_json_async(
+        endpoint_url: str,
+        dict_params: dict | None,
+        client: AsyncFederalRegisterClient
+    ) -> dict:
+    """Send a single GET request and return its JSON, retrying temporary failures with backoff.
+    """
+    response = await client.get(endpoint_url, params=dict_params)
+    if response.status_code == 414:
+        raise HTTP414Error(response=response)
+    elif response.status_code in RETRY_STATUS_CODES:
+        response.raise_for_status()
+    return client.json(response)
+
+
+@sleep_retry()
+async def _request_page_async(
+        endpoint_url: str,
+        dict_params: dict | None,
+        client: AsyncFederalRegisterClient
+    ) -> dict:
+    """Request a single page of results, retrying only this request when it fails temporarily.
+    """
+    return _ensure_json_response(await client.get(endpoint_url, params=dict_params), client)
+
+
+async def _retrieve_results_by_next_page_async(
+        endpoint_url: str,
+        dict_params: dict,
+        client: AsyncFederalRegisterClient
+    ) -> list:
+    """Retrieve documents by accessing "next_page_url" returned by each request.
+
+    Args:
+        endpoint_url (str): url for documents.{format} endpoint.
+        dict_params (dict): Paramters to pass in GET request.
+        client (AsyncFederalRegisterClient): Client for sending requests.
+
+    Raises:
+        QueryError: Failed to retrieve documents from all pages.
+
+    Returns:
+        list: Documents retrieved from the API.
+    """
+    results = []
+    response = await _request_page_async(endpoint_url, dict_params, client)
+    pages = response.get("total_pages", 1)
+    next_page_url = response.get("next_page_url")
+    counter = 1
+    results.extend(response.get("results", []))
+    while next_page_url is not None:
+        counter += 1
+        response = await _request_page_async(next_page_url, None, client)
+        results.extend(response.get("results", []))
+        next_page_url = response.get("next_page_url")
+
+    # raise exception if failed to access all pages
+    if counter != pages:
+        raise QueryError(f"Failed to retrieve documents from {pages} pages.")
+
+    return results
+
+
+async def _retrieve_results_by_page_range_async(
+        num_pages: int | None,
+        endpoint_url: str,
+        dict_params: dict,
+        client: AsyncFederalRegisterClient,
+        first_response: dict | None = None
+    ) -> list:
+    """Retrieve documents by requesting pages by number, with pages 2 through N in flight at the same time.
+
+    Args:
+        num_pages (int | None): Number of pages to retrieve documents from. Pass None to use "total_pages" from the first page.
+        endpoint_url (str): URL for API endpoint.
+        dict_params (dict): Paramters to pass in GET request.
+        client (AsyncFederalRegisterClient): Client for sending requests.
+        first_response (dict, optional): Parsed JSON of page 1 when it has already been requested. Defaults to None.
+
+    Raises:
+        QueryError: Failed to retrieve documents from all pages.
+
+    Returns:
+        list: Documents retrieved from the API.
+    """
+    async def retrieve_page(page: int) -> dict:
+        dict_params_page = dict_params.copy()
+        dict_params_page.update({"page": page})
+        return await _request_page_async(endpoint_url, dict_params_page, client)
+
+    if first_response is None:
+        first_response = await retrieve_page(1)
+    if num_pages is None:
+        num_pages = first_response.get("total_pages", 1)
+
+    responses = [first_response] + await gather_or_cancel(*(retrieve_page(page) for page in range(2, num_pages + 1)))
+
+    # raise exception if failed to access all pages
+    if not all("results" in response for response in responses if response.get("count", 1) > 0):
+        raise QueryError(f"Failed to retrieve documents from {num_pages} pages.")
+
+    results = []
+    for response in responses:  # grab results from each page
+        results.extend(response.get("results", []))
+    return results
+
+
+@sleep_retry()
+async def _count_documents_async(
+        endpoint_url: str,
+        dict_params: dict,
+        start_date: date,
+        end_date: date,
+        client: AsyncFederalRegisterClient
+    ) -> int:
+    """Probe the number of documents published in a date window by requesting a single result.
+    """
+    dict_params_probe = dict_params.copy()
+    dict_params_probe.update({
+        "per_page": 1,
+        "page": 1,
+        "fields[]": ["document_number"],
+        "conditions[publication_date][gte]": f"{start_date}",
+        "conditions[publication_date][lte]": f"{end_date}",
+        })
+    response = await client.get(endpoint_url, params=dict_params_probe)
+    response.raise_for_status()
+    return client.json(response)["count"]
+
+
+async def count_documents_by_period_async(
+        start_date: str | date,
+        end_date: str | date | None = None,
+        period: str = "daily",
+        document_types: tuple | list | None = None,
+        dict_params: dict | None = None,
+        endpoint_url: str = BASE_URL,
+        client: AsyncFederalRegisterClient | None = None
+    ) -> dict[date, int]:
+    """Count documents published in each day, week, or month of a date range with a single request to the facets endpoint.
+    See `count_documents_by_period` for details.
+
+    Returns:
+        dict[date, int]: Count of documents keyed by the first day of each period, in chronological order.
+    """
+    if client is None:
+        async with AsyncFederalRegisterClient() as client:
+            return await count_documents_by_period_async(start_date, end_date, period, document_types, dict_params, endpoint_url, client)
+    params = _facet_params(start_date, end_date, document_types, dict_params)
+    return _parse_facets(await _request_json_async(facets_url(endpoint_url, period), params, client))
+
+
+async def _plan_windows_async(
+        endpoint_url: str,
+        dict_params: dict,
+        start_date: date,
+        end_date: date,
+        client: AsyncFederalRegisterClient,
+        count: int | None = None
+    ) -> list[tuple[date, date, int]]:
+    """Plan date windows under 10,000 documents from daily counts in a single facets request.
+    Falls back to bisecting the date range with count probes when the facets are unavailable or do not add up to `count`.
+    """
+    max_documents_threshold = 10000
+    try:
+        daily_counts = await count_documents_by_period_async(start_date, end_date, dict_params=dict_params, endpoint_url=endpoint_url, client=client)
+    except (QueryError, RetryError, *RETRY_EXCEPTIONS):
+        daily_counts = None
+
+    if (daily_counts is not None) and ((count is None) or (sum(daily_counts.values()) == count)):
+        return plan_windows_from_counts(daily_counts, start_date, end_date, max_documents=max_documents_threshold)
+    return await plan_date_windows_async(
+        start_date,
+        end_date,
+        lambda gte, lte: _count_documents_async(endpoint_url, dict_params, gte, lte, client),
+        max_documents=max_documents_threshold,
+        count=count,
+        )
+
+
+async def _retrieve_results_by_window_async(
+        endpoint_url: str,
+        dict_params: dict,
+        windows: list[tuple[date, date, int]],
+        client: AsyncFederalRegisterClient
+    ) -> list:
+    """Retrieve documents for each date window concurrently. Results are returned in the order of the input windows.
+
+    Args:
+        endpoint_url (str): URL for API endpoint.
+        dict_params (dict): Paramters to pass in GET request.
+        windows (list[tuple[date, date, int]]): Start date, end date (inclusive), and expected count of each window.
+        client (AsyncFederalRegisterClient): Client for sending requests.
+
+    Returns:
+        list: Documents retrieved from the API.
+    """
+    async def retrieve_window(window: tuple[date, date, int]) -> list:
+        # update parameters by window
+        dict_params_window = deepcopy(dict_params)
+        dict_params_window.update({
+            "conditions[publication_date][gte]": f"{window[0]}",
+            "conditions[publication_date][lte]": f"{window[1]}"
+            })
+        return await _retrieve_results_by_page_range_async(None, endpoint_url, dict_params_window, client)
+
+    results = []
+    for results_window in await gather_or_cancel(*(retrieve_window(window) for window in windows)):
+        results.extend(results_window)
+    return results
+
+
+async def _query_documents_endpoint_async(
+        endpoint_url: str,
+        dict_params: dict,
+        client: AsyncFederalRegisterClient,
+        handle_duplicates: bool | str = False
+    ) -> tuple[list, int]:
+    """GET request for documents endpoint.
+
+    Args:
+        endpoint_url (str): URL for API endpoint.
+        dict_params (dict): Paramters to pass in GET request.
+        client (AsyncFederalRegisterClient): Client for sending requests.
+
+    Returns:
+        tuple[list, int]: Tuple of API results, count of documents retrieved.
+    """
+    max_documents_threshold = 10000
+    start_date = dict_params.get("conditions[publication_date][gte]", None)
+    end_date = dict_params.get("conditions[publication_date][lte]", f"{TODAY_ET}")
+
+    # probe only the count when the query will probably be split; otherwise keep the response as page 1
+    if _split_likely(dict_params):
+        first_response = None
+        response_count = await _count_documents_async(endpoint_url, dict_params, start_date, end_date, client)
+    else:
+        first_response = await _request_json_async(endpoint_url, dict_params, client)
+        response_count = first_response["count"]
+
+    # handles queries returning no documents
+    if response_count == 0:
+        results = []
+
+    # handles queries that need multiple requests
+    elif response_count > max_documents_threshold:
+        windows = await _plan_windows_async(
+            endpoint_url,
+            dict_params,
+            DateFormatter(start_date).formatted_date,
+            DateFormatter(end_date).formatted_date,
+            client,
+            count=response_count,
+            )
+        results = await _retrieve_results_by_window_async(endpoint_url, dict_params, windows, client)
+
+    # handles normal queries
+    else:
+        results = await _retrieve_results_by_page_range_async(None, endpoint_url, dict_params, client, first_response=first_response)
+
+    running_count = len(results)
+    if running_count != response_count:
+        raise QueryError(f"Failed to retrieve all {response_count} documents.")
+
+    if handle_duplicates:
+        results = process_duplicates(results, how=handle_duplicates, keys=("document_number", "citation"))
+    return results, running_count
+
+
+async def get_documents_by_date_async(
+        start_date: str | date,
+        end_date: str | date | None = None,
+        document_types: tuple | list = None,
+        fields: tuple[str] | list[str] = DEFAULT_FIELDS,
+        endpoint_url: str = BASE_URL,
+        dict_params: dict = BASE_PARAMS,
+        handle_duplicates: bool | str = False,
+        client: AsyncFederalRegisterClient | None = None
+    ) -> tuple[list, int]:
+    """Retrieve Federal Register documents using a date range without blocking the event loop.
+    Date windows and pages are requested concurrently, bounded by the client's `max_concurrency`.
+
+    Args:
+        start_date (str): Start date when documents were published (inclusive; format must be "yyyy-mm-dd").
+        end_date (str, optional): End date (inclusive; format must be "yyyy-mm-dd"). Defaults to None (implies end date is today for EST timezone).
+        document_types (tuple[str] | list[str], optional): If passed, only return specific document types.
+        Valid types are "RULE" (final rules), "PRORULE" (proposed rules), "NOTICE" (notices), and "PRESDOCU" (presidential documents). Defaults to None.
+        fields (tuple | list, optional): Fields/columns to retrieve. Defaults to constant DEFAULT_FIELDS.
+        endpoint_url (str, optional): Endpoint url. Defaults to r"https://www.federalregister.gov/api/v1/documents.json?".
+        client (AsyncFederalRegisterClient, optional): Client for sending requests. Defaults to None (creates and closes a client for this call).
+
+    Returns:
+        tuple[list, int]: Tuple of API results, count of documents retrieved.
+    """
+    # Not passing end_date implies end date of today EST
+    if end_date is None:
+        end_date = TODAY_ET
+
+    # update dictionary of parameters
+    params = dict_params.copy()
+    params.update({
+        "conditions[publication_date][gte]": f"{start_date}",
+        "conditions[publication_date][lte]": f"{end_date}",
+        "fields[]": list(fields),
+        })
+
+    if document_types is not None:
+        params.update({"conditions[type][]": list(document_types)})
+
+    if client is None:
+        async with AsyncFederalRegisterClient() as client:
+            return await _query_documents_endpoint_async(endpoint_url, params, client, handle_duplicates=handle_duplicates)
+    return await _query_documents_endpoint_async(endpoint_url, params, client, handle_duplicates=handle_duplicates)
+
+
+async def _get_documents_by_batch_async(
+        batch_size: int,
+        document_numbers: list,
+        client: AsyncFederalRegisterClient,
+        fields: tuple | list = DEFAULT_FIELDS,
+        max_url_bytes: int = MAX_URL_BYTES
+    ) -> tuple[list, int]:
+    """Retrieve batches of document numbers concurrently. 
+    A batch rejected with HTTP 414 (URI Too Long) is split in half and requested again without repeating the other batches.
+    Results are returned in the order of the requested document numbers.
+
+    Raises:
+        BatchQueryError: One or more batches failed; raised once every batch has been attempted.
+    """
+    async def retrieve_batch(batch: tuple) -> tuple[list, int]:
+        try:
+            return await _query_documents_endpoint_async(_document_numbers_url(batch), {"fields[]": list(fields)}, client)
+        except HTTP414Error:
+            if len(batch) == 1:
+                raise
+            middle = len(batch) // 2
+            (results_a, count_a), (results_b, count_b) = await gather_or_cancel(retrieve_batch(batch[:middle]), retrieve_batch(batch[middle:]))
+            return results_a + results_b, count_a + count_b
+
+    batches = pack_document_numbers(document_numbers, fields=fields, max_url_bytes=max_url_bytes, max_batch_size=batch_size)
+    results, count, failures = [], 0, {}
+    for batch, outcome in zip(batches, await asyncio.gather(*(retrieve_batch(batch) for batch in batches), return_exceptions=True)):
+        if isinstance(outcome, Exception):
+            failures[batch] = outcome
+            continue
+        batch_results, batch_count = outcome
+        results.extend(batch_results)
+        count += batch_count
+
+    if "document_number" in fields:
+        results = _sort_by_requested_order(results, document_numbers)
+    if failures:
+        raise BatchQueryError(
+            f"Failed to retrieve {len(failures)} of {len(batches)} batches of document numbers.",
+            results,
+            count,
+            failures
+            )
+    return results, count
+
+
+async def get_documents_by_number_async(
+        document_numbers: list,
+        fields: tuple | list = DEFAULT_FIELDS,
+        sort_data: bool = True,
+        client: AsyncFederalRegisterClient | None = None,
+        max_url_bytes: int = MAX_URL_BYTES
+    ) -> tuple[list, int]:
+    """Retrieve Federal Register documents using a list of document numbers without blocking the event loop.
+    Duplicate document numbers are dropped, and the rest are requested in batches packed to fit within a URL byte budget.
+    Documents are returned in the order of the requested document numbers (sorted when `sort_data` is True).
+
+    Args:
+        document_numbers (list): Documents to retrieve based on "document_number" field.
+        fields (tuple, optional): Fields/columns to retrieve. Defaults to constant DEFAULT_FIELDS.
+        sort_data (bool, optional): Sort documents by "document_number". Defaults to True.
+        client (AsyncFederalRegisterClient, optional): Client for sending requests. Defaults to None (creates and closes a client for this call).
+        max_url_bytes (int, optional): Maximum length (bytes) of each request URL. Defaults to constant MAX_URL_BYTES.
+
+    Raises:
+        BatchQueryError: One or more batches failed. The documents from successful batches are available on the exception.
+
+    Returns:
+        tuple[list, int]: Tuple of API results, count of documents retrieved.
+    """
+    if client is None:
+        async with AsyncFederalRegisterClient() as client:
+            return await get_documents_by_number_async(document_numbers, fields=fields, sort_data=sort_data, client=client, max_url_bytes=max_url_bytes)
+
+    document_numbers = list(dict.fromkeys(document_numbers))
+    if sort_data:
+        document_numbers = sorted(document_numbers)
+
+    batch_size = 250  # bug with API if higher batch size is used
+    return await _get_documents_by_batch_async(batch_size, document_numbers, client, fields=fields, max_url_bytes=max_url_bytes)
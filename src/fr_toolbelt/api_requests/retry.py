@@ -0,0 +1,288 @@
+"""
+Rate limiting, retrying, and circuit breaking for requests to the Federal Register API.
+"""
+
+import asyncio
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import functools
+import inspect
+import json
+import random
+import threading
+import time
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+
+# status codes worth retrying: rate limited or temporary server-side failures
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+HTTP_STATUS_EXCEPTIONS = (requests.HTTPError, )
+RETRY_EXCEPTIONS = (requests.HTTPError, requests.ConnectionError, requests.Timeout, json.JSONDecodeError, )
+# errors counted as failed requests by a circuit breaker; cancellations and invalid requests are not failures of the API
+TRANSPORT_EXCEPTIONS = (requests.ConnectionError, requests.Timeout, )
+if httpx is not None:
+    HTTP_STATUS_EXCEPTIONS += (httpx.HTTPStatusError, )
+    RETRY_EXCEPTIONS += (httpx.HTTPStatusError, httpx.TransportError, )
+    TRANSPORT_EXCEPTIONS += (httpx.TransportError, )
+
+
+class HTTP414Error(requests.HTTPError):
+    """Request produced a HTTP error for 414 URI Too Long."""
+
+
+class RetryError(Exception):
+    """Request failed after exhausting all retries.
+
+    Args:
+        attempts (int): Number of attempts made.
+        last_exception (Exception): Exception raised by the final attempt.
+    """
+    def __init__(self, message: str, attempts: int, last_exception: Exception | None = None) -> None:
+        super().__init__(message)
+        self.attempts = attempts
+        self.last_exception = last_exception
+
+
+class RateLimiter:
+    """Token bucket limiting how many requests are sent per second.
+    One limiter can be shared by every thread and asyncio task making requests, including across clients.
+
+    Args:
+        rate (float): Requests allowed per second on average.
+        burst (int | None, optional): Maximum number of requests allowed at once after an idle period. Defaults to None (same as `rate`, minimum 1).
+    """
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("Parameter 'rate' must be greater than zero.")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request is allowed.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request is allowed.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Request was rejected without being sent because the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stops sending requests while the API is failing, so callers fail fast instead of sleeping through retries.
+
+    The breaker is closed while requests succeed. It opens once at least `failure_rate` of the last `window` requests have failed 
+    (connection errors, timeouts, or server errors), and rejects requests with `CircuitOpenError` for `reset_timeout` seconds. 
+    It then lets a single probe request through (half-open): if the probe succeeds the breaker closes, otherwise it opens again.
+    Cancelled requests and invalid requests (e.g., a malformed URL) are not counted.
+    One breaker can be shared by several clients, threads, and async tasks.
+
+    Args:
+        failure_rate (float, optional): Fraction of failed requests that opens the breaker. Defaults to 0.5.
+        window (int, optional): Number of recent requests used to compute the failure rate. Defaults to 20.
+        min_requests (int, optional): Minimum number of recent requests before the breaker can open. Defaults to 5.
+        reset_timeout (float, optional): Seconds to stay open before sending a probe request. Defaults to 30.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_rate: float = 0.5, window: int = 20, min_requests: int = 5, reset_timeout: float = 30) -> None:
+        if not (0 < failure_rate <= 1):
+            raise ValueError("Parameter 'failure_rate' must be greater than zero and at most one.")
+        self.failure_rate = failure_rate
+        self.min_requests = min(min_requests, window)
+        self.reset_timeout = reset_timeout
+        self._outcomes = deque(maxlen=window)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open", or "half-open".
+        """
+        with self._lock:
+            return self._state
+
+    def before_request(self) -> bool:
+        """Check whether a request may be sent. Lets one probe through once the open period has elapsed.
+
+        Raises:
+            CircuitOpenError: Breaker is open, or a probe request is already in flight.
+
+        Returns:
+            bool: Whether the request is the probe; a probe must end with `record_success`, `record_failure`, or `release_probe`.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return False
+            if (self._state == self.OPEN) and (time.monotonic() - self._opened_at >= self.reset_timeout):
+                self._state = self.HALF_OPEN
+                return True
+            raise CircuitOpenError(f"Circuit breaker is {self._state}; request not sent.")
+
+    def release_probe(self) -> None:
+        """Give up a probe that ended without an outcome (e.g., it was cancelled), so the next request can probe instead.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.OPEN
+
+    def record_success(self) -> None:
+        """Record a successful request; closes the breaker after a successful probe.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+            self._outcomes.append(False)
+
+    def record_failure(self) -> None:
+        """Record a failed request; opens the breaker if the failure rate is reached or the probe failed.
+        """
+        with self._lock:
+            self._outcomes.append(True)
+            failures = sum(self._outcomes)
+            if (self._state == self.HALF_OPEN) or (
+                    (self._state == self.CLOSED) 
+                    and (len(self._outcomes) >= self.min_requests) 
+                    and (failures >= self.failure_rate * len(self._outcomes))
+                ):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_status(self, status_code: int) -> None:
+        """Record a response by its status code; server errors (5xx) count as failures.
+        """
+        if status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+
+def retry_after_seconds(exception: Exception) -> float | None:
+    """Return the delay requested by a response's "Retry-After" header, if any.
+    The header may contain a number of seconds or an HTTP date.
+    """
+    response = getattr(exception, "response", None)
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, timeout: float, max_timeout: float, jitter: bool = True) -> float:
+    """Exponential backoff delay for a given attempt, with optional "full jitter" to spread out simultaneous retries.
+    """
+    delay = min(max_timeout, timeout * (2 ** attempt))
+    return random.uniform(0, delay) if jitter else delay
+
+
+def _is_retryable(exception: Exception) -> bool:
+    """Whether an error is temporary: connection problems, malformed JSON, or a retryable status code.
+    """
+    if isinstance(exception, HTTP414Error):
+        # a shorter URL is needed, so repeating the same request cannot succeed
+        return False
+    response = getattr(exception, "response", None)
+    if isinstance(exception, HTTP_STATUS_EXCEPTIONS) and (response is not None):
+        return response.status_code in RETRY_STATUS_CODES
+    return True
+
+
+def _retry_delay(exception: Exception, attempt: int, timeout: float, max_timeout: float, jitter: bool) -> float:
+    delay = backoff_delay(attempt, timeout, max_timeout, jitter=jitter)
+    retry_after = retry_after_seconds(exception)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def sleep_retry(timeout: float = 1, retry: int = 3, max_timeout: float = 60, jitter: bool = True):
+    """Decorator to sleep and retry a request when receiving an error, using exponential backoff with jitter.
+    Honors the "Retry-After" header of rate-limited (429) or unavailable (503) responses.
+    Works with regular functions and coroutine functions (sleeping without blocking the event loop).
+
+    Args:
+        timeout (float, optional): Base number of seconds to sleep after the first error; doubles after each retry. Defaults to 1.
+        retry (int, optional): Number of times to retry. Defaults to 3.
+        max_timeout (float, optional): Maximum number of seconds to sleep between retries. Defaults to 60.
+        jitter (bool, optional): Randomize each delay between zero and the backoff value. Defaults to True.
+
+    Raises:
+        RetryError: Request failed after exhausting all retries.
+    """
+    def retry_decorator(function):
+
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(retry + 1):
+                    try:
+                        return await function(*args, **kwargs)
+                    except RETRY_EXCEPTIONS as err:
+                        if not _is_retryable(err):
+                            raise
+                        if attempt == retry:
+                            raise RetryError(f"Request failed after {attempt + 1} attempts: {err!r}", attempt + 1, err) from err
+                        await asyncio.sleep(_retry_delay(err, attempt, timeout, max_timeout, jitter))
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            for attempt in range(retry + 1):
+                try:
+                    return function(*args, **kwargs)
+                except RETRY_EXCEPTIONS as err:
+                    if not _is_retryable(err):
+                        raise
+                    if attempt == retry:
+                        raise RetryError(f"Request failed after {attempt + 1} attempts: {err!r}", attempt + 1, err) from err
+                    time.sleep(_retry_delay(err, attempt, timeout, max_timeout, jitter))
+        return wrapper
+
+    return retry_decorator
@@ -0,0 +1,252 @@
+"""
+Splitting a large harvest into independent shards that can run on separate machines.
+
+A harvest has three steps:
+1. `plan_shards` turns a date range and filters into a manifest of shards (date window, query parameters, expected count).
+2. `run_shard` retrieves the documents of one shard and writes them to a file; each shard can run on any worker.
+3. `merge_shards` verifies the shard files against the manifest and combines them into the same output as `get_documents_by_date`.
+
+The steps can also be run from the command line:
+
+    python -m fr_toolbelt.api_requests.shards plan 2000-01-01 2024-12-31 manifest.json
+    python -m fr_toolbelt.api_requests.shards run manifest.json 0 shards/
+    python -m fr_toolbelt.api_requests.shards merge manifest.json shards/ documents.json
+"""
+
+import argparse
+from datetime import date
+import json
+from pathlib import Path
+
+from .checkpoints import _query_id, _write_json_atomic
+from .client import FederalRegisterClient, get_default_client
+from .get_documents import (
+    BASE_PARAMS,
+    BASE_URL,
+    DEFAULT_FIELDS,
+    TODAY_ET,
+    QueryError,
+    _count_documents,
+    _date_range_params,
+    _plan_windows,
+    _retrieve_results_by_pages,
+    )
+from ..utils.duplicates import process_duplicates
+from ..utils.format_dates import DateFormatter
+
+
+class ShardError(Exception):
+    """Shard files are missing or do not match the manifest."""
+
+
+def plan_shards(
+        start_date: str | date,
+        end_date: str | date | None = None,
+        document_types: tuple | list | None = None,
+        fields: tuple[str] | list[str] = DEFAULT_FIELDS,
+        endpoint_url: str = BASE_URL,
+        dict_params: dict = BASE_PARAMS,
+        max_documents: int = 10000,
+        client: FederalRegisterClient | None = None
+    ) -> dict:
+    """Plan a harvest of documents published in a date range as a manifest of independent shards.
+    Shards are contiguous date windows of at most `max_documents` documents (the API's 10,000 result limit by default),
+    planned from the daily document counts, so the same query and data always produce the same manifest.
+
+    Args:
+        start_date (str | date): Start date when documents were published (inclusive).
+        end_date (str | date, optional): End date (inclusive). Defaults to None (today).
+        document_types (tuple[str] | list[str], optional): If passed, only return specific document types. Defaults to None.
+        fields (tuple | list, optional): Fields/columns to retrieve. Defaults to constant DEFAULT_FIELDS.
+        endpoint_url (str, optional): Endpoint url. Defaults to constant BASE_URL.
+        dict_params (dict, optional): Base parameters of the query. Defaults to constant BASE_PARAMS.
+        max_documents (int, optional): Maximum number of documents per shard; lower values create more, smaller shards. Defaults to 10000.
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+
+    Raises:
+        ValueError: `max_documents` is not between 1 and 10,000.
+
+    Returns:
+        dict: Manifest with the query id, endpoint url, total count, and a list of shards (index, start_date, end_date, expected_count, params).
+    """
+    max_documents_threshold = 10000
+    if not (0 < max_documents <= max_documents_threshold):
+        raise ValueError(f"`max_documents` must be between 1 and {max_documents_threshold}.")
+    if client is None:
+        client = get_default_client()
+    start_date = DateFormatter(start_date).formatted_date
+    end_date = DateFormatter(end_date if end_date is not None else TODAY_ET).formatted_date
+    params = _date_range_params(start_date, end_date, document_types, list(fields), dict_params)
+    total_count = _count_documents(endpoint_url, params, start_date, end_date, client=client)
+
+    if total_count == 0:
+        windows = []
+    elif total_count <= max_documents:
+        windows = [(start_date, end_date, total_count)]
+    else:
+        windows = _plan_windows(endpoint_url, params, start_date, end_date, client=client, count=total_count, max_documents_threshold=max_documents)
+
+    shards = []
+    for index, (gte, lte, count) in enumerate(windows):
+        shard_params = dict(params)
+        shard_params.update({
+            "conditions[publication_date][gte]": f"{gte}",
+            "conditions[publication_date][lte]": f"{lte}",
+            })
+        shards.append({
+            "index": index,
+            "start_date": f"{gte}",
+            "end_date": f"{lte}",
+            "expected_count": count,
+            "params": shard_params,
+            })
+
+    return {
+        "query_id": _query_id(params),
+        "endpoint_url": endpoint_url,
+        "start_date": f"{start_date}",
+        "end_date": f"{end_date}",
+        "total_count": total_count,
+        "shards": shards,
+        }
+
+
+def save_manifest(manifest: dict, path: Path | str) -> None:
+    """Write a manifest to a JSON file.
+    """
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_json_atomic(manifest, path)
+
+
+def load_manifest(path: Path | str) -> dict:
+    """Read a manifest from a JSON file.
+    """
+    with open(Path(path).expanduser(), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def shard_path(output_dir: Path | str, index: int) -> Path:
+    """Path of the file holding the documents of a shard.
+    """
+    return Path(output_dir).expanduser() / f"shard_{index:05d}.json"
+
+
+def run_shard(
+        manifest: dict,
+        index: int,
+        output_dir: Path | str,
+        client: FederalRegisterClient | None = None,
+        page_workers: int = 1,
+        overwrite: bool = False
+    ) -> Path:
+    """Retrieve the documents of one shard and write them to `output_dir`. Shards are independent, so each can run on a different worker.
+
+    Args:
+        manifest (dict): Manifest created by `plan_shards`.
+        index (int): Index of the shard to run.
+        output_dir (Path | str): Directory for shard files (e.g., a shared file system).
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+        page_workers (int, optional): Number of pages to fetch concurrently within the shard. Defaults to 1 (follow "next_page_url").
+        overwrite (bool, optional): Fetch the shard again even if its file already exists. Defaults to False (completed shards are skipped).
+
+    Raises:
+        QueryError: Number of documents retrieved does not match the expected count of the shard.
+
+    Returns:
+        Path: Path of the shard file.
+    """
+    shard = manifest["shards"][index]
+    path = shard_path(output_dir, index)
+    if path.exists() and not overwrite:
+        return path
+    results = _retrieve_results_by_pages(manifest["endpoint_url"], shard["params"], client=client, page_workers=page_workers)
+    if len(results) != shard["expected_count"]:
+        raise QueryError(f"Shard {index} retrieved {len(results)} of {shard['expected_count']} expected documents.")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_json_atomic({"query_id": manifest["query_id"], "index": index, "count": len(results), "results": results}, path)
+    return path
+
+
+def merge_shards(
+        manifest: dict,
+        output_dir: Path | str,
+        handle_duplicates: bool | str = "drop"
+    ) -> tuple[list, int]:
+    """Verify the shard files against the manifest and combine their documents in publication order.
+
+    Args:
+        manifest (dict): Manifest created by `plan_shards`.
+        output_dir (Path | str): Directory containing the shard files.
+        handle_duplicates (bool | str, optional): How to handle documents with the same "document_number" and "citation"
+        ("drop", "flag", or "raise"; False keeps them). Defaults to "drop".
+
+    Raises:
+        ShardError: Shard files are missing, belong to another query, or do not contain the expected number of documents.
+
+    Returns:
+        tuple[list, int]: Tuple of API results, count of documents retrieved.
+    """
+    missing, invalid = [], []
+    results = []
+    for shard in manifest["shards"]:
+        path = shard_path(output_dir, shard["index"])
+        if not path.exists():
+            missing.append(shard["index"])
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if (data.get("query_id") != manifest["query_id"]) or (len(data.get("results", [])) != shard["expected_count"]):
+            invalid.append(shard["index"])
+            continue
+        results.extend(data["results"])
+
+    if missing or invalid:
+        raise ShardError(f"Cannot merge shards; missing: {missing}, invalid: {invalid}.")
+    if len(results) != manifest["total_count"]:
+        raise ShardError(f"Shards contain {len(results)} of {manifest['total_count']} expected documents.")
+
+    if handle_duplicates:
+        results = process_duplicates(results, how=handle_duplicates, keys=("document_number", "citation"))
+    return results, len(results)
+
+
+def main(args: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m fr_toolbelt.api_requests.shards", description="Sharded harvest of Federal Register documents.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    plan_parser = subparsers.add_parser("plan", help="Write a manifest of shards for a date range.")
+    plan_parser.add_argument("start_date")
+    plan_parser.add_argument("end_date")
+    plan_parser.add_argument("manifest")
+    plan_parser.add_argument("--document-types", nargs="+", default=None)
+    plan_parser.add_argument("--max-documents", type=int, default=10000)
+
+    run_parser = subparsers.add_parser("run", help="Retrieve the documents of one shard.")
+    run_parser.add_argument("manifest")
+    run_parser.add_argument("index", type=int)
+    run_parser.add_argument("output_dir")
+    run_parser.add_argument("--page-workers", type=int, default=1)
+
+    merge_parser = subparsers.add_parser("merge", help="Verify and combine shard files.")
+    merge_parser.add_argument("manifest")
+    merge_parser.add_argument("output_dir")
+    merge_parser.add_argument("output_file")
+
+    parsed = parser.parse_args(args)
+    if parsed.command == "plan":
+        manifest = plan_shards(parsed.start_date, parsed.end_date, document_types=parsed.document_types, max_documents=parsed.max_documents)
+        save_manifest(manifest, parsed.manifest)
+        print(f"Planned {len(manifest['shards'])} shards for {manifest['total_count']} documents.")
+    elif parsed.command == "run":
+        path = run_shard(load_manifest(parsed.manifest), parsed.index, parsed.output_dir, page_workers=parsed.page_workers)
+        print(f"Wrote shard {parsed.index} to {path}.")
+    elif parsed.command == "merge":
+        results, count = merge_shards(load_manifest(parsed.manifest), parsed.output_dir)
+        with open(parsed.output_file, "w", encoding="utf-8") as f:
+            json.dump(results, f)
+        print(f"Merged {count} documents into {parsed.output_file}.")
+
+
+if __name__ == "__main__":
+    main()
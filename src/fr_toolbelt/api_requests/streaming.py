@@ -0,0 +1,116 @@
+"""
+Incremental parsing of result pages from a streamed response body.
+"""
+
+from collections.abc import Iterable, Iterator
+import codecs
+import json
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+
+
+class _ChunkReader:
+    """Text buffer over an iterable of byte chunks that keeps only the unparsed part of the body in memory.
+    """
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer, dropping text that has already been parsed. Returns False at the end of the body.
+        """
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        if chunk is None:
+            self.eof = True
+            self.buffer += self._utf8.decode(b"", final=True)
+            return False
+        self.buffer += self._utf8.decode(chunk)
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it (empty string at the end of the body).
+        """
+        while True:
+            while (self.pos < len(self.buffer)) and (self.buffer[self.pos] in _WHITESPACE):
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of `chars`.
+        """
+        char = self.peek()
+        if (char == "") or (char not in chars):
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value, reading more chunks until it is complete.
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # a number (e.g., "1e" of "1e5") may continue in the next chunk, so wait for the character after the value
+            if self.eof or ((end < len(self.buffer)) and (self.buffer[end] in _DELIMITERS)):
+                self.pos = end
+                return obj
+            self.fill()
+
+
+def iter_page_results(chunks: Iterable[bytes], page: dict | None = None, results_key: str = "results") -> Iterator[dict]:
+    """Parse a page of API results incrementally, yielding each document as soon as it has been received.
+    Only the current document (plus at most one unparsed chunk) is held in memory, rather than the whole page.
+
+    Args:
+        chunks (Iterable[bytes]): Chunks of the response body (e.g., `response.iter_content(chunk_size)`).
+        page (dict, optional): Receives every other top-level key of the page (e.g., "count", "next_page_url") once parsed. Defaults to None.
+        results_key (str, optional): Key of the array of documents. Defaults to "results".
+
+    Raises:
+        JSONDecodeError: Response body is not a valid JSON object.
+
+    Yields:
+        dict: Documents in the order they appear in the page.
+    """
+    if page is None:
+        page = {}
+    reader = _ChunkReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if (key == results_key) and (reader.peek() == "["):
+            reader.pos += 1
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.expect(",]") == "]":
+                        break
+        else:
+            page[key] = reader.value()
+        if reader.expect(",}") == "}":
+            return
@@ -0,0 +1,221 @@
+"""
+Incremental (delta) sync of documents since the last harvest.
+"""
+
+from datetime import date, timedelta
+import hashlib
+import json
+from pathlib import Path
+
+from .checkpoints import _query_id, _write_json_atomic
+from .client import FederalRegisterClient, get_default_client
+from .get_documents import (
+    BASE_PARAMS,
+    BASE_URL,
+    DEFAULT_FIELDS,
+    TODAY_ET,
+    _date_range_params,
+    count_documents_by_period,
+    get_documents_by_date,
+    )
+from ..utils.format_dates import DateFormatter
+
+
+class SyncStateError(Exception):
+    """Sync state file belongs to a different query."""
+
+
+def document_hash(document: dict) -> str:
+    """Hash the content of a document so changes can be detected between syncs.
+    """
+    return hashlib.sha256(json.dumps(document, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def _contiguous_runs(days: list[date]) -> list[tuple[date, date]]:
+    """Group sorted days into (start, end) ranges of consecutive days.
+    """
+    runs = []
+    for day in days:
+        if runs and (runs[-1][1] + timedelta(days=1) == day):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+class SyncState:
+    """State of an incremental sync stored in a small JSON file.
+
+    Records the last synced publication date (the watermark), the number of documents published each day,
+    and a content hash of each document for the days that can still be re-checked (the lookback period before the watermark).
+
+    Args:
+        path (Path | str): Path of the state file.
+        query_id (str): Identifies the query parameters the state belongs to.
+    """
+    def __init__(self, path: Path | str, query_id: str) -> None:
+        self.path = Path(path).expanduser()
+        self.query_id = query_id
+        self.watermark: date | None = None
+        self.daily_counts: dict[date, int] = {}
+        self.hashes: dict[date, dict[str, str]] = {}
+
+    @classmethod
+    def load(cls, path: Path | str, query_id: str) -> "SyncState":
+        """Load the state file, or return an empty state if it does not exist yet.
+
+        Raises:
+            SyncStateError: State file was created for different query parameters.
+        """
+        state = cls(path, query_id)
+        if not state.path.exists():
+            return state
+        with open(state.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("query_id") != query_id:
+            raise SyncStateError(f"Sync state at {state.path} was created for different query parameters.")
+        if data.get("watermark") is not None:
+            state.watermark = date.fromisoformat(data["watermark"])
+        state.daily_counts = {date.fromisoformat(k): v for k, v in data.get("daily_counts", {}).items()}
+        state.hashes = {date.fromisoformat(k): v for k, v in data.get("hashes", {}).items()}
+        return state
+
+    def save(self) -> None:
+        """Write the state file atomically.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "query_id": self.query_id,
+            "watermark": f"{self.watermark}" if self.watermark is not None else None,
+            "daily_counts": {f"{k}": v for k, v in sorted(self.daily_counts.items())},
+            "hashes": {f"{k}": v for k, v in sorted(self.hashes.items())},
+            }
+        _write_json_atomic(data, self.path)
+
+    def prune(self, before: date) -> None:
+        """Drop counts and hashes for days before a date, which will not be re-checked.
+        """
+        self.daily_counts = {k: v for k, v in self.daily_counts.items() if k >= before}
+        self.hashes = {k: v for k, v in self.hashes.items() if k >= before}
+
+
+class SyncResult:
+    """Changes found by a sync.
+
+    Args:
+        documents (list[dict]): Documents that were added or changed.
+        added (list[str]): Document numbers that were not in the previous sync.
+        changed (list[str]): Document numbers whose content changed since the previous sync.
+        removed (list[str]): Document numbers that are no longer returned by the API.
+        fetched_days (list[date]): Days that were fetched because their counts changed or they were newer than the watermark.
+    """
+    def __init__(
+            self,
+            documents: list[dict],
+            added: list[str],
+            changed: list[str],
+            removed: list[str],
+            fetched_days: list[date]
+        ) -> None:
+        self.documents = documents
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.fetched_days = fetched_days
+
+    def __repr__(self) -> str:
+        return f"SyncResult(added={len(self.added)}, changed={len(self.changed)}, removed={len(self.removed)}, fetched_days={len(self.fetched_days)})"
+
+
+def sync_documents(
+        state_path: Path | str,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        lookback_days: int = 30,
+        document_types: tuple | list | None = None,
+        fields: tuple[str] | list[str] = DEFAULT_FIELDS,
+        endpoint_url: str = BASE_URL,
+        dict_params: dict = BASE_PARAMS,
+        client: FederalRegisterClient | None = None,
+        **kwargs
+    ) -> SyncResult:
+    """Fetch only the documents that are new or may have changed since the last sync, and report what changed.
+
+    One facets request returns the number of documents published each day from `lookback_days` before the watermark (last synced date)
+    through `end_date`. Only days newer than the watermark or whose counts changed are fetched; their documents are compared
+    with the content hashes saved by the previous sync to identify added, changed, and removed document numbers.
+    The first sync fetches every day from `start_date`.
+
+    Args:
+        state_path (Path | str): Path of the JSON file storing the sync state (one file per query).
+        start_date (str | date): First publication date to sync (inclusive).
+        end_date (str | date, optional): Last publication date to sync (inclusive). Defaults to None (today).
+        lookback_days (int, optional): Number of days before the watermark to re-check for late additions and corrections. Defaults to 30.
+        document_types (tuple[str] | list[str], optional): If passed, only sync specific document types. Defaults to None.
+        fields (tuple | list, optional): Fields/columns to retrieve; "document_number" and "publication_date" are always included. Defaults to constant DEFAULT_FIELDS.
+        endpoint_url (str, optional): Endpoint url. Defaults to constant BASE_URL.
+        client (FederalRegisterClient, optional): Client for sending requests. Defaults to None (uses shared default client).
+        **kwargs: Keyword arguments for `get_documents_by_date` (e.g., max_workers).
+
+    Raises:
+        SyncStateError: State file was created for different query parameters.
+
+    Returns:
+        SyncResult: Documents that were added or changed, with lists of added, changed, and removed document numbers.
+    """
+    if client is None:
+        client = get_default_client()
+    start_date = DateFormatter(start_date).formatted_date
+    end_date = DateFormatter(end_date if end_date is not None else TODAY_ET).formatted_date
+    fields = tuple(dict.fromkeys(("document_number", "publication_date") + tuple(fields)))
+    params = _date_range_params(start_date, end_date, document_types, fields, dict_params)
+    state = SyncState.load(state_path, _query_id({k: v for k, v in params.items() if "publication_date" not in k}))
+
+    # re-check the lookback period before the watermark
+    check_start = start_date
+    if state.watermark is not None:
+        check_start = max(start_date, state.watermark - timedelta(days=lookback_days))
+    daily_counts = count_documents_by_period(check_start, end_date, document_types=document_types, dict_params=dict_params, endpoint_url=endpoint_url, client=client)
+
+    # fetch days newer than the watermark or whose counts changed
+    days = (check_start + timedelta(days=n) for n in range((end_date - check_start).days + 1))
+    check_days = [day for day in days if (daily_counts.get(day, 0) > 0) or (state.daily_counts.get(day, 0) > 0)]
+    fetch_days = [
+        day for day in check_days
+        if ((state.watermark is None) or (day > state.watermark) or (daily_counts.get(day, 0) != state.daily_counts.get(day)))
+        ]
+
+    new_hashes: dict[date, dict[str, str]] = {day: {} for day in fetch_days}
+    documents_by_number = {}
+    for run_start, run_end in _contiguous_runs([day for day in fetch_days if daily_counts.get(day, 0) > 0]):
+        results, _ = get_documents_by_date(
+            run_start,
+            run_end,
+            document_types=document_types,
+            fields=fields,
+            endpoint_url=endpoint_url,
+            dict_params=dict_params,
+            client=client,
+            **kwargs
+            )
+        for document in results:
+            day = DateFormatter(document["publication_date"]).formatted_date
+            new_hashes.setdefault(day, {})[document["document_number"]] = document_hash(document)
+            documents_by_number[document["document_number"]] = document
+
+    # compare with the previous sync
+    old = {number: h for day in fetch_days for number, h in state.hashes.get(day, {}).items()}
+    new = {number: h for day_hashes in new_hashes.values() for number, h in day_hashes.items()}
+    added = [number for number in new if number not in old]
+    changed = [number for number in new if (number in old) and (new[number] != old[number])]
+    removed = [number for number in old if number not in new]
+
+    # update state, keeping only the days that future syncs can re-check
+    state.daily_counts.update({day: daily_counts.get(day, 0) for day in check_days})
+    state.hashes.update(new_hashes)
+    state.watermark = end_date if state.watermark is None else max(end_date, state.watermark)
+    state.prune(state.watermark - timedelta(days=lookback_days))
+    state.save()
+
+    documents = [documents_by_number[number] for number in added + changed]
+    return SyncResult(documents, added, changed, removed, fetch_days)
@@ -0,0 +1,154 @@
+"""
+Planning date windows that keep each query under the API's maximum number of results.
+"""
+
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+import asyncio
+
+from ..utils.format_dates import DateFormatter
+
+
+MAX_DOCUMENTS = 10000
+
+# the Federal Register publishes roughly 25,000-30,000 documents a year, so about four months reach the 10,000 result limit 
+# and longer date ranges (including a calendar year) are usually split into windows
+SPLIT_LIKELY_AFTER_DAYS = 120
+
+
+class WindowPlanningError(Exception):
+    """Date range cannot be split into windows under the maximum number of results."""
+
+
+def _as_date(input_date: date | str) -> date:
+    return DateFormatter(input_date).formatted_date
+
+
+def _bisect_window(start: date, end: date) -> tuple[tuple[date, date], tuple[date, date]]:
+    """Split a window of at least two days into two adjacent halves.
+    """
+    midpoint = start + timedelta(days=(end - start).days // 2)
+    return (start, midpoint), (midpoint + timedelta(days=1), end)
+
+
+def split_likely(start_date: date | str, end_date: date | str, days: int = SPLIT_LIKELY_AFTER_DAYS) -> bool:
+    """Whether a date range is long enough that its query will probably be split into windows.
+    The initial request for such a query only needs the document count, so it can be a cheap probe.
+    """
+    return (_as_date(end_date) - _as_date(start_date)).days >= days
+
+
+def merge_windows(
+        windows: list[tuple[date, date, int]],
+        max_documents: int = MAX_DOCUMENTS
+    ) -> list[tuple[date, date, int]]:
+    """Merge adjacent windows while their combined count stays under the maximum number of results.
+
+    Args:
+        windows (list[tuple[date, date, int]]): Contiguous windows in chronological order with their document counts.
+        max_documents (int, optional): Maximum number of documents per window. Defaults to 10000.
+
+    Returns:
+        list[tuple[date, date, int]]: Merged windows in chronological order with their document counts.
+    """
+    merged = []
+    for start, end, count in windows:
+        if merged and (merged[-1][2] + count <= max_documents) and (merged[-1][1] + timedelta(days=1) == start):
+            prev_start, _, prev_count = merged.pop()
+            merged.append((prev_start, end, prev_count + count))
+        else:
+            merged.append((start, end, count))
+    return merged
+
+
+def plan_date_windows(
+        start_date: date | str,
+        end_date: date | str,
+        count_documents: Callable[[date, date], int],
+        max_documents: int = MAX_DOCUMENTS,
+        count: int | None = None
+    ) -> list[tuple[date, date, int]]:
+    """Plan the fewest date windows that each return no more than `max_documents` results.
+    Windows over the limit are bisected recursively using cheap count probes, then adjacent windows are merged.
+
+    Args:
+        start_date (date | str): Start of date range (inclusive).
+        end_date (date | str): End of date range (inclusive).
+        count_documents (Callable[[date, date], int]): Returns the number of documents published in a window (e.g., a `per_page=1` request).
+        max_documents (int, optional): Maximum number of documents per window. Defaults to 10000.
+        count (int | None, optional): Known count for the full date range, which avoids probing it again. Defaults to None.
+
+    Raises:
+        WindowPlanningError: A single day exceeds the maximum number of documents.
+
+    Returns:
+        list[tuple[date, date, int]]: Start date, end date, and document count of each window in chronological order.
+    """
+    def plan(start: date, end: date, window_count: int | None) -> list[tuple[date, date, int]]:
+        if window_count is None:
+            window_count = count_documents(start, end)
+        if window_count <= max_documents:
+            return [(start, end, window_count)]
+        elif start >= end:
+            raise WindowPlanningError(f"{window_count} documents published on {start} exceed maximum of {max_documents}.")
+        first, second = _bisect_window(start, end)
+        return plan(*first, None) + plan(*second, None)
+
+    windows = plan(_as_date(start_date), _as_date(end_date), count)
+    return [w for w in merge_windows(windows, max_documents=max_documents) if w[2] > 0]
+
+
+def plan_windows_from_counts(
+        counts: dict[date, int],
+        start_date: date | str,
+        end_date: date | str,
+        max_documents: int = MAX_DOCUMENTS
+    ) -> list[tuple[date, date, int]]:
+    """Plan the fewest date windows that each return no more than `max_documents` results from known daily counts,
+    such as those returned by the documents facets endpoint. No requests are needed to probe the date range.
+
+    Args:
+        counts (dict[date, int]): Number of documents published each day; days that are missing have no documents.
+        start_date (date | str): Start of date range (inclusive).
+        end_date (date | str): End of date range (inclusive).
+        max_documents (int, optional): Maximum number of documents per window. Defaults to 10000.
+
+    Raises:
+        WindowPlanningError: A single day exceeds the maximum number of documents.
+
+    Returns:
+        list[tuple[date, date, int]]: Start date, end date, and document count of each window in chronological order.
+    """
+    start, end = _as_date(start_date), _as_date(end_date)
+    windows = []
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        day_count = counts.get(day, 0)
+        if day_count > max_documents:
+            raise WindowPlanningError(f"{day_count} documents published on {day} exceed maximum of {max_documents}.")
+        windows.append((day, day, day_count))
+    return [w for w in merge_windows(windows, max_documents=max_documents) if w[2] > 0]
+
+
+async def plan_date_windows_async(
+        start_date: date | str,
+        end_date: date | str,
+        count_documents: Callable[[date, date], Awaitable[int]],
+        max_documents: int = MAX_DOCUMENTS,
+        count: int | None = None
+    ) -> list[tuple[date, date, int]]:
+    """Asynchronous version of `plan_date_windows` that probes both halves of each split concurrently.
+    """
+    async def plan(start: date, end: date, window_count: int | None) -> list[tuple[date, date, int]]:
+        if window_count is None:
+            window_count = await count_documents(start, end)
+        if window_count <= max_documents:
+            return [(start, end, window_count)]
+        elif start >= end:
+            raise WindowPlanningError(f"{window_count} documents published on {start} exceed maximum of {max_documents}.")
+        first, second = _bisect_window(start, end)
+        windows_first, windows_second = await asyncio.gather(plan(*first, None), plan(*second, None))
+        return windows_first + windows_second
+
+    windows = await plan(_as_date(start_date), _as_date(end_date), count)
+    return [w for w in merge_windows(windows, max_documents=max_documents) if w[2] > 0]
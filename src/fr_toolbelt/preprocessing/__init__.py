@@ -4,7 +4,13 @@ Preprocessing Federal Register API results.
 
 from .agencies import AgencyMetadata, AgencyData, INDEPENDENT_REG_AGENCIES
 from .dockets import RegsDotGovData, Dockets
-from .documents import process_documents
+from .documents import (
+    get_processed_documents_by_date, 
+    get_processed_documents_by_number, 
+    process_documents, 
+    required_fields, 
+    )
+from .pipeline import JsonLinesSink, process_documents_by_date_pipeline, process_documents_pipeline
 from .presidents import Presidents
 from .rin import RegInfoData
 
@@ -15,6 +21,12 @@ __all__ = [
     "RegsDotGovData", 
     "Dockets", 
     "process_documents", 
+    "required_fields", 
+    "get_processed_documents_by_date", 
+    "get_processed_documents_by_number", 
+    "JsonLinesSink", 
+    "process_documents_pipeline", 
+    "process_documents_by_date_pipeline", 
     "Presidents", 
     "RegInfoData", 
     ]
@@ -3,7 +3,7 @@ import json
 from pathlib import Path
 from types import GeneratorType
 
-import requests
+from ..api_requests import FederalRegisterClient, get_default_client
 
 
 # source: https://www.law.cornell.edu/uscode/text/44/3502
@@ -35,8 +35,11 @@ class AgencyMetadata:
     
     Args:
         data (dict, optional): Accepts a JSON object of structure iterable[dict]. Defaults to None.
+        client (FederalRegisterClient, optional): Client for requesting the metadata; give it a `ResponseCache` to revalidate
+        cached metadata with a conditional request instead of downloading it again. Defaults to None (uses shared default client).
     """
-    def __init__(self, data: list[dict] | None = None):
+    def __init__(self, data: list[dict] | None = None, client: FederalRegisterClient | None = None):
+        self.client = client if client is not None else get_default_client()
         if data is not None:
             self.data = data
         else:
@@ -58,12 +61,12 @@ class AgencyMetadata:
             HTTPError: via requests package
         """
         # request documents; raise error if it fails
-        agencies_response = requests.get(endpoint_url)
+        agencies_response = self.client.get(endpoint_url)
         if agencies_response.status_code != 200:
             print(agencies_response.reason)
             agencies_response.raise_for_status()
         # return response as json
-        return agencies_response.json()
+        return self.client.json(agencies_response)
     
     def __extract_schema(self, metadata: dict[dict] | None = None):
         """Get Agency schema of agencies available from API.
@@ -157,6 +160,8 @@ class AgencyData:
         schema (list): Schema for valid agency slugs.
         field_keys (tuple, optional): Fields containing agency information. Defaults to ("agencies", "agency_names").
     """
+    required_fields: tuple[str, ...] = ("agencies", "agency_names")
+
     def __init__(
             self, 
             documents: list[dict], 
@@ -5,6 +5,8 @@ class RegsDotGovData(FieldData):
     """Class for processing docket data sourced from Regulations.gov.
     Inherits from `FieldData`.
     """
+    required_fields = ("regulations_dot_gov_info", "docket_ids")
+
     def __init__(self, 
                  documents: list[dict], 
                  field_key: str = "regulations_dot_gov_info",
@@ -57,6 +59,8 @@ class Dockets(RegsDotGovData):
     """Class for processing docket data from "dockets" field.
     Inherits from `RegsDotGovData`.
     """
+    required_fields = ("dockets", "docket_ids")
+
     def __init__(self, 
                  documents: list[dict], 
                  field_key: str = "dockets", 
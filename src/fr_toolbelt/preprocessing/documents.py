@@ -1,18 +1,76 @@
+from datetime import date
+
 from .agencies import AgencyMetadata, AgencyData
 from .dockets import RegsDotGovData, Dockets
 from .presidents import Presidents
 from .rin import RegInfoData
+from ..api_requests import get_documents_by_date, get_documents_by_number
+
+
+# fields always requested by the fetch-and-process functions
+BASE_FIELDS = ("document_number", )
 
 
-class PreprocessingError:
+class PreprocessingError(Exception):
     pass
 
 
+def _select_processors(which: str | list | tuple = "all", docket_data_source: str = "dockets") -> dict:
+    """Map each selected keyword to the class that processes it.
+
+    Raises:
+        PreprocessingError: Invalid value for `which`.
+    """
+    # dictionary of alternative sources
+    source_dict = {
+        "dockets": Dockets, 
+        "regulations_dot_gov_info": RegsDotGovData
+        }
+
+    # maps keyword to class
+    process_fields = {
+        "agencies": AgencyData, 
+        "dockets": source_dict.get(docket_data_source, Dockets), 
+        "presidents": Presidents, 
+        "rin": RegInfoData, 
+        }
+
+    if (which == "all") or ("all" in which and isinstance(which, (list, tuple))):
+        return process_fields
+    elif isinstance(which, str) and (which in process_fields.keys()):
+        return {which: process_fields[which]}
+    elif isinstance(which, (list, tuple)):
+        return {field: process_fields[field] for field in which if field in process_fields.keys()}
+    else:
+        raise PreprocessingError("Failed to preprocess input documents.")
+
+
+def required_fields(
+        which: str | list | tuple = "all", 
+        docket_data_source: str = "dockets", 
+        fields: tuple | list = ()
+    ) -> tuple[str, ...]:
+    """Return the raw API fields needed to process the selected fields, plus any additional `fields`.
+
+    Args:
+        which (str | list | tuple, optional): Which fields to process per document. Defaults to "all". See `process_documents`.
+        docket_data_source (str, optional): Select which field to use as a source for processing dockets data. Defaults to "dockets".
+        fields (tuple | list, optional): Additional fields to retrieve. Defaults to ().
+
+    Returns:
+        tuple[str, ...]: Fields to retrieve, without duplicates.
+    """
+    processors = _select_processors(which, docket_data_source)
+    union = list(BASE_FIELDS) + [field for processor in processors.values() for field in processor.required_fields] + list(fields)
+    return tuple(dict.fromkeys(union))
+
+
 def process_documents(
         documents: list[dict], 
         which: str | list | tuple = "all", 
         docket_data_source: str = "dockets", 
         del_keys: str | list | tuple | None = None, 
+        agency_metadata: tuple[dict, list] | None = None, 
         **kwargs
     ) -> list[dict]:
     """Process one or more fields in each document.
@@ -22,6 +80,8 @@ def process_documents(
         which (str | list | tuple, optional): Which fields to process per document. Defaults to "all". Valid inputs include "all" or some combination of "agencies", "dockets", "presidents", "rin".
         docket_data_source (str, optional): Select which field to use as a source for processing dockets data. Defaults to "dockets". Valid inputs include "regulations_dot_gov_info" and "dockets".
         del_keys (str | list | tuple, optional): Delete select keys from results. Defaults to None.
+        agency_metadata (tuple[dict, list], optional): Metadata and schema from `AgencyMetadata().get_agency_metadata()`, for reuse across calls. 
+        Defaults to None (retrieved from the API when processing agencies).
 
     Raises:
         PreprocessingError: Failed to preprocess input documents.
@@ -29,51 +89,83 @@ def process_documents(
     Returns:
         list[dict]: Processed documents.
     """
-    # dictionary of alternative sources
-    source_dict = {
-        "dockets": Dockets, 
-        "regulations_dot_gov_info": RegsDotGovData
-        }
-    
-    # maps keyword to class
-    process_fields = {
-        "agencies": AgencyData, 
-        "dockets": source_dict.get(docket_data_source, Dockets), 
-        "presidents": Presidents, 
-        "rin": RegInfoData, 
-        }
-    
     # process documents
-    if (which == "all") or ("all" in which and isinstance(which, (list, tuple))):
-    
-        for field, function in process_fields.items():
-            if field == "agencies":
-                metadata, schema = AgencyMetadata().get_agency_metadata()
-                documents = function(documents, metadata, schema).process_data(**kwargs)
-            else:
-                documents = function(documents).process_data()
-    
-    elif isinstance(which, str) and (which in process_fields.keys()):
-        if which == "agencies":
-            metadata, schema = AgencyMetadata().get_agency_metadata()
-            documents = process_fields[which](documents, metadata, schema).process_data(**kwargs)
+    for field, function in _select_processors(which, docket_data_source).items():
+        if field == "agencies":
+            metadata, schema = agency_metadata if agency_metadata is not None else AgencyMetadata().get_agency_metadata()
+            documents = function(documents, metadata, schema).process_data(**kwargs)
         else:
-            documents = process_fields[which](documents).process_data()
-    
-    elif isinstance(which, (list, tuple)):
-        valid_fields = (w for w in which if w in process_fields.keys())
-        for field in valid_fields:
-            if field == "agencies":
-                metadata, schema = AgencyMetadata().get_agency_metadata()
-                documents = process_fields[field](documents, metadata, schema).process_data(**kwargs)
-            else:
-                documents = process_fields[field](documents).process_data()
-    
-    else:
-        raise PreprocessingError("Failed to preprocess input documents.")
-    
+            documents = function(documents).process_data()
+
     # delete keys if passed
     if del_keys is not None:
         return [{k: v for k, v in doc.items() if ((k != del_keys) and (k not in del_keys))} for doc in documents]
     else:
         return documents
+
+
+def get_processed_documents_by_date(
+        start_date: str | date, 
+        end_date: str | date | None = None, 
+        which: str | list | tuple = "all", 
+        fields: tuple | list = (), 
+        docket_data_source: str = "dockets", 
+        del_keys: str | list | tuple | None = None, 
+        process_kwargs: dict | None = None, 
+        **kwargs
+    ) -> tuple[list[dict], int]:
+    """Retrieve documents using a date range and process them, requesting only the fields that processing needs.
+
+    Args:
+        start_date (str | date): Start of date range (inclusive).
+        end_date (str | date, optional): End of date range (inclusive). Defaults to None (today).
+        which (str | list | tuple, optional): Which fields to process per document. Defaults to "all". See `process_documents`.
+        fields (tuple | list, optional): Additional fields to retrieve and keep unprocessed. Defaults to ().
+        docket_data_source (str, optional): Select which field to use as a source for processing dockets data. Defaults to "dockets".
+        del_keys (str | list | tuple, optional): Delete select keys from results. Defaults to None.
+        process_kwargs (dict, optional): Keyword arguments for processing agency data (see `AgencyData.process_data`). Defaults to None.
+        **kwargs: Keyword arguments for `get_documents_by_date` (e.g., document_types, max_workers, client).
+
+    Returns:
+        tuple[list[dict], int]: Tuple of processed documents, count of documents retrieved.
+    """
+    documents, count = get_documents_by_date(
+        start_date, 
+        end_date, 
+        fields=required_fields(which, docket_data_source, fields), 
+        **kwargs
+        )
+    documents = process_documents(documents, which=which, docket_data_source=docket_data_source, del_keys=del_keys, **(process_kwargs or {}))
+    return documents, count
+
+
+def get_processed_documents_by_number(
+        document_numbers: list, 
+        which: str | list | tuple = "all", 
+        fields: tuple | list = (), 
+        docket_data_source: str = "dockets", 
+        del_keys: str | list | tuple | None = None, 
+        process_kwargs: dict | None = None, 
+        **kwargs
+    ) -> tuple[list[dict], int]:
+    """Retrieve documents using a list of document numbers and process them, requesting only the fields that processing needs.
+
+    Args:
+        document_numbers (list): Documents to retrieve based on "document_number" field.
+        which (str | list | tuple, optional): Which fields to process per document. Defaults to "all". See `process_documents`.
+        fields (tuple | list, optional): Additional fields to retrieve and keep unprocessed. Defaults to ().
+        docket_data_source (str, optional): Select which field to use as a source for processing dockets data. Defaults to "dockets".
+        del_keys (str | list | tuple, optional): Delete select keys from results. Defaults to None.
+        process_kwargs (dict, optional): Keyword arguments for processing agency data (see `AgencyData.process_data`). Defaults to None.
+        **kwargs: Keyword arguments for `get_documents_by_number` (e.g., sort_data, max_workers, client).
+
+    Returns:
+        tuple[list[dict], int]: Tuple of processed documents, count of documents retrieved.
+    """
+    documents, count = get_documents_by_number(
+        document_numbers, 
+        fields=required_fields(which, docket_data_source, fields), 
+        **kwargs
+        )
+    documents = process_documents(documents, which=which, docket_data_source=docket_data_source, del_keys=del_keys, **(process_kwargs or {}))
+    return documents, count
@@ -2,7 +2,11 @@ from abc import ABC, abstractmethod
 
 
 class FieldData(ABC):
-    """Base class for processing Federal Register fields."""    
+    """Base class for processing Federal Register fields.
+    Subclasses declare the raw API fields they read in `required_fields`, so callers can request only those fields.
+    """
+    required_fields: tuple[str, ...] = ()
+
     def __init__(self, 
                  documents: list[dict], 
                  field_key: str | None = None,
@@ -0,0 +1,222 @@
+"""
+Pipeline that overlaps retrieving documents with processing them.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date
+import json
+from pathlib import Path
+import queue
+import threading
+
+from .agencies import AgencyMetadata
+from .documents import _select_processors, process_documents, required_fields
+from ..api_requests import FederalRegisterClient, iter_documents_by_date
+
+
+# sentinel telling a processor worker that no more batches will arrive
+_DONE = object()
+
+
+class JsonLinesSink:
+    """Sink writing each processed document as one line of JSON.
+
+    Args:
+        path (Path | str): Output file.
+        mode (str, optional): File mode; use "a" to append to an existing file. Defaults to "w".
+    """
+    def __init__(self, path: Path | str, mode: str = "w") -> None:
+        self.path = Path(path).expanduser()
+        self.file = open(self.path, mode, encoding="utf-8")
+
+    def __call__(self, documents: list[dict]) -> None:
+        self.file.writelines(f"{json.dumps(doc)}\n" for doc in documents)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _batches(documents: Iterable[dict], batch_size: int) -> Iterator[list[dict]]:
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def process_documents_pipeline(
+        documents: Iterable[dict],
+        which: str | list | tuple = "all",
+        docket_data_source: str = "dockets",
+        del_keys: str | list | tuple | None = None,
+        sink: Callable[[list[dict]], None] | None = None,
+        batch_size: int = 1000,
+        processor_workers: int = 1,
+        queue_size: int = 4,
+        process_kwargs: dict | None = None,
+        client: FederalRegisterClient | None = None
+    ) -> tuple[list[dict], int]:
+    """Process documents while they are still being retrieved.
+
+    A fetcher thread consumes `documents` (e.g., the generator returned by `iter_documents_by_date`) and pushes batches into a bounded queue;
+    processor workers run the selected `process_documents` stages on each batch and pass the results to `sink`.
+    The fetcher waits while the queue is full, so at most `queue_size` batches are held in memory between the two stages.
+
+    Args:
+        documents (Iterable[dict]): Documents to process, typically a generator that retrieves them lazily.
+        which (str | list | tuple, optional): Which fields to process per document. Defaults to "all". See `process_documents`.
+        docket_data_source (str, optional): Select which field to use as a source for processing dockets data. Defaults to "dockets".
+        del_keys (str | list | tuple, optional): Delete select keys from results. Defaults to None.
+        sink (Callable[[list[dict]], None], optional): Receives each batch of processed documents (e.g., `JsonLinesSink`).
+        Defaults to None (processed documents are returned).
+        batch_size (int, optional): Number of documents per batch. Defaults to 1000 (one page of API results).
+        processor_workers (int, optional): Number of threads processing batches. Batches reach `sink` in order only with one worker. Defaults to 1.
+        queue_size (int, optional): Maximum number of batches waiting to be processed. Defaults to 4.
+        process_kwargs (dict, optional): Keyword arguments for processing agency data (see `AgencyData.process_data`). Defaults to None.
+        client (FederalRegisterClient, optional): Client for requesting agency metadata. Defaults to None (uses shared default client).
+
+    Raises:
+        PreprocessingError: Invalid value for `which`.
+
+    Returns:
+        tuple[list[dict], int]: Tuple of processed documents (empty when `sink` is passed), count of documents processed.
+    """
+    processors = _select_processors(which, docket_data_source)
+    agency_metadata = AgencyMetadata(client=client).get_agency_metadata() if "agencies" in processors else None
+    process_kwargs = process_kwargs or {}
+
+    batches = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    lock = threading.Lock()
+    errors = []
+    processed = {}
+    count = 0
+
+    def put(item) -> bool:
+        # block while the queue is full, unless another thread failed
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch() -> None:
+        try:
+            for item in enumerate(_batches(documents, batch_size)):
+                if not put(item):
+                    return
+        except BaseException as err:
+            errors.append(err)
+            stop.set()
+        finally:
+            for _ in range(processor_workers):
+                put(_DONE)
+
+    def process() -> None:
+        nonlocal count
+        while True:
+            try:
+                item = batches.get(timeout=0.1)
+            except queue.Empty:
+                if stop.is_set():
+                    return
+                continue
+            if (item is _DONE) or stop.is_set():
+                return
+            index, batch = item
+            try:
+                results = process_documents(
+                    batch,
+                    which=which,
+                    docket_data_source=docket_data_source,
+                    del_keys=del_keys,
+                    agency_metadata=agency_metadata,
+                    **process_kwargs
+                    )
+                with lock:
+                    if sink is None:
+                        processed[index] = results
+                    else:
+                        sink(results)
+                    count += len(results)
+            except BaseException as err:
+                errors.append(err)
+                stop.set()
+                return
+
+    threads = [threading.Thread(target=fetch, daemon=True)]
+    threads.extend(threading.Thread(target=process, daemon=True) for _ in range(processor_workers))
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    except BaseException:
+        stop.set()
+        raise
+
+    if errors:
+        raise errors[0]
+    return [doc for index in sorted(processed) for doc in processed[index]], count
+
+
+def process_documents_by_date_pipeline(
+        start_date: str | date,
+        end_date: str | date | None = None,
+        which: str | list | tuple = "all",
+        fields: tuple | list = (),
+        docket_data_source: str = "dockets",
+        del_keys: str | list | tuple | None = None,
+        sink: Callable[[list[dict]], None] | None = None,
+        processor_workers: int = 1,
+        queue_size: int = 4,
+        process_kwargs: dict | None = None,
+        **kwargs
+    ) -> tuple[list[dict], int]:
+    """Retrieve documents using a date range and process each page while the next pages are being retrieved,
+    requesting only the fields that processing needs. See `process_documents_pipeline`.
+
+    Args:
+        start_date (str | date): Start of date range (inclusive).
+        end_date (str | date, optional): End of date range (inclusive). Defaults to None (today).
+        which (str | list | tuple, optional): Which fields to process per document. Defaults to "all". See `process_documents`.
+        fields (tuple | list, optional): Additional fields to retrieve and keep unprocessed. Defaults to ().
+        docket_data_source (str, optional): Select which field to use as a source for processing dockets data. Defaults to "dockets".
+        del_keys (str | list | tuple, optional): Delete select keys from results. Defaults to None.
+        sink (Callable[[list[dict]], None], optional): Receives each batch of processed documents. Defaults to None (processed documents are returned).
+        processor_workers (int, optional): Number of threads processing batches. Defaults to 1.
+        queue_size (int, optional): Maximum number of pages waiting to be processed. Defaults to 4.
+        process_kwargs (dict, optional): Keyword arguments for processing agency data (see `AgencyData.process_data`). Defaults to None.
+        **kwargs: Keyword arguments for `iter_documents_by_date` (e.g., document_types, client); the client also requests the agency metadata.
+
+    Returns:
+        tuple[list[dict], int]: Tuple of processed documents (empty when `sink` is passed), count of documents processed.
+    """
+    documents = iter_documents_by_date(
+        start_date,
+        end_date,
+        fields=required_fields(which, docket_data_source, fields),
+        **kwargs
+        )
+    return process_documents_pipeline(
+        documents,
+        which=which,
+        docket_data_source=docket_data_source,
+        del_keys=del_keys,
+        sink=sink,
+        processor_workers=processor_workers,
+        queue_size=queue_size,
+        process_kwargs=process_kwargs,
+        client=kwargs.get("client"),
+        )
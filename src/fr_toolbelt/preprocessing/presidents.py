@@ -5,6 +5,8 @@ class Presidents(FieldData):
     """Class for processing president data.
     Inherits from `FieldData`.
     """    
+    required_fields = ("president", )
+
     def __init__(
             self, 
             documents: list[dict], 
@@ -5,6 +5,8 @@ class RegInfoData(FieldData):
     """Class for processing Regulation Identifier Number (RIN) data (sourced from [RegInfo](https://www.reginfo.gov/public/jsp/Utilities/faq.jsp#dashboard)).
     Inherits from `FieldData`.
     """
+    required_fields = ("regulation_id_number_info", )
+
     def __init__(self, 
                  documents: list[dict], 
                  field_key: str = "regulation_id_number_info", 
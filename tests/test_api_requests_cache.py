@@ -0,0 +1,104 @@
+from datetime import date, timedelta
+from multiprocessing import Pool
+
+import pytest
+
+from fr_toolbelt.api_requests import ResponseCache
+from fr_toolbelt.api_requests.cache import cache_key, conditional_headers, normalize_url
+
+
+# TEST OBJECTS AND UTILS #
+
+
+ENDPOINT_URL = r"https://www.federalregister.gov/api/v1/documents.json?"
+
+TEST_PARAMS = {
+    "per_page": 1000, 
+    "page": 0, 
+    "order": "oldest", 
+    "conditions[publication_date][gte]": "2023-11-01", 
+    "conditions[publication_date][lte]": "2023-11-30", 
+    "fields[]": ["document_number", "title"], 
+    }
+
+TEST_BODY = b'{"count": 1, "results": [{"document_number": "2023-24001"}]}'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path)
+
+
+def _set_in_process(args):
+    path, n = args
+    ResponseCache(path).set(ENDPOINT_URL, TEST_BODY, params={"page": n})
+    return n
+
+
+# api_requests.cache #
+
+
+def test_normalize_url_param_order():
+    reversed_params = dict(reversed(list(TEST_PARAMS.items())))
+    assert normalize_url(ENDPOINT_URL, TEST_PARAMS) == normalize_url(ENDPOINT_URL, reversed_params)
+    assert cache_key(ENDPOINT_URL, TEST_PARAMS) == cache_key(ENDPOINT_URL, reversed_params)
+
+
+def test_cache_set_get(cache):
+    assert cache.get(ENDPOINT_URL, TEST_PARAMS) is None
+    cache.set(ENDPOINT_URL, TEST_BODY, params=TEST_PARAMS, headers={"Content-Type": "application/json"})
+    body, headers = cache.get(ENDPOINT_URL, TEST_PARAMS)
+    assert body == TEST_BODY
+    assert headers.get("Content-Type") == "application/json"
+    assert len(cache) == 1
+
+
+def test_cache_expired(cache):
+    cache.set(ENDPOINT_URL, TEST_BODY, params=TEST_PARAMS, ttl=-1)
+    assert cache.get(ENDPOINT_URL, TEST_PARAMS) is None
+
+
+def test_cache_stale(tmp_path):
+    cache = ResponseCache(tmp_path, max_stale=3600)
+    cache.set(ENDPOINT_URL, TEST_BODY, params=TEST_PARAMS, ttl=0)
+    cache.evict()
+    assert cache.get(ENDPOINT_URL, params=TEST_PARAMS) is None
+    assert cache.get(ENDPOINT_URL, params=TEST_PARAMS, stale=True)[0] == TEST_BODY
+
+
+def test_cache_revalidation(cache, headers = {"ETag": '"v1"', "Last-Modified": "Wed, 01 May 2024 00:00:00 GMT"}):
+    cache.set(ENDPOINT_URL, TEST_BODY, params=TEST_PARAMS, headers=headers, ttl=-1)
+    cache.evict()
+    assert cache.get(ENDPOINT_URL, TEST_PARAMS) is None
+    body, stored = cache.get_expired(ENDPOINT_URL, TEST_PARAMS)
+    assert body == TEST_BODY
+    assert conditional_headers(stored) == {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 May 2024 00:00:00 GMT"}
+    
+    cache.refresh(ENDPOINT_URL, TEST_PARAMS, headers={"ETag": '"v2"'}, ttl=60)
+    assert cache.get_expired(ENDPOINT_URL, TEST_PARAMS) is None
+    assert cache.get(ENDPOINT_URL, TEST_PARAMS) == (TEST_BODY, {**headers, "ETag": '"v2"'})
+
+
+def test_cache_ttl_historical(cache):
+    assert cache.ttl_for(normalize_url(ENDPOINT_URL, TEST_PARAMS)) is None
+    recent = {"conditions[publication_date][lte]": f"{date.today() - timedelta(days=1)}"}
+    assert cache.ttl_for(normalize_url(ENDPOINT_URL, recent)) == cache.ttl
+
+
+def test_cache_lru_eviction(tmp_path, n_entries: int = 3):
+    cache = ResponseCache(tmp_path)
+    cache.set(ENDPOINT_URL, TEST_BODY, params={"page": 0})
+    cache.max_size = cache.size * n_entries
+    for n in range(1, n_entries):
+        cache.set(ENDPOINT_URL, TEST_BODY, params={"page": n})
+    assert cache.get(ENDPOINT_URL, {"page": 0}) is not None  # most recently used
+    cache.set(ENDPOINT_URL, TEST_BODY, params={"page": n_entries})
+    assert len(cache) == n_entries
+    assert cache.get(ENDPOINT_URL, {"page": 1}) is None  # least recently used
+    assert cache.get(ENDPOINT_URL, {"page": 0}) is not None
+
+
+def test_cache_multiprocess(tmp_path, n_entries: int = 8):
+    with Pool(4) as pool:
+        assert sorted(pool.map(_set_in_process, [(tmp_path, n) for n in range(n_entries)])) == list(range(n_entries))
+    assert len(ResponseCache(tmp_path)) == n_entries
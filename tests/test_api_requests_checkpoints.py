@@ -0,0 +1,47 @@
+from datetime import date
+
+from fr_toolbelt.api_requests.checkpoints import WindowCheckpoint
+
+
+# TEST OBJECTS AND UTILS #
+
+
+TEST_PARAMS = {
+    "per_page": 1000, 
+    "page": 0, 
+    "order": "oldest", 
+    "conditions[publication_date][gte]": "2020-01-01", 
+    "conditions[publication_date][lte]": "2021-12-31", 
+    "fields[]": ("document_number", "title"), 
+    }
+
+TEST_WINDOWS = [
+    (date(2020, 1, 1), date(2020, 12, 31), 2), 
+    (date(2021, 1, 1), date(2021, 12, 31), 1), 
+    ]
+
+
+# api_requests.checkpoints #
+
+
+def test_checkpoint_plan(tmp_path):
+    checkpoint = WindowCheckpoint(tmp_path, TEST_PARAMS)
+    assert checkpoint.load_plan() is None
+    checkpoint.save_plan(TEST_WINDOWS)
+    assert WindowCheckpoint(tmp_path, TEST_PARAMS).load_plan() == TEST_WINDOWS
+
+
+def test_checkpoint_windows(tmp_path):
+    checkpoint = WindowCheckpoint(tmp_path, TEST_PARAMS)
+    results = [{"document_number": "2020-00001"}, {"document_number": "2020-00002"}]
+    checkpoint.save(TEST_WINDOWS[0], results)
+    restarted = WindowCheckpoint(tmp_path, {**TEST_PARAMS, "page": 3})
+    assert restarted.completed(TEST_WINDOWS[0])
+    assert restarted.load(TEST_WINDOWS[0]) == results
+    assert not restarted.completed(TEST_WINDOWS[1])
+
+
+def test_checkpoint_separate_queries(tmp_path):
+    WindowCheckpoint(tmp_path, TEST_PARAMS).save(TEST_WINDOWS[0], [])
+    other = WindowCheckpoint(tmp_path, {**TEST_PARAMS, "conditions[type][]": ["RULE"]})
+    assert not other.completed(TEST_WINDOWS[0])
@@ -0,0 +1,245 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import json
+import threading
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from fr_toolbelt.api_requests import (
+    AsyncFederalRegisterClient, 
+    CircuitBreaker, 
+    CircuitOpenError, 
+    FederalRegisterClient, 
+    RateLimiter, 
+    ResponseCache, 
+    get_default_client, 
+    get_documents_by_date, 
+    )
+
+
+# TEST OBJECTS AND UTILS #
+
+
+class StubAdapter(HTTPAdapter):
+    """Adapter answering each request with `handler(request)`, which returns a status code, body, and headers (or raises), instead of sending it."""
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.requests = []
+    
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status_code, body, headers = self.handler(request)
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = body
+        response.headers.update(headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def _stub_client(handler, **kwargs) -> tuple[FederalRegisterClient, StubAdapter]:
+    client = FederalRegisterClient(**kwargs)
+    client._adapter = adapter = StubAdapter(handler)
+    return client, adapter
+
+
+def _get_concurrently(function, callers: int = 8) -> list:
+    barrier = threading.Barrier(callers)
+    
+    def call(_):
+        barrier.wait()
+        return function()
+    
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        return list(executor.map(call, range(callers)))
+
+
+# api_requests.client #
+
+
+def test_default_client_is_shared():
+    assert get_default_client() is get_default_client()
+
+
+def test_client_headers(headers = {"X-Test": "fr-toolbelt"}):
+    client = FederalRegisterClient(headers=headers)
+    assert client.session.headers.get("X-Test") == "fr-toolbelt"
+    assert client.session.headers.get("Accept") == "application/json"
+    client.close()
+
+
+def test_client_sessions_share_pool(n_threads: int = 4):
+    with FederalRegisterClient(pool_maxsize=n_threads) as client:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            sessions = list(executor.map(lambda _: client.session, range(n_threads * 2)))
+        adapters = set(id(s.get_adapter("https://www.federalregister.gov")) for s in sessions)
+        assert len(adapters) == 1
+        assert client.session is client.session
+
+
+def test_client_releases_sessions_of_finished_threads(n_pools: int = 10, n_threads: int = 4):
+    with FederalRegisterClient() as client:
+        for _ in range(n_pools):
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                list(executor.map(lambda _: client.session, range(n_threads * 2)))
+        gc.collect()
+        assert len(client._sessions) == 0
+
+
+def test_client_circuit_breaker_fails_fast(url = "https://www.federalregister.gov/api/v1/documents.json"):
+    breaker = CircuitBreaker(window=2, min_requests=2, reset_timeout=60)
+    client, adapter = _stub_client(lambda request: (503, b"", {}), circuit_breaker=breaker)
+    assert [client.get(url).status_code for _ in range(2)] == [503, 503]
+    with pytest.raises(CircuitOpenError):
+        client.get(url)
+    assert len(adapter.requests) == 2
+
+
+def test_client_circuit_breaker_serves_stale(
+        tmp_path, 
+        url = "https://www.federalregister.gov/api/v1/agencies.json", 
+        other_url = "https://www.federalregister.gov/api/v1/documents.json"
+    ):
+    
+    def handler(request):
+        return (200, b'{"ok": true}', {}) if request.url == url else (503, b"", {})
+    
+    breaker = CircuitBreaker(window=1, min_requests=1, reset_timeout=60)
+    cache = ResponseCache(tmp_path, ttl=0.05, max_stale=3600)
+    client, adapter = _stub_client(handler, circuit_breaker=breaker, cache=cache)
+    client.get(url)
+    client.get(other_url)
+    time.sleep(0.1)
+    assert breaker.state == CircuitBreaker.OPEN
+    response = client.get(url)  # expired, but served from the cache while the breaker is open
+    assert (response.status_code, response.content) == (200, b'{"ok": true}')
+    with pytest.raises(CircuitOpenError):
+        client.get(other_url)
+    assert len(adapter.requests) == 2
+
+
+def test_client_circuit_breaker_records_raised_errors(url = "https://www.federalregister.gov/api/v1/documents.json"):
+    errors = [requests.ConnectionError("refused"), requests.exceptions.InvalidURL("bad url")]
+    
+    def handler(request):
+        raise errors.pop(0)
+    
+    breaker = CircuitBreaker(window=1, min_requests=1, reset_timeout=0)
+    client, _ = _stub_client(handler, circuit_breaker=breaker)
+    with pytest.raises(requests.ConnectionError):
+        client.get(url)
+    assert breaker.state == CircuitBreaker.OPEN  # transport errors are failures of the API
+    with pytest.raises(requests.exceptions.InvalidURL):
+        client.get(url)  # the probe ends with an invalid request, which is not counted
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.before_request()  # the next request can probe again
+
+
+def test_async_client_circuit_breaker_cancelled_probe(url = "https://www.federalregister.gov/api/v1/documents.json"):
+    httpx = pytest.importorskip("httpx")
+    
+    async def run():
+        breaker = CircuitBreaker(window=1, min_requests=1, reset_timeout=0.05)
+        limiter = RateLimiter(0.5, burst=1)
+        limiter.acquire()  # the probe waits about two seconds for the next token
+        async with AsyncFederalRegisterClient(circuit_breaker=breaker, rate_limiter=limiter) as client:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+            breaker.record_failure()
+            await asyncio.sleep(0.1)
+            probe = asyncio.ensure_future(client.get(url))
+            await asyncio.sleep(0.05)
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+            assert breaker.state == CircuitBreaker.OPEN
+            client.rate_limiter = None
+            assert (await client.get(url)).status_code == 200
+            assert breaker.state == CircuitBreaker.CLOSED
+    
+    asyncio.run(run())
+
+
+def test_async_client_circuit_breaker_ignores_cancelled_requests(url = "https://www.federalregister.gov/api/v1/documents.json", n_requests: int = 8):
+    httpx = pytest.importorskip("httpx")
+    
+    async def handler(request):
+        await asyncio.sleep(1)
+        return httpx.Response(200)
+    
+    async def run():
+        breaker = CircuitBreaker(window=n_requests, min_requests=1)
+        async with AsyncFederalRegisterClient(circuit_breaker=breaker) as client:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            tasks = [asyncio.ensure_future(client.get(url)) for _ in range(n_requests)]
+            await asyncio.sleep(0.05)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return breaker
+    
+    assert asyncio.run(run()).state == CircuitBreaker.CLOSED
+
+
+def test_client_revalidates_expired_cache(
+        tmp_path, 
+        url = "https://www.federalregister.gov/api/v1/agencies.json", 
+        headers = {"ETag": '"v1"', "Last-Modified": "Wed, 01 May 2024 00:00:00 GMT"}
+    ):
+    sent_headers = []
+    
+    def handler(request):
+        sent_headers.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == headers["ETag"]:
+            return 304, b"", {"ETag": headers["ETag"]}
+        return 200, b'{"ok": true}', headers
+    
+    ttl = {"seconds": -1}  # stored already expired, then refreshed for a minute
+    cache = ResponseCache(tmp_path, ttl_func=lambda url: ttl["seconds"])
+    client, adapter = _stub_client(handler, cache=cache)
+    assert client.get(url).content == b'{"ok": true}'
+    assert "If-None-Match" not in sent_headers[0]
+    
+    ttl["seconds"] = 60
+    response = client.get(url)
+    assert sent_headers[1]["If-None-Match"] == headers["ETag"]
+    assert sent_headers[1]["If-Modified-Since"] == headers["Last-Modified"]
+    assert (response.status_code, response.content) == (200, b'{"ok": true}')
+    
+    assert client.get(url).content == b'{"ok": true}'  # the refreshed entry is fresh again
+    assert len(adapter.requests) == 2
+
+
+def test_client_coalesces_requests(url = "https://www.federalregister.gov/api/v1/agencies.json"):
+    
+    def handler(request):
+        time.sleep(0.3)  # keep the request in flight while the other threads arrive
+        return 200, b'{"ok": true}', {}
+    
+    client, adapter = _stub_client(handler, coalesce=True)
+    responses = _get_concurrently(lambda: client.get(url))
+    assert all(response.content == b'{"ok": true}' for response in responses)
+    assert len(adapter.requests) == 1
+
+
+def test_get_documents_by_date_coalesced_copies(start = "2024-01-02", end = "2024-01-05"):
+    documents = [{"document_number": "2024-00001", "publication_date": "2024-01-02"}]
+    
+    def handler(request):
+        time.sleep(0.3)
+        return 200, json.dumps({"count": len(documents), "total_pages": 1, "results": documents}).encode(), {}
+    
+    client, adapter = _stub_client(handler, coalesce=True)
+    outcomes = _get_concurrently(lambda: get_documents_by_date(start, end, client=client))
+    assert len(adapter.requests) == 1
+    assert all(outcome == (documents, 1) for outcome in outcomes)
+    results = [outcome[0] for outcome in outcomes]
+    assert len({id(r) for r in results}) == len(results)  # each caller receives its own copy
+    results[0][0]["title"] = "changed"
+    assert all("title" not in r[0] for r in results[1:])
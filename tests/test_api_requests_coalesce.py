@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+import threading
+
+import pytest
+
+from fr_toolbelt.api_requests.coalesce import SingleFlight
+
+
+# TEST OBJECTS AND UTILS #
+
+
+def _run_concurrently(single_flight: SingleFlight, function, callers: int = 8) -> list:
+    barrier = threading.Barrier(callers)
+    
+    def call(_):
+        barrier.wait()
+        return single_flight.do("key", function)
+    
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        return list(executor.map(call, range(callers)))
+
+
+# api_requests.coalesce #
+
+
+def test_single_flight_shares_call():
+    calls = []
+    release = threading.Event()
+    
+    def function():
+        calls.append(1)
+        release.wait(timeout=1)
+        return [{"document_number": "2024-00001"}]
+    
+    single_flight = SingleFlight(copy=deepcopy)
+    threading.Timer(0.2, release.set).start()
+    results = _run_concurrently(single_flight, function)
+    assert len(calls) == 1
+    assert all(r == [{"document_number": "2024-00001"}] for r in results)
+    assert len({id(r) for r in results}) == len(results)  # each caller receives its own copy
+    assert single_flight.in_flight() == 0
+
+
+def test_single_flight_shares_exception():
+    release = threading.Event()
+    
+    def function():
+        release.wait(timeout=1)
+        raise ValueError("failed")
+    
+    single_flight = SingleFlight()
+    threading.Timer(0.2, release.set).start()
+    with pytest.raises(ValueError):
+        _run_concurrently(single_flight, function)
+    assert single_flight.in_flight() == 0
+
+
+def test_single_flight_sequential_calls():
+    single_flight = SingleFlight()
+    calls = []
+    for _ in range(3):
+        single_flight.do("key", lambda: calls.append(1))
+    assert len(calls) == 3
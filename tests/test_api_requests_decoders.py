@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from fr_toolbelt.api_requests import FederalRegisterClient
+from fr_toolbelt.api_requests.decoders import (
+    DECODERS, 
+    benchmark_decoders, 
+    get_decoder, 
+    )
+
+
+# TEST OBJECTS AND UTILS #
+
+
+TEST_PAGE = {
+    "count": 2, 
+    "total_pages": 1, 
+    "next_page_url": None, 
+    "results": [
+        {"document_number": "2024-02204", "title": "Example é", "agencies": [{"slug": "a", "id": 1}]}, 
+        {"document_number": "2023-28203", "title": "Example", "agencies": []}, 
+        ], 
+    }
+TEST_BODY = json.dumps(TEST_PAGE).encode("utf-8")
+
+
+# api_requests.decoders #
+
+
+@pytest.mark.parametrize("name", list(DECODERS))
+def test_decoders_match_stdlib(name: str, body: bytes = TEST_BODY):
+    assert DECODERS[name](body) == json.loads(body)
+
+
+@pytest.mark.parametrize("name", list(DECODERS))
+def test_decoders_raise_json_error(name: str, body: bytes = b'{"count": 1, "results": ['):
+    with pytest.raises(json.JSONDecodeError):
+        DECODERS[name](body)
+
+
+def test_get_decoder():
+    assert get_decoder() is next(iter(DECODERS.values()))
+    assert get_decoder("json") is DECODERS["json"]
+    assert get_decoder(len) is len
+    with pytest.raises(ValueError):
+        get_decoder("not-a-decoder")
+
+
+def test_client_decoder(body: bytes = TEST_BODY):
+    client = FederalRegisterClient(decoder="json")
+    assert client.decode is DECODERS["json"]
+    client.close()
+
+
+def test_benchmark_decoders(body: bytes = TEST_BODY):
+    rates = benchmark_decoders(body, number=5)
+    assert set(rates) == set(DECODERS)
+    assert all(rate > 0 for rate in rates.values())
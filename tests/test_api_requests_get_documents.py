@@ -3,14 +3,31 @@ import json
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import pytest
+import requests
 from requests import get
 
 from fr_toolbelt.api_requests import (
     _retrieve_results_by_next_page, 
+    count_documents_by_period, 
     get_documents_by_date, 
     get_documents_by_number, 
+    iter_documents_by_date, 
+    iter_documents_by_number, 
     _get_documents_by_batch,
     )
+from fr_toolbelt.api_requests.checkpoints import WindowCheckpoint
+from fr_toolbelt.api_requests.get_documents import (
+    BatchQueryError, 
+    IncompleteResultsError, 
+    QueryError, 
+    _incomplete_days, 
+    _query_documents_endpoint, 
+    _retrieve_results_by_page_range, 
+    _retrieve_results_by_window, 
+    _split_likely, 
+    pack_document_numbers, 
+    )
 
 
 # TEST OBJECTS AND UTILS #
@@ -47,6 +64,33 @@ with open(TESTS_PATH / "test_documents.json", "r", encoding="utf-8") as f:
     TEST_DATA = json.load(f).get("results", [])
 
 
+class FakeClient:
+    """Client answering each request with `handler(url, params)`, which returns a status code and a JSON body, instead of calling the API."""
+    coalesce = False
+    
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+    
+    def get(self, url: str, params: dict | None = None, **kwargs) -> requests.Response:
+        params = dict(params or {})
+        self.requests.append((url, params))
+        status_code, body = self.handler(url, params)
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = url
+        response._content = json.dumps(body).encode()
+        response._content_consumed = True
+        return response
+    
+    def json(self, response: requests.Response):
+        return json.loads(response.content)
+
+
+def _requested_numbers(url: str) -> list[str]:
+    return url.split("/documents/", 1)[1].split(".json", 1)[0].split(",")
+
+
 # api_requests.get_documents #
 
 
@@ -69,6 +113,18 @@ def test_retrieve_results_by_next_page_partial(
     assert len(results) == 10000, f"Should return 10,000; compare to API call: {TEST_URL_PARTIAL}"
 
 
+def test_retrieve_results_by_page_range_workers(
+    endpoint_url: str = ENDPOINT_URL, 
+    dict_params: dict = TEST_PARAMS_FULL, 
+    test_response = TEST_RESPONSE_FULL
+    ):
+    
+    results = _retrieve_results_by_page_range(None, endpoint_url, dict_params, max_workers=4)
+    results_serial = _retrieve_results_by_next_page(endpoint_url, dict_params)
+    assert len(results) == test_response.get("count")
+    assert [r.get("document_number") for r in results] == [r.get("document_number") for r in results_serial]
+
+
 def test_get_documents_by_date(start = "2024-01-01", end = "2024-01-31"):
     results, count = get_documents_by_date(start, end)
     assert isinstance(results, list)
@@ -145,3 +201,207 @@ def test_get_documents_by_batch(batch_size: int = 250):
     assert isinstance(results_b, list)
     assert isinstance(count_b, int)
     assert count_a == len(results_a) == count_b == len(results_b)
+
+
+def test_get_documents_by_number_max_workers(numbers = ["2024-02204", "2023-28203", "2023-25797"]):
+    results, count = get_documents_by_number(numbers, sort_data=False, max_workers=2)
+    assert count == len(results) == len(numbers)
+    assert [doc.get("document_number") for doc in results] == numbers
+
+
+def test_count_documents_by_period(start = "2024-01-01", end = "2024-01-31"):
+    results, count = get_documents_by_date(start, end)
+    daily_counts = count_documents_by_period(start, end)
+    assert sum(daily_counts.values()) == count
+    assert all(date.fromisoformat(start) <= day <= date.fromisoformat(end) for day in daily_counts)
+
+
+def test_pack_document_numbers(numbers = [f"2024-{n:05d}" for n in range(1000)], max_url_bytes: int = 2000):
+    batches = pack_document_numbers(numbers, max_url_bytes=max_url_bytes)
+    assert [n for batch in batches for n in batch] == numbers
+    assert len(batches) > 1
+    assert len(pack_document_numbers(numbers, max_url_bytes=10**6, max_batch_size=250)) == 4
+
+
+def test_get_documents_by_date_max_workers(start = "2022-01-01", end = "2022-12-31"):
+    results_a, count_a = get_documents_by_date(start, end)
+    results_b, count_b = get_documents_by_date(start, end, max_workers=4)
+    assert count_a == count_b == len(results_b)
+    assert [r.get("document_number") for r in results_a] == [r.get("document_number") for r in results_b]
+
+
+def test_iter_documents_by_date(start = "2022-01-01", end = "2022-12-31"):
+    results, count = get_documents_by_date(start, end)
+    documents = iter_documents_by_date(start, end)
+    assert not isinstance(documents, list)
+    assert [r.get("document_number") for r in documents] == [r.get("document_number") for r in results]
+
+
+def test_iter_documents_by_number(numbers = ["2024-02204", "2023-28203", "2023-25797"]):
+    documents = list(iter_documents_by_number(numbers, batch_size=2))
+    assert len(documents) == len(numbers)
+    assert set(doc.get("document_number") for doc in documents) == set(numbers)
+
+
+def test_get_documents_by_date_known_document_numbers(start = "2024-01-02", end = "2024-01-05"):
+    results, count = get_documents_by_date(start, end)
+    unknown = [r.get("document_number") for r in results[10:20]]
+    known = {r.get("document_number") for r in results} - set(unknown)
+    new_results, new_count = get_documents_by_date(start, end, known_document_numbers=known)
+    assert new_count == len(new_results) == len(unknown)
+    assert [r.get("document_number") for r in new_results] == unknown
+
+
+def test_incomplete_days(daily_counts = {date(2024, 1, 2): 2, date(2024, 1, 3): 1, date(2024, 1, 4): 0, date(2024, 1, 5): 1}):
+    by_day = {date(2024, 1, 2): [{}, {}], date(2024, 1, 3): [], date(2024, 1, 4): [{}], date(2024, 1, 5): [{}]}
+    assert _incomplete_days(by_day, daily_counts) == [(date(2024, 1, 3), date(2024, 1, 4), 1)]
+    assert _incomplete_days({**by_day, date(2024, 1, 3): [{}], date(2024, 1, 4): []}, daily_counts) == []
+
+
+def test_iter_documents_by_number_failed_batch(numbers = ["2024-00001", "2024-00002"]):
+    
+    def handler(url, params):
+        batch = _requested_numbers(url)
+        if "2024-00002" in batch:
+            return 400, {"errors": ["bad request"]}
+        return 200, {"count": len(batch), "total_pages": 1, "results": [{"document_number": n} for n in batch]}
+    
+    for stream in (False, True):
+        documents = []
+        with pytest.raises(QueryError):
+            for document in iter_documents_by_number(numbers, fields=("document_number", ), batch_size=1, client=FakeClient(handler), stream=stream):
+                documents.append(document)
+        assert [d["document_number"] for d in documents] == ["2024-00001"]
+
+
+def _fake_api_by_day(documents: list[dict], dropped):
+    """Handler serving `documents` from the documents and facets endpoints, leaving out documents for which `dropped(doc, params)` is True."""
+    
+    def handler(url, params):
+        gte = params.get("conditions[publication_date][gte]")
+        lte = params.get("conditions[publication_date][lte]")
+        matches = [doc for doc in documents if gte <= doc["publication_date"] <= lte]
+        if "/facets/" in url:
+            counts = {}
+            for doc in matches:
+                counts[doc["publication_date"]] = counts.get(doc["publication_date"], 0) + 1
+            return 200, {day: {"count": count, "name": day} for day, count in counts.items()}
+        results = [doc for doc in matches if not dropped(doc, params)]
+        return 200, {"count": len(matches), "total_pages": 1, "results": results}
+    
+    return handler
+
+
+def test_backfill_gaps(
+        documents = [
+            {"document_number": "2024-00001", "publication_date": "2024-01-02"}, 
+            {"document_number": "2024-00002", "publication_date": "2024-01-03"}, 
+            {"document_number": "2024-00003", "publication_date": "2024-01-03"}, 
+            {"document_number": "2024-00004", "publication_date": "2024-01-05"}, 
+            ], 
+        params = {"per_page": 1000, "conditions[publication_date][gte]": "2024-01-02", "conditions[publication_date][lte]": "2024-01-05"}
+    ):
+    # a document of 2024-01-03 is missing only from the full query, so fetching that day again completes it
+    def dropped_once(doc, params):
+        return (doc["document_number"] == "2024-00003") and (params["conditions[publication_date][gte]"] == "2024-01-02")
+    
+    client = FakeClient(_fake_api_by_day(documents, dropped_once))
+    results, count = _query_documents_endpoint(ENDPOINT_URL, params, client=client)
+    assert count == len(documents)
+    assert [doc["document_number"] for doc in results] == [doc["document_number"] for doc in documents]
+    refetched = [p for url, p in client.requests if ("/facets/" not in url) and (p != params)]
+    assert [(p["conditions[publication_date][gte]"], p["conditions[publication_date][lte]"]) for p in refetched] == [("2024-01-03", "2024-01-03")]
+    
+    # a document of 2024-01-05 is always missing, so that day stays incomplete
+    def dropped_always(doc, params):
+        return dropped_once(doc, params) or (doc["document_number"] == "2024-00004")
+    
+    with pytest.raises(IncompleteResultsError) as err:
+        _query_documents_endpoint(ENDPOINT_URL, params, client=FakeClient(_fake_api_by_day(documents, dropped_always)))
+    assert err.value.count == 3
+    assert err.value.windows == [(date(2024, 1, 5), date(2024, 1, 5), 1, 0)]
+
+
+def test_backfill_gaps_without_dates(numbers = ["2024-00001", "2024-00002"]):
+    
+    def handler(url, params):
+        return 200, {"count": len(numbers), "total_pages": 1, "results": [{"document_number": numbers[0]}]}
+    
+    with pytest.raises(BatchQueryError) as err:
+        _get_documents_by_batch(len(numbers), numbers, client=FakeClient(handler))
+    failure, = err.value.failures.values()
+    assert isinstance(failure, IncompleteResultsError)
+    assert failure.windows == [(None, None, 2, 1)]
+
+
+def test_retrieve_results_by_window_checkpoints_complete_windows(
+        tmp_path, 
+        documents = [
+            {"document_number": "2024-00001", "publication_date": "2024-01-02"}, 
+            {"document_number": "2024-00002", "publication_date": "2024-01-09"}, 
+            {"document_number": "2024-00003", "publication_date": "2024-01-09"}, 
+            ], 
+        windows = [(date(2024, 1, 2), date(2024, 1, 5), 1), (date(2024, 1, 8), date(2024, 1, 12), 2)], 
+        params = {"per_page": 1000, "conditions[publication_date][gte]": "2024-01-02", "conditions[publication_date][lte]": "2024-01-12"}
+    ):
+    client = FakeClient(_fake_api_by_day(documents, lambda doc, params: doc["document_number"] == "2024-00003"))
+    checkpoint = WindowCheckpoint(tmp_path, params)
+    results = _retrieve_results_by_window(ENDPOINT_URL, params, windows, client=client, checkpoint=checkpoint)
+    assert len(results) == 2
+    assert checkpoint.completed(windows[0])
+    assert not checkpoint.completed(windows[1])  # came back short, so a restart fetches it again
+
+
+def test_retrieve_results_by_next_page_retries_failed_page(monkeypatch, pages: int = 4, failed_page: int = 3):
+    monkeypatch.setattr("fr_toolbelt.api_requests.retry.time.sleep", lambda seconds: None)
+    failures = [failed_page]
+    
+    def handler(url, params):
+        page = int(params.get("page", url.rsplit("page=", 1)[-1]))
+        if page in failures:
+            failures.remove(page)
+            return 503, {}
+        next_page_url = f"{ENDPOINT_URL}page={page + 1}" if page < pages else None
+        return 200, {"count": pages, "total_pages": pages, "next_page_url": next_page_url, "results": [{"document_number": f"2024-{page:05d}"}]}
+    
+    client = FakeClient(handler)
+    results = _retrieve_results_by_next_page(ENDPOINT_URL, {"per_page": 1, "page": 1}, client=client)
+    assert [r["document_number"] for r in results] == [f"2024-{page:05d}" for page in range(1, pages + 1)]
+    requested = [int(params.get("page", url.rsplit("page=", 1)[-1])) for url, params in client.requests]
+    assert requested == list(range(1, failed_page + 1)) + list(range(failed_page, pages + 1))  # only the failed page is requested again
+
+
+def test_get_documents_by_date_known_document_numbers_duplicates(start = "2024-01-02", end = "2024-01-05"):
+    enumerated = [
+        {"document_number": "2024-00001", "publication_date": "2024-01-02"}, 
+        {"document_number": "2024-00002", "publication_date": "2024-01-03"}, 
+        ]
+    
+    def handler(url, params):
+        if "/documents/" in url:  # the API returns the unknown document twice
+            results = [{"document_number": n, "citation": "89 FR 1", "title": "t"} for n in _requested_numbers(url)] * 2
+        else:
+            results = enumerated
+        return 200, {"count": len(results), "total_pages": 1, "results": results}
+    
+    results, _ = get_documents_by_date(start, end, client=FakeClient(handler), known_document_numbers={"2024-00001"}, handle_duplicates="drop")
+    assert [doc["document_number"] for doc in results] == ["2024-00002"]
+
+
+def test_split_likely_unfiltered_only(start = "2022-01-01", end = "2022-12-31"):
+    params = {"conditions[publication_date][gte]": start, "conditions[publication_date][lte]": end}
+    assert _split_likely(params)
+    assert not _split_likely({**params, "conditions[type][]": ["RULE"]})
+    assert not _split_likely({**params, "conditions[agencies][]": ["environmental-protection-agency"]})
+
+
+def test_get_documents_by_date_filtered_long_range(start = "2022-01-01", end = "2022-12-31"):
+    documents = [{"document_number": "2022-00001", "publication_date": "2022-01-03", "type": "Rule"}]
+    
+    def handler(url, params):
+        return 200, {"count": len(documents), "total_pages": 1, "results": documents}
+    
+    client = FakeClient(handler)
+    results, count = get_documents_by_date(start, end, document_types=["RULE"], client=client)
+    assert (results, count) == (documents, 1)
+    assert len(client.requests) == 1  # the first response is kept as page 1 instead of probing the count
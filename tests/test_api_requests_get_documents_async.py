@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from fr_toolbelt.api_requests import (
+    AsyncFederalRegisterClient, 
+    get_documents_by_date, 
+    get_documents_by_date_async, 
+    get_documents_by_number_async, 
+    )
+
+
+# api_requests.get_documents_async #
+
+
+def test_get_documents_by_date_async(start = "2024-01-01", end = "2024-01-31"):
+    results, count = asyncio.run(get_documents_by_date_async(start, end))
+    assert isinstance(results, list)
+    assert count == len(results)
+
+
+def test_get_documents_by_date_async_above_max_threshold(start = "2022-01-01", end = "2022-12-31", max = 10_000):
+    
+    async def fetch():
+        async with AsyncFederalRegisterClient(max_concurrency=8) as client:
+            return await get_documents_by_date_async(start, end, client=client)
+    
+    results, count = asyncio.run(fetch())
+    results_sync, count_sync = get_documents_by_date(start, end)
+    assert count > max
+    assert count == count_sync == len(results)
+    assert [r.get("document_number") for r in results] == [r.get("document_number") for r in results_sync]
+
+
+def test_get_documents_by_number_async(numbers = ["2024-02204", "2023-28203", "2023-25797"]):
+    results, count = asyncio.run(get_documents_by_number_async(numbers))
+    assert isinstance(results, list)
+    assert count == len(results) == len(numbers)
+
+
+def test_get_documents_by_number_async_splits_batch_after_414(numbers = ["2024-00001", "2024-00002", "2024-00003", "2024-00004", "2024-00005"]):
+    httpx = pytest.importorskip("httpx")
+    requested = []
+    
+    def handler(request):
+        batch = request.url.path.rsplit("/", 1)[-1].removesuffix(".json").split(",")
+        requested.append(batch)
+        if len(batch) > 2:
+            return httpx.Response(414)
+        return httpx.Response(200, json={"count": len(batch), "total_pages": 1, "results": [{"document_number": n} for n in batch]})
+    
+    async def fetch():
+        async with AsyncFederalRegisterClient() as client:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            return await get_documents_by_number_async(numbers, fields=("document_number", ), client=client)
+    
+    results, count = asyncio.run(fetch())
+    assert count == len(numbers)
+    assert [r["document_number"] for r in results] == numbers
+    assert requested[0] == numbers  # the rejected batch is requested once, then halved
+    assert sum(1 for batch in requested if len(batch) > 2) == 2
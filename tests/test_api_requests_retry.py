@@ -0,0 +1,147 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+import pytest
+import requests
+
+from fr_toolbelt.api_requests import CircuitBreaker, CircuitOpenError, RateLimiter, RetryError, sleep_retry
+from fr_toolbelt.api_requests.retry import HTTP414Error, backoff_delay, retry_after_seconds
+
+
+# TEST OBJECTS AND UTILS #
+
+
+def _http_error(status_code: int, headers: dict | None = None) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return requests.HTTPError(response=response)
+
+
+class Flaky:
+    """Callable that raises the given errors before succeeding."""
+    def __init__(self, errors: list[Exception]):
+        self.errors = list(errors)
+        self.calls = 0
+    
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+# api_requests.retry #
+
+
+def test_rate_limiter_pacing(rate: float = 20, n_requests: int = 10):
+    limiter = RateLimiter(rate, burst=1)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: limiter.acquire(), range(n_requests)))
+    assert time.monotonic() - start >= (n_requests - 1) / rate * 0.9
+
+
+def test_rate_limiter_async(rate: float = 20, n_requests: int = 10):
+    limiter = RateLimiter(rate, burst=1)
+    
+    async def acquire_all():
+        await asyncio.gather(*(limiter.acquire_async() for _ in range(n_requests)))
+    
+    start = time.monotonic()
+    asyncio.run(acquire_all())
+    assert time.monotonic() - start >= (n_requests - 1) / rate * 0.9
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds(_http_error(429, {"Retry-After": "7"})) == 7
+    assert retry_after_seconds(_http_error(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+    assert retry_after_seconds(_http_error(503)) is None
+
+
+def test_backoff_delay():
+    assert backoff_delay(0, 1, 60, jitter=False) == 1
+    assert backoff_delay(3, 1, 60, jitter=False) == 8
+    assert backoff_delay(10, 1, 60, jitter=False) == 60
+    assert 0 <= backoff_delay(3, 1, 60) <= 8
+
+
+def test_sleep_retry_recovers():
+    flaky = Flaky([_http_error(502), requests.ConnectionError()])
+    assert sleep_retry(timeout=0)(flaky)() == "ok"
+    assert flaky.calls == 3
+
+
+def test_sleep_retry_exhausted(retry: int = 2):
+    flaky = Flaky([_http_error(503)] * (retry + 1))
+    with pytest.raises(RetryError) as err:
+        sleep_retry(timeout=0, retry=retry)(flaky)()
+    assert err.value.attempts == retry + 1
+    assert isinstance(err.value.last_exception, requests.HTTPError)
+
+
+def test_sleep_retry_not_retryable():
+    flaky = Flaky([_http_error(404)])
+    with pytest.raises(requests.HTTPError):
+        sleep_retry(timeout=0)(flaky)()
+    assert flaky.calls == 1
+
+
+def test_sleep_retry_414_not_retried():
+    flaky = Flaky([HTTP414Error()])
+    with pytest.raises(HTTP414Error):
+        sleep_retry(timeout=0)(flaky)()
+    assert flaky.calls == 1
+
+
+def test_sleep_retry_async():
+    flaky = Flaky([_http_error(429, {"Retry-After": "0"})])
+    
+    @sleep_retry(timeout=0)
+    async def request():
+        return flaky()
+    
+    assert asyncio.run(request()) == "ok"
+    assert flaky.calls == 2
+
+
+def test_circuit_breaker_opens_and_probes(reset_timeout: float = 0.1):
+    breaker = CircuitBreaker(failure_rate=0.5, window=4, min_requests=4, reset_timeout=reset_timeout)
+    for status_code in (200, 503, 200, 503):
+        breaker.before_request()
+        breaker.record_status(status_code)
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    
+    # a single probe is allowed after the reset timeout; a failed probe opens the breaker again
+    time.sleep(reset_timeout)
+    breaker.before_request()
+    assert breaker.state == "half-open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    
+    # a successful probe closes the breaker
+    time.sleep(reset_timeout)
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_request()
+
+
+def test_circuit_breaker_not_retried():
+    breaker = CircuitBreaker(min_requests=1, reset_timeout=60)
+    breaker.record_failure()
+    function = Flaky([])
+    
+    @sleep_retry(timeout=0.01)
+    def request():
+        breaker.before_request()
+        return function()
+    
+    with pytest.raises(CircuitOpenError):
+        request()
+    assert function.calls == 0
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from fr_toolbelt.api_requests.shards import (
+    ShardError,
+    load_manifest,
+    merge_shards,
+    save_manifest,
+    shard_path,
+    )
+
+
+# TEST OBJECTS AND UTILS #
+
+
+TEST_MANIFEST = {
+    "query_id": "abc",
+    "endpoint_url": "https://www.federalregister.gov/api/v1/documents.json?",
+    "start_date": "2024-01-01",
+    "end_date": "2024-01-31",
+    "total_count": 4,
+    "shards": [
+        {"index": 0, "start_date": "2024-01-01", "end_date": "2024-01-15", "expected_count": 2, "params": {}},
+        {"index": 1, "start_date": "2024-01-16", "end_date": "2024-01-31", "expected_count": 2, "params": {}},
+        ],
+    }
+
+TEST_SHARDS = [
+    [{"document_number": "2024-00001", "citation": "89 FR 1"}, {"document_number": "2024-00002", "citation": "89 FR 2"}],
+    [{"document_number": "2024-00002", "citation": "89 FR 2"}, {"document_number": "2024-00003", "citation": "89 FR 3"}],
+    ]
+
+
+def _write_shards(output_dir, shards = TEST_SHARDS, query_id = "abc"):
+    for index, results in enumerate(shards):
+        with open(shard_path(output_dir, index), "w", encoding="utf-8") as f:
+            json.dump({"query_id": query_id, "index": index, "count": len(results), "results": results}, f)
+
+
+# api_requests.shards #
+
+
+def test_manifest_round_trip(tmp_path, manifest = TEST_MANIFEST):
+    save_manifest(manifest, tmp_path / "manifest.json")
+    assert load_manifest(tmp_path / "manifest.json") == manifest
+
+
+def test_merge_shards(tmp_path, manifest = TEST_MANIFEST):
+    _write_shards(tmp_path)
+    results, count = merge_shards(manifest, tmp_path)
+    assert count == len(results) == 3
+    assert [r["document_number"] for r in results] == ["2024-00001", "2024-00002", "2024-00003"]
+    results, count = merge_shards(manifest, tmp_path, handle_duplicates=False)
+    assert count == 4
+
+
+def test_merge_shards_missing(tmp_path, manifest = TEST_MANIFEST):
+    _write_shards(tmp_path, shards=TEST_SHARDS[:1])
+    with pytest.raises(ShardError):
+        merge_shards(manifest, tmp_path)
+
+
+def test_merge_shards_wrong_count(tmp_path, manifest = TEST_MANIFEST):
+    _write_shards(tmp_path, shards=[TEST_SHARDS[0], TEST_SHARDS[1][:1]])
+    with pytest.raises(ShardError):
+        merge_shards(manifest, tmp_path)
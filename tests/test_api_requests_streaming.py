@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from fr_toolbelt.api_requests.streaming import iter_page_results
+
+
+# TEST OBJECTS AND UTILS #
+
+
+TEST_PAGE = {
+    "count": 3, 
+    "description": "Documents published from 01/01/2024 to 01/31/2024", 
+    "total_pages": 2, 
+    "next_page_url": "https://www.federalregister.gov/api/v1/documents.json?page=2", 
+    "results": [
+        {"document_number": "2024-02204", "title": "Example \"quoted\" é ☃", "page_length": 12, "score": 1.5e-3}, 
+        {"document_number": "2023-28203", "title": "Example", "agencies": [{"id": 1, "slug": "a"}], "correction_of": None}, 
+        {"document_number": "2023-25797", "title": "", "docket_ids": [], "significant": True}, 
+        ], 
+    }
+TEST_BODY = json.dumps(TEST_PAGE, ensure_ascii=False).encode("utf-8")
+
+
+def _chunks(body: bytes, size: int) -> list[bytes]:
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+# api_requests.streaming #
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+def test_iter_page_results(size: int, body: bytes = TEST_BODY):
+    page = {}
+    documents = list(iter_page_results(_chunks(body, size), page))
+    assert documents == TEST_PAGE["results"]
+    assert page == {k: v for k, v in TEST_PAGE.items() if k != "results"}
+
+
+def test_iter_page_results_key_order(body: bytes = json.dumps({"results": [{"a": 1}], "count": 12345}).encode("utf-8")):
+    page = {}
+    assert list(iter_page_results(_chunks(body, 1), page)) == [{"a": 1}]
+    assert page == {"count": 12345}
+
+
+def test_iter_page_results_empty():
+    assert list(iter_page_results([b"{}"])) == []
+    assert list(iter_page_results([b'{"count": 0, "results": []}'])) == []
+
+
+def test_iter_page_results_truncated(body: bytes = TEST_BODY[:-20]):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_page_results(_chunks(body, 16)))
@@ -0,0 +1,113 @@
+from datetime import date
+
+import pytest
+
+from fr_toolbelt.api_requests import sync
+from fr_toolbelt.api_requests.sync import (
+    SyncState,
+    SyncStateError,
+    _contiguous_runs,
+    document_hash,
+    sync_documents,
+    )
+
+
+# TEST OBJECTS AND UTILS #
+
+
+TEST_DAYS = [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4), date(2024, 1, 8), date(2024, 1, 10), date(2024, 1, 11)]
+
+
+class FakeAPI:
+    """Documents kept in memory, standing in for the daily counts and documents returned by the API."""
+    def __init__(self, documents: list[dict]):
+        self.documents = documents
+        self.fetched = []
+    
+    def _in_range(self, start_date, end_date) -> list[dict]:
+        return [doc for doc in self.documents if f"{start_date}" <= doc["publication_date"] <= f"{end_date}"]
+    
+    def count_documents_by_period(self, start_date, end_date, **kwargs) -> dict[date, int]:
+        counts = {}
+        for doc in self._in_range(start_date, end_date):
+            day = date.fromisoformat(doc["publication_date"])
+            counts[day] = counts.get(day, 0) + 1
+        return counts
+    
+    def get_documents_by_date(self, start_date, end_date, **kwargs) -> tuple[list, int]:
+        self.fetched.append((start_date, end_date))
+        results = [dict(doc) for doc in self._in_range(start_date, end_date)]
+        return results, len(results)
+
+
+# api_requests.sync #
+
+
+def test_contiguous_runs(days = TEST_DAYS):
+    runs = _contiguous_runs(days)
+    assert runs == [
+        (date(2024, 1, 2), date(2024, 1, 4)),
+        (date(2024, 1, 8), date(2024, 1, 8)),
+        (date(2024, 1, 10), date(2024, 1, 11)),
+        ]
+    assert _contiguous_runs([]) == []
+
+
+def test_document_hash():
+    assert document_hash({"a": 1, "b": [1, 2]}) == document_hash({"b": [1, 2], "a": 1})
+    assert document_hash({"a": 1}) != document_hash({"a": 2})
+
+
+def test_sync_state_round_trip(tmp_path, query_id = "abc"):
+    path = tmp_path / "state.json"
+    state = SyncState.load(path, query_id)
+    assert state.watermark is None
+    state.watermark = date(2024, 1, 31)
+    state.daily_counts = {date(2024, 1, 2): 2, date(2024, 1, 30): 1}
+    state.hashes = {date(2024, 1, 2): {"2024-00001": "x", "2024-00002": "y"}, date(2024, 1, 30): {"2024-00003": "z"}}
+    state.save()
+    loaded = SyncState.load(path, query_id)
+    assert loaded.watermark == state.watermark
+    assert loaded.daily_counts == state.daily_counts
+    assert loaded.hashes == state.hashes
+
+    loaded.prune(date(2024, 1, 15))
+    assert list(loaded.daily_counts) == [date(2024, 1, 30)]
+    assert list(loaded.hashes) == [date(2024, 1, 30)]
+
+    with pytest.raises(SyncStateError):
+        SyncState.load(path, "other")
+
+
+def test_sync_documents(monkeypatch, tmp_path):
+    api = FakeAPI([
+        {"document_number": "2024-00001", "publication_date": "2024-01-02", "title": "a"},
+        {"document_number": "2024-00002", "publication_date": "2024-01-02", "title": "b"},
+        {"document_number": "2024-00003", "publication_date": "2024-01-05", "title": "c"},
+        {"document_number": "2024-00004", "publication_date": "2024-01-09", "title": "d"},
+        ])
+    monkeypatch.setattr(sync, "count_documents_by_period", api.count_documents_by_period)
+    monkeypatch.setattr(sync, "get_documents_by_date", api.get_documents_by_date)
+    state_path = tmp_path / "state.json"
+
+    # first sync fetches every day with documents
+    first = sync_documents(state_path, "2024-01-01", "2024-01-10", fields=("title", ))
+    assert first.added == ["2024-00001", "2024-00002", "2024-00003", "2024-00004"]
+    assert (first.changed, first.removed) == ([], [])
+    assert api.fetched == [(date(2024, 1, 2), date(2024, 1, 2)), (date(2024, 1, 5), date(2024, 1, 5)), (date(2024, 1, 9), date(2024, 1, 9))]
+
+    # later corrections: a document edited and one added on 2024-01-05, one withdrawn on 2024-01-09, one published after the watermark
+    api.documents[2]["title"] = "c (corrected)"
+    del api.documents[3]
+    api.documents.append({"document_number": "2024-00005", "publication_date": "2024-01-05", "title": "e"})
+    api.documents.append({"document_number": "2024-00006", "publication_date": "2024-01-12", "title": "f"})
+    api.fetched.clear()
+
+    # second sync fetches only the days whose counts changed or that are newer than the watermark
+    second = sync_documents(state_path, "2024-01-01", "2024-01-15", fields=("title", ))
+    assert second.fetched_days == [date(2024, 1, 5), date(2024, 1, 9), date(2024, 1, 12)]
+    assert api.fetched == [(date(2024, 1, 5), date(2024, 1, 5)), (date(2024, 1, 12), date(2024, 1, 12))]
+    assert second.added == ["2024-00005", "2024-00006"]
+    assert second.changed == ["2024-00003"]
+    assert second.removed == ["2024-00004"]
+    assert [doc["document_number"] for doc in second.documents] == ["2024-00005", "2024-00006", "2024-00003"]
@@ -0,0 +1,97 @@
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from fr_toolbelt.api_requests.windows import (
+    WindowPlanningError, 
+    merge_windows, 
+    plan_date_windows, 
+    plan_date_windows_async, 
+    plan_windows_from_counts, 
+    split_likely, 
+    )
+
+
+# TEST OBJECTS AND UTILS #
+
+
+def _daily_counts(start: date, end: date, per_day: int = 120) -> dict[date, int]:
+    days = (start + timedelta(days=n) for n in range((end - start).days + 1))
+    return {day: (per_day if day.isoweekday() < 6 else 0) for day in days}
+
+
+TEST_COUNTS = _daily_counts(date(2020, 1, 1), date(2021, 12, 31))
+
+
+def _count(start: date, end: date, counts: dict = TEST_COUNTS) -> int:
+    return sum(v for k, v in counts.items() if start <= k <= end)
+
+
+# api_requests.windows #
+
+
+def test_plan_date_windows_under_max(max_documents: int = 10_000):
+    windows = plan_date_windows("2020-01-01", "2021-12-31", _count, max_documents=max_documents)
+    assert all(count <= max_documents for _, _, count in windows)
+    assert sum(count for _, _, count in windows) == _count(date(2020, 1, 1), date(2021, 12, 31))
+    assert windows[0][0] == date(2020, 1, 1)
+    assert windows[-1][1] == date(2021, 12, 31)
+    assert all(a[1] + timedelta(days=1) == b[0] for a, b in zip(windows, windows[1:]))
+
+
+def test_plan_date_windows_no_split(max_documents: int = 10_000):
+    probes = []
+    windows = plan_date_windows("2020-02-01", "2020-03-31", lambda s, e: probes.append((s, e)) or _count(s, e), max_documents=max_documents)
+    assert len(windows) == 1
+    assert len(probes) == 1
+
+
+def test_plan_date_windows_known_count(start = date(2020, 1, 1), end = date(2020, 12, 31)):
+    probes = []
+    plan_date_windows(start, end, lambda s, e: probes.append((s, e)) or _count(s, e), count=_count(start, end))
+    assert (start, end) not in probes
+
+
+def test_plan_date_windows_dense_day():
+    with pytest.raises(WindowPlanningError):
+        plan_date_windows("2020-01-01", "2020-01-10", lambda s, e: 20_000 if s <= date(2020, 1, 6) <= e else 0)
+
+
+def test_plan_date_windows_async(max_documents: int = 10_000):
+    
+    async def count_async(start, end):
+        return _count(start, end)
+    
+    windows = asyncio.run(plan_date_windows_async("2020-01-01", "2021-12-31", count_async, max_documents=max_documents))
+    assert windows == plan_date_windows("2020-01-01", "2021-12-31", _count, max_documents=max_documents)
+
+
+def test_merge_windows():
+    windows = [
+        (date(2020, 1, 1), date(2020, 1, 31), 4000), 
+        (date(2020, 2, 1), date(2020, 2, 29), 4000), 
+        (date(2020, 3, 1), date(2020, 3, 31), 4000), 
+        ]
+    merged = merge_windows(windows, max_documents=10_000)
+    assert merged == [(date(2020, 1, 1), date(2020, 2, 29), 8000), (date(2020, 3, 1), date(2020, 3, 31), 4000)]
+
+
+def test_split_likely():
+    assert split_likely("2020-01-01", "2021-12-31")
+    assert split_likely("2022-01-01", "2022-12-31")
+    assert not split_likely("2020-01-01", "2020-03-31")
+    assert split_likely(date(2020, 1, 1), date(2020, 3, 31), days=90)
+
+
+def test_plan_windows_from_counts(start = date(2020, 1, 1), end = date(2021, 12, 31), max_documents: int = 10_000):
+    windows = plan_windows_from_counts(TEST_COUNTS, start, end, max_documents=max_documents)
+    assert all(count <= max_documents for _, _, count in windows)
+    assert sum(count for _, _, count in windows) == _count(start, end)
+    assert all(a[1] + timedelta(days=1) == b[0] for a, b in zip(windows, windows[1:]))
+    assert len(windows) <= len(plan_date_windows(start, end, _count, max_documents=max_documents))
+
+
+def test_plan_windows_from_counts_dense_day():
+    with pytest.raises(WindowPlanningError):
+        plan_windows_from_counts({date(2020, 1, 2): 10_001}, "2020-01-01", "2020-01-31")
@@ -3,6 +3,7 @@ from pathlib import Path
 
 from fr_toolbelt.preprocessing import ( 
     process_documents, 
+    required_fields, 
     )
 
 
@@ -40,3 +41,21 @@ def test_process_documents_which_list(documents = TEST_DATA, which=["dockets", "
     data = process_documents(documents, which=which)
     assert isinstance(data, list)
     assert len(data) == len(documents)
+
+
+def test_required_fields_which_str(which="agencies"):
+    fields = required_fields(which)
+    assert fields == ("document_number", "agencies", "agency_names")
+
+
+def test_required_fields_which_list(which=["dockets", "rin"], extra=("title", "docket_ids")):
+    fields = required_fields(which, fields=extra)
+    assert fields == ("document_number", "dockets", "docket_ids", "regulation_id_number_info", "title")
+
+
+def test_required_fields_process_documents(documents = TEST_DATA, which=["dockets", "presidents", "rin"]):
+    fields = required_fields(which)
+    projected = [{k: v for k, v in doc.items() if k in fields} for doc in documents]
+    data_projected = process_documents(projected, which=which)
+    data_full = process_documents(documents, which=which)
+    assert data_projected == [{k: full.get(k) for k in doc} for doc, full in zip(data_projected, data_full)]
@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from fr_toolbelt.preprocessing import (
+    JsonLinesSink, 
+    process_documents, 
+    process_documents_pipeline, 
+    )
+
+
+# TEST OBJECTS AND UTILS #
+
+
+TESTS_PATH = Path(__file__).parent
+
+with open(TESTS_PATH / "test_documents.json", "r", encoding="utf-8") as f:
+    TEST_DATA = json.load(f).get("results", [])
+
+
+# preprocessing.pipeline #
+
+
+def test_process_documents_pipeline(documents = TEST_DATA, which=["dockets", "presidents", "rin"]):
+    expected = process_documents([dict(doc) for doc in documents], which=which)
+    data, count = process_documents_pipeline(iter([dict(doc) for doc in documents]), which=which, batch_size=3, queue_size=1)
+    assert count == len(data) == len(documents)
+    assert data == expected
+
+
+def test_process_documents_pipeline_workers(documents = TEST_DATA, which="dockets"):
+    data, count = process_documents_pipeline(iter([dict(doc) for doc in documents]), which=which, batch_size=2, processor_workers=3)
+    assert count == len(documents)
+    assert [doc.get("document_number") for doc in data] == [doc.get("document_number") for doc in documents]
+
+
+def test_process_documents_pipeline_sink(tmp_path, documents = TEST_DATA, which="presidents"):
+    with JsonLinesSink(tmp_path / "documents.jsonl") as sink:
+        data, count = process_documents_pipeline(iter([dict(doc) for doc in documents]), which=which, sink=sink, batch_size=4)
+    assert data == []
+    with open(tmp_path / "documents.jsonl", "r", encoding="utf-8") as f:
+        assert sum(1 for _ in f) == count == len(documents)
+
+
+def test_process_documents_pipeline_error(documents = TEST_DATA, which="dockets"):
+    def failing_source():
+        yield from documents[:2]
+        raise RuntimeError("fetch failed")
+    
+    with pytest.raises(RuntimeError):
+        process_documents_pipeline(failing_source(), which=which, batch_size=1)
+
+
+def test_process_documents_pipeline_client(documents = TEST_DATA, which="agencies"):
+    class OfflineClient:
+        def __init__(self):
+            self.urls = []
+        
+        def get(self, url, params=None, **kwargs):
+            self.urls.append(url)
+            raise ConnectionError("offline")
+    
+    client = OfflineClient()
+    with pytest.raises(ConnectionError):
+        process_documents_pipeline(iter(documents), which=which, client=client)
+    assert client.urls == ["https://www.federalregister.gov/api/v1/agencies.json"]